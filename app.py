@@ -2,27 +2,87 @@
 import streamlit as st
 import pandas as pd
 from datetime import datetime
-import zipfile
 import io
 import os
-from korean_lunar_calendar import KoreanLunarCalendar
+import tempfile
 
 from saju_calculator import (
     calc_사주, calc_대운, calc_세운, calc_월운, calc_신살,
     calc_합충형파해, calc_천간합, calc_궁성, calc_육친, 
-    calc_납음오행, calc_격국, calc_공망_전체, calc_용신
-)
-from image_generator import (
-    create_원국표, create_대운표, create_세운표, create_월운표, 
-    create_오행차트, create_십성표, create_신살표,
-    create_12운성표, create_지장간표, create_합충형파해표,
-    create_궁성표, create_육친표, create_납음오행표,
-    create_격국표, create_공망표, create_용신표, create_일진표
+    calc_납음오행, calc_격국, calc_공망_전체, calc_용신,
+    음력_to_양력, 양력_to_음력, 음력_문자열, 유효한_음력
 )
+from image_generator import create_일진표_year, configure_render_cache, iter_images
+from batch_input import INPUT_EXTENSIONS, preview_rows
+from batch_pipeline import CHART_FILENAMES
+from batch_job import batch_job_id
+from batch_export import EXPORT_FORMATS
+from zip_sink import ZipSink
+from job_queue import ACTIVE_STATUSES, PRIORITY_BATCH, PRIORITY_INTERACTIVE, JobQueue, read_batch_errors
 
 # 12지 이미지 경로 설정
 ZODIAC_PATH = os.path.join(os.path.dirname(__file__), 'images', 'zodiac')
 
+# 렌더링 캐시 (재다운로드/재실행 시 같은 차트 재사용)
+RENDER_CACHE_DIR = os.environ.get('SAJU_RENDER_CACHE_DIR', '/tmp/saju_render_cache')
+configure_render_cache(RENDER_CACHE_DIR)
+
+# 렌더링 서버 (SAJU_RENDER_SERVER 설정 시 render_server.py 워커에서 렌더링, 없으면 이 프로세스에서)
+#   예) SAJU_RENDER_SERVER=unix:/tmp/saju_render.sock streamlit run app.py
+RENDER_SERVER = os.environ.get('SAJU_RENDER_SERVER')
+if RENDER_SERVER:
+    from render_server import RenderClient
+    차트_렌더링 = RenderClient(RENDER_SERVER).iter_images
+else:
+    차트_렌더링 = iter_images
+
+# 일괄 처리 탭 엑셀 미리보기 행 수
+EXCEL_PREVIEW_ROWS = 20
+
+# 일괄 처리 워커 프로세스 수 (기본: CPU 코어 수)
+BATCH_WORKERS = int(os.environ.get('SAJU_BATCH_WORKERS', 0)) or None
+
+# 일괄 작업 체크포인트 디렉터리 (중단된 작업을 같은 파일로 다시 실행하면 이어서 처리)
+BATCH_JOB_DIR = os.environ.get('SAJU_BATCH_JOB_DIR', os.path.join(tempfile.gettempdir(), 'saju_batch_jobs'))
+
+# 일괄 처리 결과 ZIP 하나당 최대 인원 / 크기(MB) (넘으면 다음 파일로, 찬 파일부터 다운로드)
+BATCH_SHARD_PEOPLE = int(os.environ.get('SAJU_BATCH_SHARD_PEOPLE', 500))
+BATCH_SHARD_MB = int(os.environ.get('SAJU_BATCH_SHARD_MB', 512))
+
+# 일괄 작업 큐: 서버 전체에서 동시에 실행하는 작업 수 / 진행률 갱신 간격 (초)
+# (워커는 낮은 우선순위(nice)로 실행 -> 개별 입력 탭의 1명 렌더링이 먼저)
+BATCH_CONCURRENCY = int(os.environ.get('SAJU_BATCH_CONCURRENCY', 1))
+BATCH_POLL_SECONDS = 2
+# 이 인원 이하 작업은 큐에서 먼저 실행 (몇 명짜리 작업이 큰 작업 뒤에서 오래 기다리지 않게)
+BATCH_SMALL_PEOPLE = int(os.environ.get('SAJU_BATCH_SMALL_PEOPLE', 50))
+BATCH_QUEUE = JobQueue(os.path.join(BATCH_JOB_DIR, 'queue.sqlite3'), BATCH_CONCURRENCY)
+
+# 화면 미리보기 배율 (다운로드는 원본 해상도)
+PREVIEW_SCALE = 0.5
+
+# 개별 이미지 표시 제목
+미리보기_제목 = {
+    '01_원국표': "📊 원국표",
+    '02_대운표': "📈 대운표",
+    '03_세운표': "📅 세운표",
+    '04_월운표': "🗓️ 월운표",
+    '05_오행분석': "🔥 오행 분석",
+    '06_십성표': "⭐ 십성표",
+    '07_신살표': "🔮 신살표",
+    '08_12운성표': "🔄 12운성표",
+    '09_지장간표': "📋 지장간표",
+    '10_합충형파해표': "⚡ 합충형파해표",
+    '11_궁성표': "🏠 궁성표",
+    '12_육친표': "👨‍👩‍👧‍👦 육친표",
+    '13_납음오행표': "🎵 납음오행표",
+    '14_격국표': "🎯 격국표",
+    '15_공망표': "🕳️ 공망표",
+    '16_용신표': "🎯 용신표",
+}
+
+# 차트 이름 -> 다운로드 파일명
+차트_파일명 = CHART_FILENAMES
+
 # ============================================
 # GPT용 텍스트 포맷 생성 함수
 # ============================================
@@ -315,25 +375,119 @@ def generate_gpt_text(사주, 기본정보, gender, 대운_data, 세운_data, 
     return text
 
 # ============================================
-# 음력 → 양력 변환 함수
+# 일괄 작업 상태 (작업 큐 폴링)
 # ============================================
-def 음력_to_양력(year, month, day, 윤달=False):
-    """음력 날짜를 양력으로 변환 (윤달 지원)"""
-    calendar = KoreanLunarCalendar()
-    calendar.setLunarDate(year, month, day, 윤달)
-    return calendar.solarYear, calendar.solarMonth, calendar.solarDay
-
-def 양력_to_음력(year, month, day):
-    """양력 날짜를 음력으로 변환 (윤달 여부 포함)"""
-    calendar = KoreanLunarCalendar()
-    calendar.setSolarDate(year, month, day)
-    윤달여부 = calendar.isIntercalation
-    return calendar.lunarYear, calendar.lunarMonth, calendar.lunarDay, 윤달여부
-
-def 음력_문자열(year, month, day, 윤달=False):
-    """음력 날짜를 문자열로 변환 (윤달 표시 포함)"""
-    윤_표시 = "윤" if 윤달 else ""
-    return f"{year}-{윤_표시}{month:02d}-{day:02d}"
+def save_batch_input(uploaded_file, 작업_id):
+    """업로드한 입력 파일을 작업 디렉터리에 저장 (워커 프로세스가 읽음) -> (작업 디렉터리, 입력 경로)"""
+    작업_디렉터리 = os.path.join(BATCH_JOB_DIR, 작업_id)
+    입력_경로 = os.path.join(작업_디렉터리, 'input' + os.path.splitext(uploaded_file.name)[1].lower())
+    os.makedirs(작업_디렉터리, exist_ok=True)
+    if not os.path.exists(입력_경로):
+        with open(입력_경로, 'wb') as f:
+            f.write(uploaded_file.getvalue())
+    return 작업_디렉터리, 입력_경로
+
+
+def show_batch_job(작업_id):
+    """작업 큐의 일괄 작업 진행률 + 완성된 파일 다운로드 표시 (이미지 ZIP 또는 계산 데이터)"""
+    작업 = BATCH_QUEUE.get(작업_id)
+    if 작업 is None:
+        return
+    실행_중 = 작업.status in ACTIVE_STATUSES
+    # 이미지 작업은 체크포인트에서 이어서 실행, 계산 데이터 내보내기는 처음부터 다시
+    이어서_안내 = " - 다시 생성하면 이어서 처리합니다" if 작업.kind == 'batch' else ""
+    
+    # 진행률은 실행 중일 때만 BATCH_POLL_SECONDS마다 이 부분만 다시 그림 (DB 한 줄 읽기)
+    @st.fragment(run_every=BATCH_POLL_SECONDS if 실행_중 else None)
+    def 진행_상태():
+        작업 = BATCH_QUEUE.get(작업_id)
+        if 작업.status in ACTIVE_STATUSES:
+            # 워커가 없거나 죽었으면 다시 띄움 (서버 재시작 등)
+            BATCH_QUEUE.ensure_workers()
+        
+        if 작업.status == 'queued':
+            st.info(f"⏳ 대기 중 ({BATCH_QUEUE.position(작업_id)}번째, 앞 작업이 끝나면 시작)")
+        elif 작업.status in ('running', 'cancelling'):
+            st.progress(min(작업.done / 작업.total, 1.0) if 작업.total else 0.0,
+                        text=작업.message or "준비 중...")
+        elif 작업.status == 'done' and 작업.kind == 'batch':
+            st.success(f"✅ 완료! ({작업.message}, 이전 실행 {작업.result.get('reused', 0)}명 재사용)")
+        elif 작업.status == 'done':
+            st.success(f"✅ 완료! ({작업.message})")
+        elif 작업.status == 'cancelled':
+            st.warning(f"⏹️ 취소됨 ({작업.message}){이어서_안내}")
+        else:
+            st.error(f"작업 실패: {작업.error}{이어서_안내}")
+        
+        완성된_파일 = 작업.result.get('shards', [])
+        if 완성된_파일 and 작업.status in ACTIVE_STATUSES:
+            st.caption(f"완성된 ZIP {len(완성된_파일)}개 - 아래에서 바로 다운로드할 수 있습니다")
+        if 작업.status in ('running', 'queued'):
+            if st.button("⏹️ 작업 취소", key=f"cancel_{작업_id}"):
+                BATCH_QUEUE.cancel(작업_id)
+        
+        if 실행_중 and 작업.status not in ACTIVE_STATUSES:
+            # 끝났으면 전체를 다시 그려서 폴링 중지 + 다운로드/오류 목록 갱신
+            st.rerun()
+    
+    진행_상태()
+    
+    if 작업.kind == 'export':
+        # 계산 데이터는 다 쓴 파일 하나 (끝난 뒤에만)
+        내보낸_파일 = 작업.result.get('output')
+        if 내보낸_파일 and os.path.exists(내보낸_파일):
+            형식 = 작업.result['export_format']
+            with open(내보낸_파일, 'rb') as f:
+                st.download_button(
+                    label=f"📥 계산 데이터 다운로드 ({형식.upper()})",
+                    data=f,
+                    file_name=os.path.basename(내보낸_파일),
+                    mime="text/csv" if 형식 == 'csv' else "application/octet-stream",
+                    on_click="ignore",
+                    key=f"export_{작업_id}",
+                    use_container_width=True
+                )
+    
+    # 다운로드는 고른 ZIP 하나만 읽음 (폴링할 때마다 ZIP을 다시 읽지 않도록 진행률과 분리)
+    @st.fragment
+    def 다운로드():
+        완성된_파일 = [shard for shard in BATCH_QUEUE.get(작업_id).result.get('shards', [])
+                   if os.path.exists(shard['path'])]
+        if 실행_중:
+            st.button("🔄 새로 완성된 ZIP 확인", key=f"refresh_{작업_id}")
+        if not 완성된_파일:
+            return
+        선택 = st.selectbox(
+            "완성된 ZIP", 완성된_파일, key=f"shard_{작업_id}",
+            format_func=lambda shard: (f"{shard['index']}번 ({shard['people']}명, "
+                                       f"{shard['size'] / 1024 / 1024:.1f}MB)"))
+        with open(선택['path'], 'rb') as f:
+            st.download_button(
+                label=f"📥 {선택['index']}번 ZIP 다운로드",
+                data=f,
+                file_name=os.path.basename(선택['path']),
+                mime="application/zip",
+                # 다운로드해도 다시 실행하지 않음
+                on_click="ignore",
+                use_container_width=True
+            )
+    
+    if 작업.kind == 'batch':
+        다운로드()
+    
+    if not 실행_중:
+        건너뛴_행, 생성_오류 = read_batch_errors(작업.job_dir)
+        if 작업.result.get('dedup'):
+            st.caption(f"중복 제거: {작업.result['dedup']}")
+        if 건너뛴_행:
+            제목 = "입력 오류로 건너뛴 행" if 작업.kind == 'batch' else "제외된 행"
+            with st.expander(f"⚠️ {제목} {len(건너뛴_행)}개"):
+                st.dataframe(pd.DataFrame(건너뛴_행, columns=['행', '이름', '오류']),
+                             use_container_width=True)
+        if 생성_오류:
+            with st.expander(f"⚠️ 생성 실패한 차트 {len(생성_오류)}개"):
+                st.dataframe(pd.DataFrame(생성_오류, columns=['행', '이름', '차트', '오류']),
+                             use_container_width=True)
 
 # ============================================
 # 페이지 설정
@@ -466,6 +620,7 @@ with tab1:
         st.session_state.input_음양력 = "양력"
         st.session_state.input_윤달 = False
         st.session_state.생성된_이미지 = {}
+        st.session_state.pop('차트_요청', None)
         if 'gpt_text' in st.session_state:
             del st.session_state.gpt_text
         st.rerun()
@@ -474,6 +629,8 @@ with tab1:
     if GPT_버튼:
         if not 이름:
             st.error("이름을 입력해주세요.")
+        elif 음양력 == "음력" and not 유효한_음력(생년월일.year, 생년월일.month, 생년월일.day, 윤달):
+            st.error(f"없는 음력 날짜입니다: {음력_문자열(생년월일.year, 생년월일.month, 생년월일.day, 윤달)}")
         else:
             with st.spinner("GPT용 텍스트 생성 중..."):
                 # 입력 날짜
@@ -536,11 +693,14 @@ with tab1:
             use_container_width=True
         )
     
+    미리보기_생성 = False
     if 생성_버튼:
         if not 이름:
             st.error("이름을 입력해주세요.")
+        elif 음양력 == "음력" and not 유효한_음력(생년월일.year, 생년월일.month, 생년월일.day, 윤달):
+            st.error(f"없는 음력 날짜입니다: {음력_문자열(생년월일.year, 생년월일.month, 생년월일.day, 윤달)}")
         else:
-            with st.spinner("이미지 생성 중..."):
+            with st.spinner("사주 계산 중..."):
                 # 입력 날짜
                 input_year = 생년월일.year
                 input_month = 생년월일.month
@@ -576,182 +736,141 @@ with tab1:
                 gender = '남' if 성별 == '남성' else '여'
                 신살_data = calc_신살(사주, gender)
                 
-                # 생성된 이미지 경로 저장 (session_state에 저장)
-                생성된_이미지 = {}
+                # 렌더링 작업 (image_generator.CHART_TASKS 형식, 'charts'는 생성할 차트 목록)
+                차트_요청 = {
+                    '사주_data': 사주,
+                    '기본정보': 기본정보,
+                    '신살_data': 신살_data,
+                    'gender': gender,
+                    'zodiac_path': ZODIAC_PATH,
+                    'charts': [],
+                }
                 
                 # 체크된 이미지만 생성
                 if 원국표_체크:
-                    path = f"/tmp/{이름}_원국표.png"
-                    create_원국표(사주, 기본정보, path, 신살_data, ZODIAC_PATH)
-                    생성된_이미지['01_원국표'] = path
+                    차트_요청['charts'].append('원국표')
                 
                 if 대운표_체크:
                     대운_data = calc_대운(year, month, day, 시, 분, gender)
-                    path = f"/tmp/{이름}_대운표.png"
-                    create_대운표(대운_data, 기본정보, path)
-                    생성된_이미지['02_대운표'] = path
+                    차트_요청['대운_data'] = 대운_data
+                    차트_요청['charts'].append('대운표')
                 
                 if 세운표_체크:
                     세운_data = calc_세운(year, month, day, 시, 분)
-                    path = f"/tmp/{이름}_세운표.png"
-                    create_세운표(세운_data, 기본정보, path)
-                    생성된_이미지['03_세운표'] = path
+                    차트_요청['세운_data'] = 세운_data
+                    차트_요청['charts'].append('세운표')
                 
                 if 월운표_체크:
                     월운_data = calc_월운(year, month, day, 시, 분)
-                    path = f"/tmp/{이름}_월운표.png"
-                    create_월운표(월운_data, 기본정보, path)
-                    생성된_이미지['04_월운표'] = path
+                    차트_요청['월운_data'] = 월운_data
+                    차트_요청['charts'].append('월운표')
                 
                 if 오행차트_체크:
-                    path = f"/tmp/{이름}_오행분석.png"
-                    create_오행차트(사주, 기본정보, path)
-                    생성된_이미지['05_오행분석'] = path
+                    차트_요청['charts'].append('오행차트')
                 
                 if 십성표_체크:
-                    path = f"/tmp/{이름}_십성표.png"
-                    create_십성표(사주, 기본정보, path)
-                    생성된_이미지['06_십성표'] = path
+                    차트_요청['charts'].append('십성표')
                 
                 if 신살표_체크:
-                    path = f"/tmp/{이름}_신살표.png"
-                    create_신살표(신살_data, 기본정보, path)
-                    생성된_이미지['07_신살표'] = path
+                    차트_요청['charts'].append('신살표')
                 
                 if 운성표_체크:
-                    path = f"/tmp/{이름}_12운성표.png"
-                    create_12운성표(사주, 기본정보, path)
-                    생성된_이미지['08_12운성표'] = path
+                    차트_요청['charts'].append('12운성표')
                 
                 if 지장간표_체크:
-                    path = f"/tmp/{이름}_지장간표.png"
-                    create_지장간표(사주, 기본정보, path)
-                    생성된_이미지['09_지장간표'] = path
+                    차트_요청['charts'].append('지장간표')
                 
                 if 합충형파해표_체크:
-                    path = f"/tmp/{이름}_합충형파해표.png"
-                    create_합충형파해표(사주, 기본정보, path)
-                    생성된_이미지['10_합충형파해표'] = path
+                    차트_요청['charts'].append('합충형파해표')
                 
                 if 궁성표_체크:
-                    path = f"/tmp/{이름}_궁성표.png"
-                    create_궁성표(사주, 기본정보, path)
-                    생성된_이미지['11_궁성표'] = path
+                    차트_요청['charts'].append('궁성표')
                 
                 if 육친표_체크:
-                    path = f"/tmp/{이름}_육친표.png"
-                    create_육친표(사주, 기본정보, gender, path)
-                    생성된_이미지['12_육친표'] = path
+                    차트_요청['charts'].append('육친표')
                 
                 if 납음오행표_체크:
-                    path = f"/tmp/{이름}_납음오행표.png"
-                    create_납음오행표(사주, 기본정보, path)
-                    생성된_이미지['13_납음오행표'] = path
+                    차트_요청['charts'].append('납음오행표')
                 
                 if 격국표_체크:
-                    path = f"/tmp/{이름}_격국표.png"
-                    create_격국표(사주, 기본정보, path)
-                    생성된_이미지['14_격국표'] = path
+                    차트_요청['charts'].append('격국표')
                 
                 if 공망표_체크:
-                    path = f"/tmp/{이름}_공망표.png"
-                    create_공망표(사주, 기본정보, path)
-                    생성된_이미지['15_공망표'] = path
+                    차트_요청['charts'].append('공망표')
                 
                 if 용신표_체크:
-                    path = f"/tmp/{이름}_용신표.png"
-                    create_용신표(사주, 기본정보, path)
-                    생성된_이미지['16_용신표'] = path
-                
-                st.success(f"✅ 이미지 생성 완료! ({len(생성된_이미지)}개)")
-                
-                # ============================================
-                # 전체 다운로드 버튼 (상단)
-                # ============================================
-                if len(생성된_이미지) > 0:
-                    zip_buffer = io.BytesIO()
-                    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zf:
-                        for 파일명, 경로 in 생성된_이미지.items():
-                            zf.write(경로, f"{파일명}.png")
-                    
-                    zip_buffer.seek(0)
-                    st.download_button(
-                        label=f"📦 전체 다운로드 ({len(생성된_이미지)}개 ZIP)",
-                        data=zip_buffer,
-                        file_name=f"{이름}_사주분석.zip",
-                        mime="application/zip",
-                        use_container_width=True,
-                        key="download_전체_zip"
-                    )
-                
-                st.divider()
-                
-                # ============================================
-                # 개별 이미지 표시
-                # ============================================
-                if '01_원국표' in 생성된_이미지:
-                    st.subheader("📊 원국표")
-                    st.image(생성된_이미지['01_원국표'], caption=f"{이름}님 원국표")
-                
-                if '02_대운표' in 생성된_이미지:
-                    st.subheader("📈 대운표")
-                    st.image(생성된_이미지['02_대운표'], caption=f"{이름}님 대운표")
-                
-                if '03_세운표' in 생성된_이미지:
-                    st.subheader("📅 세운표")
-                    st.image(생성된_이미지['03_세운표'], caption=f"{이름}님 세운표")
-                
-                if '04_월운표' in 생성된_이미지:
-                    st.subheader("🗓️ 월운표")
-                    st.image(생성된_이미지['04_월운표'], caption=f"{이름}님 월운표")
+                    차트_요청['charts'].append('용신표')
                 
-                if '05_오행분석' in 생성된_이미지:
-                    st.subheader("🔥 오행 분석")
-                    st.image(생성된_이미지['05_오행분석'], caption=f"{이름}님 오행분석")
-                
-                if '06_십성표' in 생성된_이미지:
-                    st.subheader("⭐ 십성표")
-                    st.image(생성된_이미지['06_십성표'], caption=f"{이름}님 십성표")
-                
-                if '07_신살표' in 생성된_이미지:
-                    st.subheader("🔮 신살표")
-                    st.image(생성된_이미지['07_신살표'], caption=f"{이름}님 신살표")
-                
-                if '08_12운성표' in 생성된_이미지:
-                    st.subheader("🔄 12운성표")
-                    st.image(생성된_이미지['08_12운성표'], caption=f"{이름}님 12운성표")
-                
-                if '09_지장간표' in 생성된_이미지:
-                    st.subheader("📋 지장간표")
-                    st.image(생성된_이미지['09_지장간표'], caption=f"{이름}님 지장간표")
-                
-                if '10_합충형파해표' in 생성된_이미지:
-                    st.subheader("⚡ 합충형파해표")
-                    st.image(생성된_이미지['10_합충형파해표'], caption=f"{이름}님 합충형파해표")
-                
-                if '11_궁성표' in 생성된_이미지:
-                    st.subheader("🏠 궁성표")
-                    st.image(생성된_이미지['11_궁성표'], caption=f"{이름}님 궁성표")
-                
-                if '12_육친표' in 생성된_이미지:
-                    st.subheader("👨‍👩‍👧‍👦 육친표")
-                    st.image(생성된_이미지['12_육친표'], caption=f"{이름}님 육친표")
-                
-                if '13_납음오행표' in 생성된_이미지:
-                    st.subheader("🎵 납음오행표")
-                    st.image(생성된_이미지['13_납음오행표'], caption=f"{이름}님 납음오행표")
-                
-                if '14_격국표' in 생성된_이미지:
-                    st.subheader("🎯 격국표")
-                    st.image(생성된_이미지['14_격국표'], caption=f"{이름}님 격국표")
-                
-                if '15_공망표' in 생성된_이미지:
-                    st.subheader("🕳️ 공망표")
-                    st.image(생성된_이미지['15_공망표'], caption=f"{이름}님 공망표")
-                
-                if '16_용신표' in 생성된_이미지:
-                    st.subheader("🎯 용신표")
-                    st.image(생성된_이미지['16_용신표'], caption=f"{이름}님 용신표")
+                # session_state에 저장 (다운로드 버튼 클릭으로 재실행돼도 유지)
+                st.session_state.생성된_이미지 = {}
+                st.session_state.차트_요청 = 차트_요청
+                st.session_state.생성_이름 = 이름
+                st.session_state.pop('원본_zip', None)
+                미리보기_생성 = True
+    
+    if st.session_state.get('차트_요청'):
+        차트_요청 = st.session_state.차트_요청
+        생성된_이미지 = st.session_state.생성된_이미지
+        생성_이름 = st.session_state.생성_이름
+        
+        # 다운로드 버튼 자리 (미리보기가 모두 생성된 뒤 채움)
+        다운로드_영역 = st.container()
+        
+        st.divider()
+        
+        # ============================================
+        # 개별 이미지 표시 (미리보기)
+        # ============================================
+        # 차트별 자리를 먼저 만들고, 생성 중에는 완성되는 순서대로 채움
+        선택된_파일명 = {차트_파일명[name] for name in 차트_요청['charts']}
+        이미지_자리 = {}
+        for 파일명, 제목 in 미리보기_제목.items():
+            if 파일명 in 선택된_파일명:
+                st.subheader(제목)
+                이미지_자리[파일명] = st.empty()
+                if 파일명 in 생성된_이미지:
+                    이미지_자리[파일명].image(생성된_이미지[파일명], caption=f"{생성_이름}님 {파일명[3:]}")
+        
+        if 미리보기_생성:
+            # 화면에는 미리보기 배율로만 생성 (원본 해상도는 다운로드할 때 생성)
+            전체 = len(차트_요청['charts'])
+            진행 = 다운로드_영역.progress(0.0, text=f"이미지 생성 중... (0/{전체})")
+            for 완료, (name, data) in enumerate(차트_렌더링(dict(차트_요청, scale=PREVIEW_SCALE)), 1):
+                파일명 = 차트_파일명[name]
+                if isinstance(data, str):
+                    이미지_자리[파일명].error(f"{파일명[3:]} 생성 실패: {data}")
+                else:
+                    생성된_이미지[파일명] = data
+                    이미지_자리[파일명].image(data, caption=f"{생성_이름}님 {파일명[3:]}")
+                진행.progress(완료 / 전체, text=f"이미지 생성 중... ({완료}/{전체})")
+            진행.empty()
+            st.session_state.생성된_이미지 = 생성된_이미지
+            다운로드_영역.success(f"✅ 이미지 생성 완료! ({len(생성된_이미지)}개)")
+        
+        # ============================================
+        # 전체 다운로드 버튼 (상단, 원본 해상도)
+        # ============================================
+        with 다운로드_영역:
+            if '원본_zip' not in st.session_state:
+                if st.button(f"📦 전체 다운로드 준비 ({len(생성된_이미지)}개, 원본 해상도)",
+                             use_container_width=True, key="prepare_전체_zip"):
+                    with st.spinner("원본 해상도 이미지 생성 중..."):
+                        원본 = {차트_파일명[name]: data for name, data in 차트_렌더링(차트_요청)
+                              if isinstance(data, bytes)}
+                        with ZipSink() as sink:
+                            for 파일명 in sorted(원본):
+                                sink.write(f"{파일명}.png", 원본[파일명])
+                        st.session_state.원본_zip = sink.getvalue()
+            
+            if '원본_zip' in st.session_state:
+                st.download_button(
+                    label=f"📦 전체 다운로드 ({len(생성된_이미지)}개 ZIP)",
+                    data=st.session_state.원본_zip,
+                    file_name=f"{생성_이름}_사주분석.zip",
+                    mime="application/zip",
+                    use_container_width=True,
+                    key="download_전체_zip"
+                )
 
 # ============================================
 # 탭2: 엑셀 일괄 처리
@@ -769,7 +888,7 @@ with tab2:
         '시': [14, 8],
         '분': [30, 0],
         '음양력': ['양력', '음력'],
-        '윤달': ['', 'O'],  # 음력일 때만 O 표시
+        '윤달': ['', ''],  # 음력 윤달 생일일 때만 O 표시
     }
     sample_df = pd.DataFrame(sample_data)
     
@@ -788,158 +907,72 @@ with tab2:
     
     st.divider()
     
-    uploaded_file = st.file_uploader("엑셀 파일 선택", type=['xlsx', 'xls'])
+    uploaded_file = st.file_uploader("입력 파일 선택 (엑셀/CSV/JSONL/Parquet)", type=list(INPUT_EXTENSIONS))
     
+    # 전체를 읽지 않고 처음 몇 행만 미리보기 (실제 처리는 읽는 대로 한 행씩)
+    엑셀_헤더 = None
     if uploaded_file:
-        df = pd.read_excel(uploaded_file)
-        
-        # 윤달 컬럼이 없으면 추가
-        if '윤달' not in df.columns:
-            df['윤달'] = ''
+        try:
+            엑셀_헤더, 미리보기_행, 예상_인원 = preview_rows(uploaded_file, EXCEL_PREVIEW_ROWS)
+        except ValueError as e:
+            st.error(f"입력 형식 오류: {e}")
+    
+    if 엑셀_헤더 is not None:
+        st.write(f"**약 {예상_인원}명 데이터 확인 (처음 {len(미리보기_행)}행 미리보기):**")
+        st.dataframe(pd.DataFrame(미리보기_행, columns=엑셀_헤더), use_container_width=True)
         
-        st.write(f"**{len(df)}명 데이터 확인:**")
-        st.dataframe(df, use_container_width=True)
+        # 작은 작업은 큐에서 먼저 (큰 작업 뒤에서 오래 기다리지 않게)
+        우선순위 = PRIORITY_INTERACTIVE if 예상_인원 <= BATCH_SMALL_PEOPLE else PRIORITY_BATCH
         
         if st.button("🎯 일괄 생성", type="primary", use_container_width=True):
-            progress = st.progress(0)
-            status = st.empty()
+            선택_차트 = [name for name, 체크 in (
+                ('원국표', 원국표_체크), ('대운표', 대운표_체크), ('세운표', 세운표_체크),
+                ('월운표', 월운표_체크), ('오행차트', 오행차트_체크), ('십성표', 십성표_체크),
+                ('신살표', 신살표_체크), ('12운성표', 운성표_체크), ('지장간표', 지장간표_체크),
+                ('합충형파해표', 합충형파해표_체크), ('궁성표', 궁성표_체크), ('육친표', 육친표_체크),
+                ('납음오행표', 납음오행표_체크), ('격국표', 격국표_체크), ('공망표', 공망표_체크),
+                ('용신표', 용신표_체크),
+            ) if 체크]
             
-            zip_buffer = io.BytesIO()
+            # 작업 큐에 넣고 바로 돌아옴 (처리는 워커 프로세스에서, 다시 실행/탭 이동해도 계속됨)
+            # 같은 파일 + 같은 차트 선택이면 같은 작업 -> 이전 실행에서 완료한 행은 건너뜀
+            작업_id = batch_job_id(uploaded_file.getvalue(), 선택_차트)
+            작업_디렉터리, 입력_경로 = save_batch_input(uploaded_file, 작업_id)
             
-            with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zf:
-                for idx, row in df.iterrows():
-                    status.text(f"처리 중: {row['이름']} ({idx+1}/{len(df)})")
-                    
-                    input_year = int(row['생년'])
-                    input_month = int(row['생월'])
-                    input_day = int(row['생일'])
-                    
-                    # 윤달 여부 확인 (O, o, ○, 1, True 등)
-                    윤달_값 = str(row.get('윤달', '')).strip().upper()
-                    윤달 = 윤달_값 in ['O', '○', '1', 'TRUE', 'Y', 'YES', '윤달']
-                    
-                    if row['음양력'] == "음력":
-                        year, month, day = 음력_to_양력(input_year, input_month, input_day, 윤달)
-                        음력_str = 음력_문자열(input_year, input_month, input_day, 윤달)
-                        양력_str = f"{year}-{month:02d}-{day:02d} {int(row['시']):02d}:{int(row['분']):02d}"
-                    else:
-                        year, month, day = input_year, input_month, input_day
-                        양력_str = f"{year}-{month:02d}-{day:02d} {int(row['시']):02d}:{int(row['분']):02d}"
-                        음력_year, 음력_month, 음력_day, 음력_윤달 = 양력_to_음력(year, month, day)
-                        음력_str = 음력_문자열(음력_year, 음력_month, 음력_day, 음력_윤달)
-                    
-                    사주 = calc_사주(year, month, day, int(row['시']), int(row['분']))
-                    나이 = datetime.now().year - year + 1
-                    
-                    기본정보 = {
-                        '이름': row['이름'],
-                        '성별': row['성별'],
-                        '나이': 나이,
-                        '양력': 양력_str,
-                        '음력': 음력_str,
-                    }
-                    
-                    gender = '남' if row['성별'] == '남성' else '여'
-                    신살_data = calc_신살(사주, gender)
-                    
-                    folder_name = f"{row['이름']}_{row['생년']}-{row['생월']:02d}-{row['생일']:02d}"
-                    
-                    # 체크된 이미지만 생성
-                    if 원국표_체크:
-                        path = f"/tmp/{row['이름']}_원국표.png"
-                        create_원국표(사주, 기본정보, path, 신살_data, ZODIAC_PATH)
-                        zf.write(path, f"{folder_name}/01_원국표.png")
-                    
-                    if 대운표_체크:
-                        대운_data = calc_대운(year, month, day, int(row['시']), int(row['분']), gender)
-                        path = f"/tmp/{row['이름']}_대운표.png"
-                        create_대운표(대운_data, 기본정보, path)
-                        zf.write(path, f"{folder_name}/02_대운표.png")
-                    
-                    if 세운표_체크:
-                        세운_data = calc_세운(year, month, day, int(row['시']), int(row['분']))
-                        path = f"/tmp/{row['이름']}_세운표.png"
-                        create_세운표(세운_data, 기본정보, path)
-                        zf.write(path, f"{folder_name}/03_세운표.png")
-                    
-                    if 월운표_체크:
-                        월운_data = calc_월운(year, month, day, int(row['시']), int(row['분']))
-                        path = f"/tmp/{row['이름']}_월운표.png"
-                        create_월운표(월운_data, 기본정보, path)
-                        zf.write(path, f"{folder_name}/04_월운표.png")
-                    
-                    if 오행차트_체크:
-                        path = f"/tmp/{row['이름']}_오행분석.png"
-                        create_오행차트(사주, 기본정보, path)
-                        zf.write(path, f"{folder_name}/05_오행분석.png")
-                    
-                    if 십성표_체크:
-                        path = f"/tmp/{row['이름']}_십성표.png"
-                        create_십성표(사주, 기본정보, path)
-                        zf.write(path, f"{folder_name}/06_십성표.png")
-                    
-                    if 신살표_체크:
-                        path = f"/tmp/{row['이름']}_신살표.png"
-                        create_신살표(신살_data, 기본정보, path)
-                        zf.write(path, f"{folder_name}/07_신살표.png")
-                    
-                    if 운성표_체크:
-                        path = f"/tmp/{row['이름']}_12운성표.png"
-                        create_12운성표(사주, 기본정보, path)
-                        zf.write(path, f"{folder_name}/08_12운성표.png")
-                    
-                    if 지장간표_체크:
-                        path = f"/tmp/{row['이름']}_지장간표.png"
-                        create_지장간표(사주, 기본정보, path)
-                        zf.write(path, f"{folder_name}/09_지장간표.png")
-                    
-                    if 합충형파해표_체크:
-                        path = f"/tmp/{row['이름']}_합충형파해표.png"
-                        create_합충형파해표(사주, 기본정보, path)
-                        zf.write(path, f"{folder_name}/10_합충형파해표.png")
-                    
-                    if 궁성표_체크:
-                        path = f"/tmp/{row['이름']}_궁성표.png"
-                        create_궁성표(사주, 기본정보, path)
-                        zf.write(path, f"{folder_name}/11_궁성표.png")
-                    
-                    if 육친표_체크:
-                        path = f"/tmp/{row['이름']}_육친표.png"
-                        create_육친표(사주, 기본정보, gender, path)
-                        zf.write(path, f"{folder_name}/12_육친표.png")
-                    
-                    if 납음오행표_체크:
-                        path = f"/tmp/{row['이름']}_납음오행표.png"
-                        create_납음오행표(사주, 기본정보, path)
-                        zf.write(path, f"{folder_name}/13_납음오행표.png")
-                    
-                    if 격국표_체크:
-                        path = f"/tmp/{row['이름']}_격국표.png"
-                        create_격국표(사주, 기본정보, path)
-                        zf.write(path, f"{folder_name}/14_격국표.png")
-                    
-                    if 공망표_체크:
-                        path = f"/tmp/{row['이름']}_공망표.png"
-                        create_공망표(사주, 기본정보, path)
-                        zf.write(path, f"{folder_name}/15_공망표.png")
-                    
-                    if 용신표_체크:
-                        path = f"/tmp/{row['이름']}_용신표.png"
-                        create_용신표(사주, 기본정보, path)
-                        zf.write(path, f"{folder_name}/16_용신표.png")
-                    
-                    progress.progress((idx + 1) / len(df))
-            
-            status.text("✅ 완료!")
+            BATCH_QUEUE.submit(작업_id, 'batch', {
+                'input': 입력_경로,
+                'charts': 선택_차트,
+                'workers': BATCH_WORKERS,
+                'zodiac_path': os.path.abspath(ZODIAC_PATH),
+                'render_cache': RENDER_CACHE_DIR,
+                'shard_people': BATCH_SHARD_PEOPLE,
+                'shard_bytes': BATCH_SHARD_MB * 1024 * 1024,
+                'shard_name': '사주_이미지_결과_part{index:03d}.zip',
+            }, 작업_디렉터리, priority=우선순위)
+            BATCH_QUEUE.ensure_workers()
+            st.session_state['batch_queue_job'] = 작업_id
+
+        # 이미지 없이 계산 결과만 열 형식으로 (분석용, 열 구성은 batch_export.EXPORT_COLUMNS)
+        # 이미지 작업과 같은 큐/워커에서 실행 (탭 스크립트가 계산하는 동안 멈추지 않음)
+        내보내기_형식 = st.radio("계산 데이터 형식", list(EXPORT_FORMATS), horizontal=True, key="export_format")
+        if st.button("📊 계산 데이터 내보내기 (이미지 없이)", use_container_width=True):
+            작업_id = batch_job_id(uploaded_file.getvalue(), ['계산_데이터'], 내보내기_형식)
+            작업_디렉터리, 입력_경로 = save_batch_input(uploaded_file, 작업_id)
             
-            zip_buffer.seek(0)
-            st.download_button(
-                label="📥 전체 다운로드 (ZIP)",
-                data=zip_buffer,
-                file_name="사주_이미지_결과.zip",
-                mime="application/zip",
-                use_container_width=True
-            )
+            BATCH_QUEUE.submit(작업_id, 'export', {
+                'input': 입력_경로,
+                'export_format': 내보내기_형식,
+                'workers': BATCH_WORKERS,
+                'output_name': f"사주_계산_데이터{EXPORT_FORMATS[내보내기_형식]}",
+            }, 작업_디렉터리, priority=우선순위)
+            BATCH_QUEUE.ensure_workers()
+            st.session_state['export_queue_job'] = 작업_id
+    
+    # 제출한 일괄 작업 / 내보내기 상태 (작업 큐에서 읽기만 하므로 다시 실행/탭 이동해도 그대로)
+    for 작업_키 in ('batch_queue_job', 'export_queue_job'):
+        if st.session_state.get(작업_키):
+            st.divider()
+            show_batch_job(st.session_state[작업_키])
 
 # ============================================
 # 탭3: 일진표
@@ -967,41 +1000,31 @@ with tab3:
             # 기본정보 (이름이 있을 경우)
             기본정보 = {'이름': 일진_이름} if 일진_이름 else None
             
-            # 12개월치 생성
+            # 12개월치 생성 (시작월부터 12개월, 일진 계산 1회 + 월별 병렬 렌더링)
+            # 파일 없이 메모리에서 PNG 바이트로 인코딩 (세션끼리 파일이 겹치지 않음)
             생성된_일진 = {}
             
-            for i in range(12):
-                # 월 계산 (시작월부터 12개월)
-                target_month = 시작월 + i
-                target_year = 일진_년도
-                
-                if target_month > 12:
-                    target_month -= 12
-                    target_year += 1
-                
+            for target_year, target_month, 이미지 in create_일진표_year(
+                    일진_년도, 시작월, 12, 기본정보=기본정보):
                 파일명 = f"{target_year}년_{target_month:02d}월_일진표"
-                path = f"/tmp/{파일명}.png"
-                
-                create_일진표(target_year, target_month, 기본정보=기본정보, output_path=path)
-                생성된_일진[파일명] = path
+                buffer = io.BytesIO()
+                이미지.save(buffer, 'PNG')
+                생성된_일진[파일명] = buffer.getvalue()
             
             st.success(f"✅ 일진표 12개월 생성 완료!")
             
             # ============================================
             # 전체 다운로드 버튼 (상단)
             # ============================================
-            zip_buffer = io.BytesIO()
-            with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zf:
-                for 파일명, 경로 in 생성된_일진.items():
-                    zf.write(경로, f"{파일명}.png")
-            
-            zip_buffer.seek(0)
+            with ZipSink() as sink:
+                for 파일명, 이미지 in 생성된_일진.items():
+                    sink.write(f"{파일명}.png", 이미지)
             
             다운로드_파일명 = f"{일진_이름}_일진표_12개월.zip" if 일진_이름 else f"{일진_년도}년_일진표_12개월.zip"
             
             st.download_button(
                 label="📦 전체 다운로드 (12개월 ZIP)",
-                data=zip_buffer,
+                data=sink.getvalue(),
                 file_name=다운로드_파일명,
                 mime="application/zip",
                 use_container_width=True,
@@ -1013,7 +1036,7 @@ with tab3:
             # ============================================
             # 개별 월 이미지 표시
             # ============================================
-            for 파일명, 경로 in 생성된_일진.items():
+            for 파일명, 이미지 in 생성된_일진.items():
                 st.subheader(f"📅 {파일명.replace('_', ' ')}")
-                st.image(경로, caption=파일명)
+                st.image(이미지, caption=파일명)
 
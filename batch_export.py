@@ -0,0 +1,337 @@
+# 계산 결과 열 형식 내보내기 (분석용, 이미지 없이)
+#
+# 한 명 = 한 행, 열은 EXPORT_COLUMNS로 고정 (입력 값이 달라도 열 이름/순서/타입은 항상 같음)
+#   기둥(년주~시주), 위치별 십성/12운성/지장간/12신살/납음/신살/공망, 오행 개수,
+#   합충형파해/천간합 관계, 격국, 용신, 대운/세운/월운 순서열
+# 목록 값(tuple)은 Parquet/Arrow에서는 list 타입, CSV에서는 '|'로 이어 붙인 문자열
+# 계산은 워커 프로세스에 몇백 명씩 묶어서 보내고, 쓰기는 EXPORT_CHUNK_SIZE행마다 한 번
+#   -> 100만 명을 내보내도 메모리에는 청크 몇 개만 있음
+# 예)
+#   with ExportWriter('out.parquet') as writer:
+#       for result in iter_export(persons):
+#           if result.values is not None:
+#               writer.write(result.values)
+import csv
+import io
+import os
+import sys
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+
+from batch_input import PersonRow
+from batch_pipeline import BIRTH_CACHE_SIZE, birth_key, compute_birth, normalize_person
+from image_generator import RENDER_BACKENDS
+from saju_calculator import (
+    calc_합충형파해, calc_천간합, calc_공망_전체, calc_납음오행, calc_격국, calc_용신
+)
+
+# 열 구성이 바뀌면 올림 (Parquet/Arrow 메타데이터 saju_export_version)
+EXPORT_SCHEMA_VERSION = 1
+
+# 내보내기 형식 -> 기본 확장자
+EXPORT_FORMATS = {'parquet': '.parquet', 'arrow': '.arrow', 'csv': '.csv'}
+
+# 한 번에 쓰는 행 수 (Parquet row group / Arrow record batch 크기)
+EXPORT_CHUNK_SIZE = 10000
+# 워커 하나에 한 번에 보내는 인원 (작업 전달 오버헤드 < 계산 시간이 되도록)
+EXPORT_TASK_SIZE = 500
+
+# CSV에서 목록 값 구분자
+LIST_SEPARATOR = '|'
+
+_POSITIONS = ('년', '월', '일', '시')
+_RELATIONS = ('육합', '삼합', '방합', '충', '형', '파', '해')
+_YONGSIN = ('신강약', '신강점수', '조후_용신', '억부_용신', '통관_용신', '용신', '희신', '한신', '기신', '구신')
+# (열 이름 접미사, 대운/세운/월운 항목 키)
+_LUCK_FIELDS = (('천간십성', '천간_십성'), ('지지십성', '지지_십성'), ('12운성', '12운성'), ('12신살', '12신살'))
+
+
+def _schema():
+    columns = [
+        ('row', 'int'), ('이름', 'str'), ('성별', 'str'),
+        ('생년', 'int'), ('생월', 'int'), ('생일', 'int'), ('시', 'int'), ('분', 'int'),
+        ('음양력', 'str'), ('윤달', 'bool'),
+        ('양력', 'str'), ('음력', 'str'),
+        ('년주', 'str'), ('월주', 'str'), ('일주', 'str'), ('시주', 'str'),
+    ]
+    for pos in _POSITIONS:
+        columns += [
+            (f'{pos}_천간십성', 'str'), (f'{pos}_지지십성', 'str'), (f'{pos}_12운성', 'str'),
+            (f'{pos}_지장간', 'str'), (f'{pos}_12신살', 'str'), (f'{pos}_납음', 'str'),
+            (f'{pos}_천간신살', 'list[str]'), (f'{pos}_지지신살', 'list[str]'), (f'{pos}_공망', 'list[str]'),
+        ]
+    columns += [(f'오행_{element}', 'int') for element in ('목', '화', '토', '금', '수')]
+    columns += [('길신', 'list[str]'), ('흉신', 'list[str]'), ('특수신살', 'list[str]')]
+    columns += [(name, 'list[str]') for name in _RELATIONS + ('천간합', '공망_해당')]
+    columns += [('격국', 'str'), ('특수격', 'list[str]')]
+    columns += [(name, 'str') for name in _YONGSIN]
+    columns += [('대운수', 'int'), ('대운_순행', 'bool'), ('대운_나이', 'list[int]'), ('대운_간지', 'list[str]')]
+    columns += [(f'대운_{name}', 'list[str]') for name, _ in _LUCK_FIELDS]
+    columns += [('세운_년도', 'list[int]'), ('세운_간지', 'list[str]')]
+    columns += [(f'세운_{name}', 'list[str]') for name, _ in _LUCK_FIELDS]
+    columns += [('월운_년월', 'list[str]'), ('월운_간지', 'list[str]')]
+    columns += [(f'월운_{name}', 'list[str]') for name, _ in _LUCK_FIELDS]
+    return columns
+
+
+# (열 이름, 타입) 목록: 'int' | 'str' | 'bool' | 'list[str]' | 'list[int]'
+EXPORT_COLUMNS = _schema()
+EXPORT_COLUMN_NAMES = [name for name, _ in EXPORT_COLUMNS]
+
+# 내보내기에 필요한 운 계산 (compute_birth의 차트 선택)
+_EXPORT_CHARTS = ('대운표', '세운표', '월운표')
+
+# 한 명의 내보내기 결과
+#   person: 입력 PersonRow
+#   values: EXPORT_COLUMNS 순서의 값 tuple (계산 실패면 None)
+#   error: 오류 메시지 (성공이면 None)
+ExportResult = namedtuple('ExportResult', ['person', 'values', 'error'])
+
+
+def _relation_text(item):
+    """합충/천간합 관계 dict -> '월-일:술-진', '년-월:오-미→화', '해축→수(미완성)'"""
+    chars = item.get('지지', item.get('천간', ''))
+    if isinstance(chars, list):
+        chars = ''.join(chars)
+    text = f"{item['위치']}:{chars}" if '위치' in item else chars
+    if '합화' in item:
+        text += f"→{item['합화']}"
+    elif '오행' in item:
+        text += f"→{item['오행']}" + ('' if item.get('완성') else '(미완성)')
+    return text
+
+
+def _luck_columns(entries):
+    return [tuple(entry[key] for entry in entries) for _, key in _LUCK_FIELDS]
+
+
+def _texts(values):
+    """문자열 목록 -> intern한 tuple (간지/신살 이름처럼 반복되는 값은 행마다 새로 만들지 않음)"""
+    return tuple(sys.intern(value) for value in values)
+
+
+@lru_cache(maxsize=BIRTH_CACHE_SIZE)
+def _birth_values(key):
+    """출생 정보 키 -> 이름/행 번호를 뺀 계산 열 값 (같은 출생 정보는 한 번만 계산)"""
+    birth = compute_birth(PersonRow(0, '', *key), _EXPORT_CHARTS)
+    사주 = birth['사주_data']
+    신살 = birth['신살_data']
+    공망 = calc_공망_전체(사주)
+    납음 = calc_납음오행(사주)
+    합충 = calc_합충형파해(사주)
+    격국 = calc_격국(사주)
+    용신 = calc_용신(사주)
+
+    values = [birth['양력'], birth['음력']]
+    values += _texts(''.join(사주[f'{pos}주']) for pos in _POSITIONS)
+    for pos in _POSITIONS:
+        values += [
+            사주['천간십성'][pos], 사주['지지십성'][pos], 사주['12운성'][pos],
+            사주['지장간'][pos], 사주['12신살'][pos], 납음[pos]['납음'],
+            tuple(신살['천간신살'][pos]), tuple(신살['지지신살'][pos]), tuple(공망[pos]['공망']),
+        ]
+    values += [사주['오행'][element] for element in ('목', '화', '토', '금', '수')]
+    values += [_texts(f"{name}({pos})" for name, pos in 신살[group]) for group in ('길신', '흉신', '특수신살')]
+    values += [_texts(_relation_text(item) for item in 합충[name]) for name in _RELATIONS]
+    values.append(_texts(_relation_text(item) for item in calc_천간합(사주)))
+    values.append(_texts(f"{item['위치']}:{item['지지']}" for item in 공망['공망_해당']))
+    values += [격국['정격'], tuple(격국['특수격'])]
+    values += [용신[name] for name in _YONGSIN]
+
+    대운 = birth['대운_data']
+    values += [대운['대운수'], 대운['순행'], tuple(entry['나이'] for entry in 대운['대운']),
+               _texts(entry['천간'] + entry['지지'] for entry in 대운['대운'])]
+    values += _luck_columns(대운['대운'])
+    세운 = birth['세운_data']['세운']
+    values += [tuple(entry['년도'] for entry in 세운), _texts(entry['천간'] + entry['지지'] for entry in 세운)]
+    values += _luck_columns(세운)
+    월운 = birth['월운_data']['월운']
+    values += [_texts(f"{entry['년도']}-{entry['월']:02d}" for entry in 월운),
+               _texts(entry['천간'] + entry['지지'] for entry in 월운)]
+    values += _luck_columns(월운)
+    return tuple(values)
+
+
+def export_values(person):
+    """PersonRow -> EXPORT_COLUMNS 순서의 값 tuple"""
+    person = normalize_person(person)
+    return tuple(person) + _birth_values(birth_key(person))
+
+
+def export_chunk(persons):
+    """여러 명 계산 -> [(값 tuple 또는 None, 오류 또는 None)] (워커 프로세스에서 실행)"""
+    results = []
+    for person in persons:
+        try:
+            results.append((export_values(person), None))
+        except Exception as e:
+            results.append((None, f"Error: {e}"))
+    return results
+
+
+def iter_export(persons, workers=None, backend='process', task_size=EXPORT_TASK_SIZE, window=None):
+    """
+    여러 명을 병렬로 계산해서 입력 순서대로 ExportResult를 반환하는 제너레이터
+
+    Args:
+        persons: PersonRow iterable (끝까지 미리 읽지 않음)
+        workers: 워커 수 (None이면 CPU 코어 수)
+        backend: 'process' | 'thread' | 'serial'
+        task_size: 워커에 한 번에 보내는 인원
+        window: 동시에 처리 중인 최대 묶음 수 (기본: 워커 수 x 2)
+    """
+    if backend not in RENDER_BACKENDS:
+        raise ValueError(f"지원하지 않는 backend: {backend} (가능: {', '.join(RENDER_BACKENDS)})")
+    workers = workers or os.cpu_count() or 1
+    if backend == 'process':
+        executor = ProcessPoolExecutor(max_workers=workers)
+    elif backend == 'thread':
+        executor = ThreadPoolExecutor(max_workers=workers)
+    else:
+        executor = None
+
+    pending = deque()  # (인원 묶음, Future 또는 완료 결과)
+
+    def submit(chunk):
+        if executor is None:
+            pending.append((chunk, export_chunk(chunk)))
+        else:
+            pending.append((chunk, executor.submit(export_chunk, chunk)))
+
+    def collect():
+        chunk, item = pending.popleft()
+        if executor is not None:
+            item = item.result()
+        for person, (values, error) in zip(chunk, item):
+            yield ExportResult(person, values, error)
+
+    window = window or workers * 2
+    try:
+        chunk = []
+        for person in persons:
+            chunk.append(person)
+            if len(chunk) >= task_size:
+                submit(chunk)
+                chunk = []
+                if len(pending) >= window:
+                    yield from collect()
+        if chunk:
+            submit(chunk)
+        while pending:
+            yield from collect()
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+def export_format_for(path):
+    """출력 경로 확장자 -> 내보내기 형식 ('.feather', '.ipc'도 arrow)"""
+    extension = os.path.splitext(path)[1].lower()
+    if extension in ('.feather', '.ipc'):
+        return 'arrow'
+    for export_format, format_extension in EXPORT_FORMATS.items():
+        if extension == format_extension:
+            return export_format
+    raise ValueError(f"지원하지 않는 내보내기 형식입니다: {extension or path} "
+                     f"(가능: {', '.join(EXPORT_FORMATS.values())})")
+
+
+def _arrow_schema():
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise ValueError("Parquet/Arrow 내보내기에는 pyarrow가 필요합니다 (pip install pyarrow)") from None
+    types = {
+        'int': pa.int32(), 'str': pa.string(), 'bool': pa.bool_(),
+        'list[str]': pa.list_(pa.string()), 'list[int]': pa.list_(pa.int32()),
+    }
+    return pa.schema([(name, types[kind]) for name, kind in EXPORT_COLUMNS],
+                     metadata={'saju_export_version': str(EXPORT_SCHEMA_VERSION)})
+
+
+def _csv_value(value):
+    if isinstance(value, tuple):
+        return LIST_SEPARATOR.join(str(item) for item in value)
+    return value
+
+
+class ExportWriter:
+    """
+    EXPORT_COLUMNS 행을 청크 단위로 쓰는 파일 (Parquet / Arrow IPC / CSV)
+
+    Args:
+        output: 출력 경로 또는 바이너리 파일 객체 (stdout 등, 파일 객체는 닫지 않음)
+        export_format: 'parquet' | 'arrow' | 'csv' (None이면 경로 확장자로 결정)
+        chunk_size: 한 번에 쓰는 행 수
+    """
+
+    def __init__(self, output, export_format=None, chunk_size=EXPORT_CHUNK_SIZE):
+        if export_format is None:
+            if not isinstance(output, (str, os.PathLike)):
+                raise ValueError("파일 객체로 쓸 때는 export_format을 지정해야 합니다")
+            export_format = export_format_for(os.fspath(output))
+        if export_format not in EXPORT_FORMATS:
+            raise ValueError(f"지원하지 않는 내보내기 형식: {export_format} (가능: {', '.join(EXPORT_FORMATS)})")
+        self.export_format = export_format
+        self.chunk_size = chunk_size
+        self.rows = 0
+        self._buffer = []
+        self._schema = None if export_format == 'csv' else _arrow_schema()
+
+        self._owns_file = isinstance(output, (str, os.PathLike))
+        self._file = open(output, 'wb') if self._owns_file else output
+        if export_format == 'csv':
+            # 엑셀에서 바로 열 수 있도록 BOM 포함 UTF-8
+            self._text = io.TextIOWrapper(self._file, encoding='utf-8-sig', newline='')
+            self._writer = csv.writer(self._text)
+            self._writer.writerow(EXPORT_COLUMN_NAMES)
+        elif export_format == 'parquet':
+            import pyarrow.parquet as pq
+            self._writer = pq.ParquetWriter(self._file, self._schema, compression='zstd')
+        else:
+            import pyarrow as pa
+            self._writer = pa.ipc.new_file(self._file, self._schema)
+
+    def write(self, values):
+        """한 행 추가 (chunk_size행이 모이면 파일에 씀)"""
+        self._buffer.append(values)
+        if len(self._buffer) >= self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        if not self._buffer:
+            return
+        rows, self._buffer = self._buffer, []
+        if self.export_format == 'csv':
+            self._writer.writerows([_csv_value(value) for value in row] for row in rows)
+        else:
+            import pyarrow as pa
+            columns = [pa.array(column, type=field.type)
+                       for column, field in zip(zip(*rows), self._schema)]
+            batch = pa.RecordBatch.from_arrays(columns, schema=self._schema)
+            if self.export_format == 'parquet':
+                self._writer.write_batch(batch)
+            else:
+                self._writer.write(batch)
+        self.rows += len(rows)
+
+    def close(self):
+        """남은 행을 쓰고 파일 마무리 (Parquet/Arrow 푸터 기록)"""
+        if self._writer is None:
+            return
+        self.flush()
+        if self.export_format == 'csv':
+            self._text.flush()
+            self._text.detach()
+        else:
+            self._writer.close()
+        self._writer = None
+        if self._owns_file:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
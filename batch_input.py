@@ -0,0 +1,394 @@
+# 일괄 처리 입력 (엑셀 스트리밍 읽기 + 행 검증)
+#
+# 엑셀 전체를 DataFrame으로 읽지 않고 openpyxl read_only 모드로 한 행씩 읽음
+#   -> 읽는 즉시 검증해서 PersonRow(정상) / RowError(오류)로 변환, 청크 단위로 반환
+#   -> 메모리는 청크 크기만큼만 사용, 첫 행부터 바로 처리 가능
+# .xls(구 형식)는 openpyxl이 읽지 못하므로 pandas로 읽음
+#
+# CSV / JSONL / Parquet는 pandas(Parquet는 pyarrow 필요)로 청크 단위 DataFrame을 읽고
+# 열 단위로 한 번에 검증 (FrameReader) -> 엑셀과 같은 PersonRow / RowError 스트림
+# open_persons(file)가 확장자로 읽기 방식을 고름
+import math
+from collections import namedtuple
+from datetime import date
+
+from saju_calculator import 유효한_음력
+
+# 검증된 입력 한 명 (row: 엑셀 행 번호, 윤달: bool)
+PersonRow = namedtuple('PersonRow', ['row', '이름', '성별', '생년', '생월', '생일', '시', '분', '음양력', '윤달'])
+
+# 검증 실패한 행
+RowError = namedtuple('RowError', ['row', '이름', 'message'])
+
+REQUIRED_COLUMNS = ('이름', '성별', '생년', '생월', '생일', '시', '분', '음양력')
+OPTIONAL_COLUMNS = ('윤달',)
+
+# 지원 입력 형식 (엑셀은 행 단위, 나머지는 청크 단위 열 검증)
+INPUT_EXTENSIONS = ('xlsx', 'xls', 'csv', 'jsonl', 'ndjson', 'parquet')
+FRAME_EXTENSIONS = ('.csv', '.jsonl', '.ndjson', '.parquet')
+FRAME_CHUNK_SIZE = 10000
+
+# 생년 허용 범위 (korean_lunar_calendar 음력 변환 지원 범위: 양력 2050-12-31까지)
+MIN_BIRTH_YEAR = 1900
+MAX_BIRTH_YEAR = 2050
+
+_성별_값 = {'남성': '남성', '남': '남성', 'M': '남성', 'MALE': '남성',
+          '여성': '여성', '여': '여성', 'F': '여성', 'FEMALE': '여성'}
+_음양력_값 = {'양력': '양력', '': '양력', '음력': '음력'}
+_윤달_값 = {'O', '○', '1', 'TRUE', 'Y', 'YES', '윤달'}
+
+
+def _text(value):
+    """셀 값 -> 공백 제거 문자열 (빈 셀은 '')"""
+    if value is None:
+        return ''
+    if isinstance(value, float):
+        if value != value:  # NaN (pandas 빈 셀)
+            return ''
+        if value.is_integer():
+            return str(int(value))
+    return str(value).strip()
+
+
+def _integer(value, column, low, high):
+    text = _text(value)
+    try:
+        number = float(text)
+    except ValueError:
+        number = math.nan
+    # inf / 1e400 / nan도 숫자가 아닌 값과 같이 처리 (int 변환 시 OverflowError 방지)
+    if not math.isfinite(number):
+        raise ValueError(f"{column} 값이 숫자가 아닙니다: {text or '(빈 칸)'}")
+    number = int(number)
+    if not low <= number <= high:
+        raise ValueError(f"{column} 값이 범위({low}~{high})를 벗어났습니다: {number}")
+    return number
+
+
+def parse_row(values, row_number):
+    """
+    열 이름 -> 셀 값 dict를 PersonRow로 변환 (잘못된 값이면 ValueError)
+    """
+    이름 = _text(values.get('이름'))
+    if not 이름:
+        raise ValueError("이름이 비어 있습니다")
+
+    성별 = _성별_값.get(_text(values.get('성별')).upper())
+    if 성별 is None:
+        raise ValueError(f"성별 값 오류: {_text(values.get('성별')) or '(빈 칸)'} (남성/여성)")
+
+    음양력 = _음양력_값.get(_text(values.get('음양력')))
+    if 음양력 is None:
+        raise ValueError(f"음양력 값 오류: {_text(values.get('음양력'))} (양력/음력)")
+
+    생년 = _integer(values.get('생년'), '생년', MIN_BIRTH_YEAR, MAX_BIRTH_YEAR)
+    생월 = _integer(values.get('생월'), '생월', 1, 12)
+    생일 = _integer(values.get('생일'), '생일', 1, 30 if 음양력 == '음력' else 31)
+    시 = _integer(values.get('시'), '시', 0, 23)
+    분 = _integer(values.get('분'), '분', 0, 59)
+    윤달 = _text(values.get('윤달')).upper() in _윤달_값
+
+    if 음양력 == '양력':
+        try:
+            date(생년, 생월, 생일)
+        except ValueError:
+            raise ValueError(f"없는 날짜입니다: {생년}-{생월:02d}-{생일:02d}") from None
+    elif not 유효한_음력(생년, 생월, 생일, 윤달):
+        윤 = "윤" if 윤달 else ""
+        raise ValueError(f"없는 음력 날짜입니다: {생년}-{윤}{생월:02d}-{생일:02d}")
+
+    return PersonRow(row_number, 이름, 성별, 생년, 생월, 생일, 시, 분, 음양력, 윤달)
+
+
+def _header_index(header):
+    """헤더 행 -> {열 이름: 위치} (필수 열이 없으면 ValueError)"""
+    index = {}
+    for i, name in enumerate(header):
+        name = _text(name)
+        if name and name not in index:
+            index[name] = i
+    missing = [column for column in REQUIRED_COLUMNS if column not in index]
+    if missing:
+        raise ValueError(f"필수 열이 없습니다: {', '.join(missing)}")
+    return index
+
+
+def open_rows(file):
+    """
+    엑셀 파일 -> (헤더, 행 값 튜플 iterator, 예상 행 수)
+    file: 경로 또는 파일 객체 (Streamlit 업로드 파일 포함)
+    """
+    if hasattr(file, 'seek'):
+        file.seek(0)
+    name = getattr(file, 'name', file if isinstance(file, str) else '')
+    if str(name).lower().endswith('.xls'):
+        import pandas as pd
+        df = pd.read_excel(file, dtype=object)
+        return list(df.columns), df.itertuples(index=False, name=None), len(df)
+
+    from openpyxl import load_workbook
+    workbook = load_workbook(file, read_only=True, data_only=True)
+    sheet = workbook.active
+    rows = sheet.iter_rows(values_only=True)
+    header = next(rows, ())
+    # max_row는 파일에 기록된 범위 (빈 행 포함 가능, 진행률 추정용)
+    estimated = max((sheet.max_row or 1) - 1, 0)
+
+    def values():
+        try:
+            yield from rows
+        finally:
+            workbook.close()
+    return list(header), values(), estimated
+
+
+class _RowReader:
+    """PersonRow / RowError 스트림 공통 (chunks)"""
+
+    estimated = 0
+
+    def __iter__(self):
+        raise NotImplementedError
+
+    def chunks(self, chunk_size=500):
+        """청크 단위로 반환 -> (PersonRow 목록, RowError 목록)"""
+        records, errors = [], []
+        for item in self:
+            (errors if isinstance(item, RowError) else records).append(item)
+            if len(records) + len(errors) >= chunk_size:
+                yield records, errors
+                records, errors = [], []
+        if records or errors:
+            yield records, errors
+
+
+class PersonReader(_RowReader):
+    """
+    엑셀 행을 읽는 즉시 검증해서 PersonRow 또는 RowError로 반환 (빈 행은 건너뜀)
+    예) reader = PersonReader(uploaded_file)
+        for records, errors in reader.chunks(500): ...
+    """
+
+    def __init__(self, file):
+        header, self._rows, self.estimated = open_rows(file)
+        self._index = _header_index(header)
+
+    def __iter__(self):
+        for row_number, row in enumerate(self._rows, start=2):
+            if all(_text(value) == '' for value in row):
+                continue
+            values = {column: row[i] if i < len(row) else None for column, i in self._index.items()}
+            try:
+                yield parse_row(values, row_number)
+            except ValueError as e:
+                yield RowError(row_number, _text(values.get('이름')), str(e))
+
+
+# ============================================
+# CSV / JSONL / Parquet (열 단위 검증)
+# ============================================
+def _file_name(file):
+    return str(getattr(file, 'name', file if isinstance(file, str) else '')).lower()
+
+
+def _count_lines(file):
+    """줄 수 세기 (진행률 추정용, 바이트 단위로 빠르게)"""
+    if hasattr(file, 'getbuffer'):
+        return bytes(file.getbuffer()).count(b'\n')
+    if hasattr(file, 'seek'):
+        file.seek(0)
+        count = sum(block.count(b'\n') for block in iter(lambda: file.read(1 << 20), b''))
+        file.seek(0)
+        return count
+    with open(file, 'rb') as f:
+        return sum(block.count(b'\n') for block in iter(lambda: f.read(1 << 20), b''))
+
+
+def _frame_text(df, column):
+    """열 -> 공백 제거 문자열 Series (빈 칸/없는 열은 '')"""
+    import pandas as pd
+    if column not in df.columns:
+        return pd.Series('', index=df.index, dtype=object)
+    values = df[column]
+    if values.dtype.kind == 'f':
+        # 1990.0 -> '1990' (엑셀/JSON 숫자 열)
+        whole = values.notna() & (values % 1 == 0)
+        values = values.astype(object).where(~whole, values[whole].astype('int64'))
+    return values.astype('string').fillna('').str.strip().astype(object)
+
+
+def validate_frame(df, first_row=2):
+    """
+    DataFrame 청크를 열 단위로 한 번에 검증 -> PersonRow / RowError 목록 (행 순서)
+
+    범위/형식/양력 날짜는 열 연산으로, 음력 날짜는 서로 다른 (년, 월, 일, 윤달) 조합만 확인
+    오류 행은 parse_row로 다시 검사해서 엑셀 입력과 같은 오류 메시지를 만듦
+    """
+    import numpy as np
+    import pandas as pd
+
+    df = df.reset_index(drop=True)
+    texts = {column: _frame_text(df, column) for column in REQUIRED_COLUMNS + OPTIONAL_COLUMNS}
+    blank = np.logical_and.reduce([texts[column] == '' for column in texts])
+
+    성별 = texts['성별'].str.upper().map(_성별_값)
+    음양력 = texts['음양력'].map(_음양력_값)
+    윤달 = texts['윤달'].str.upper().isin(_윤달_값)
+    ok = (texts['이름'] != '') & 성별.notna() & 음양력.notna()
+
+    numbers = {}
+    lunar = (음양력 == '음력').to_numpy()
+    for column, low, high in (('생년', MIN_BIRTH_YEAR, MAX_BIRTH_YEAR), ('생월', 1, 12),
+                              ('생일', 1, 31), ('시', 0, 23), ('분', 0, 59)):
+        value = np.trunc(pd.to_numeric(texts[column].replace('', None), errors='coerce'))
+        value = value.where(np.isfinite(value))  # inf / 1e400 -> NaN (검증 실패 행으로)
+        in_range = value.between(low, high)
+        if column == '생일':
+            in_range &= ~lunar | (value <= 30)
+        ok &= in_range
+        numbers[column] = value.fillna(0).astype('int64')
+
+    # 양력: 실제 날짜인지 (2월 30일 등)
+    solar = ok & (음양력 == '양력')
+    parsed = pd.to_datetime(pd.DataFrame({'year': numbers['생년'], 'month': numbers['생월'],
+                                          'day': numbers['생일']})[solar], errors='coerce')
+    ok[solar] = parsed.notna()
+
+    # 음력: 서로 다른 날짜 조합만 음력 달력으로 확인
+    lunar_rows = ok & (음양력 == '음력')
+    if lunar_rows.any():
+        keys = list(zip(numbers['생년'][lunar_rows], numbers['생월'][lunar_rows],
+                        numbers['생일'][lunar_rows], 윤달[lunar_rows]))
+        valid = {key: 유효한_음력(*map(int, key[:3]), bool(key[3])) for key in set(keys)}
+        ok[lunar_rows] = [valid[key] for key in keys]
+
+    items = []
+    columns = zip(texts['이름'], 성별, numbers['생년'], numbers['생월'], numbers['생일'],
+                  numbers['시'], numbers['분'], 음양력, 윤달)
+    for i, (is_blank, is_ok, values) in enumerate(zip(blank, ok, columns)):
+        if is_blank:
+            continue
+        row_number = first_row + i
+        if is_ok:
+            이름, 성별_값, 생년, 생월, 생일, 시, 분, 음양력_값, 윤달_값 = values
+            items.append(PersonRow(row_number, 이름, 성별_값, int(생년), int(생월), int(생일),
+                                   int(시), int(분), 음양력_값, bool(윤달_값)))
+            continue
+        raw = {column: texts[column].iat[i] for column in texts}
+        try:
+            items.append(parse_row(raw, row_number))
+        except ValueError as e:
+            items.append(RowError(row_number, raw['이름'], str(e)))
+    return items
+
+
+class FrameReader(_RowReader):
+    """
+    DataFrame 청크 iterable -> PersonRow / RowError 스트림 (청크마다 validate_frame)
+
+    Args:
+        frames: DataFrame 청크 iterable
+        estimated: 예상 행 수 (진행률 추정용)
+        first_row: 첫 데이터 행 번호 (CSV는 헤더 다음 2, JSONL은 1)
+    """
+
+    def __init__(self, frames, estimated=0, first_row=2):
+        self._frames = iter(frames)
+        self.estimated = estimated
+        self._first_row = first_row
+        # 첫 청크로 필수 열 확인 (없으면 ValueError)
+        self._first = next(self._frames, None)
+        if self._first is not None:
+            _header_index(self._first.columns)
+
+    def head(self, limit):
+        """첫 청크의 처음 limit행 -> (열 이름 목록, 행 목록) (미리보기용, 검증 없음)"""
+        if self._first is None:
+            return [], []
+        frame = self._first.head(limit).astype(object)
+        frame = frame.where(frame.notna(), None)
+        return [str(name) for name in frame.columns], frame.values.tolist()
+
+    def __iter__(self):
+        row = self._first_row
+        frame, self._first = self._first, None
+        while frame is not None:
+            yield from validate_frame(frame, row)
+            row += len(frame)
+            frame = next(self._frames, None)
+
+
+def read_csv_frames(file, chunk_size=FRAME_CHUNK_SIZE, encoding='utf-8-sig'):
+    """CSV -> DataFrame 청크 (모든 열을 문자열로 읽고 검증 단계에서 숫자 변환)"""
+    import pandas as pd
+    if hasattr(file, 'seek'):
+        file.seek(0)
+    return pd.read_csv(file, dtype=str, keep_default_na=False, encoding=encoding,
+                       chunksize=chunk_size)
+
+
+def read_jsonl_frames(file, chunk_size=FRAME_CHUNK_SIZE):
+    """JSONL (한 줄에 한 명) -> DataFrame 청크"""
+    import pandas as pd
+    if hasattr(file, 'seek'):
+        file.seek(0)
+    return pd.read_json(file, lines=True, dtype=False, chunksize=chunk_size)
+
+
+def read_parquet_frames(file, chunk_size=FRAME_CHUNK_SIZE):
+    """Parquet -> (DataFrame 청크 iterator, 행 수) (pyarrow 필요)"""
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ValueError("Parquet 입력에는 pyarrow가 필요합니다 (pip install pyarrow)") from None
+    if hasattr(file, 'seek'):
+        file.seek(0)
+    parquet = pq.ParquetFile(file)
+    columns = [name for name in parquet.schema_arrow.names if name in REQUIRED_COLUMNS + OPTIONAL_COLUMNS]
+    frames = (batch.to_pandas() for batch in parquet.iter_batches(chunk_size, columns=columns))
+    return frames, parquet.metadata.num_rows
+
+
+def open_persons(file, chunk_size=FRAME_CHUNK_SIZE):
+    """
+    입력 파일 -> PersonRow / RowError 스트림 (확장자로 형식 결정)
+      .xlsx / .xls: PersonReader (행 단위)
+      .csv / .jsonl / .parquet: FrameReader (청크 단위 열 검증)
+    """
+    name = _file_name(file)
+    if name.endswith('.csv'):
+        return FrameReader(read_csv_frames(file, chunk_size), max(_count_lines(file) - 1, 0))
+    if name.endswith(('.jsonl', '.ndjson')):
+        return FrameReader(read_jsonl_frames(file, chunk_size), _count_lines(file), first_row=1)
+    if name.endswith('.parquet'):
+        frames, rows = read_parquet_frames(file, chunk_size)
+        return FrameReader(frames, rows, first_row=1)
+    return PersonReader(file)
+
+
+def iter_person_chunks(file, chunk_size=500):
+    """입력 파일 -> (PersonRow 목록, RowError 목록) 청크"""
+    return open_persons(file).chunks(chunk_size)
+
+
+def preview_rows(file, limit=20):
+    """
+    미리보기용 처음 limit행 -> (헤더, 행 목록, 예상 행 수)
+    필수 열 확인까지 하고, 나머지 행은 읽지 않음
+    """
+    if _file_name(file).endswith(FRAME_EXTENSIONS):
+        reader = open_persons(file, chunk_size=limit)
+        return (*reader.head(limit), reader.estimated)
+
+    header, rows, estimated = open_rows(file)
+    _header_index(header)
+    width = len(header)
+    preview = []
+    for row in rows:
+        if len(preview) >= limit:
+            break
+        if any(_text(value) != '' for value in row):
+            preview.append((list(row) + [None] * width)[:width])
+    if hasattr(rows, 'close'):
+        rows.close()
+    return [_text(name) for name in header], preview, estimated
@@ -0,0 +1,178 @@
+# 이어서 실행 가능한 일괄 작업 (체크포인트 매니페스트)
+#
+# 작업 디렉터리 구조
+#   manifest.jsonl   처리한 행마다 한 줄 추가 (행 키 -> 출력 항목 [ZIP 경로, sha256, 크기] + 실패한 차트)
+#   objects/ab/<sha256>.img   출력 바이트 (내용 주소 기반, 같은 이미지는 한 번만 저장)
+# 중간에 죽어도 매니페스트에 기록된 행은 출력 파일이 이미 디스크에 있음
+#   -> 같은 입력으로 다시 실행하면 완료한 행은 건너뛰고 남은 행만 처리
+#   -> 일부 차트만 실패한 행은 성공한 파일은 그대로 내보내고, 다음 실행에서 실패한 차트만 다시 시도
+#      (같은 행 키의 나중 줄이 앞 줄을 대신함)
+#   -> 마지막에 매니페스트 순서(행 번호 순)대로 ZIP을 만듦
+import hashlib
+import json
+import os
+import tempfile
+
+from render_cache import make_cache_key
+
+MANIFEST_NAME = 'manifest.jsonl'
+
+
+def batch_job_id(data, charts, extension='png'):
+    """입력 파일 내용 + 차트 선택 -> 작업 ID (같은 입력을 다시 올리면 같은 작업)"""
+    digest = hashlib.sha256(data).hexdigest()
+    return make_cache_key('batch', digest, list(charts), extension)[:24]
+
+
+class BatchJob:
+    """
+    일괄 작업 체크포인트
+    예) job = BatchJob(job_dir, charts)
+        for result in iter_batch(job.pending(persons), charts, charts_for=job.retry_charts):
+            job.record(result)
+        job.write_zip(sink)
+
+    Args:
+        job_dir: 작업 디렉터리 (없으면 생성)
+        charts: 생성할 차트 이름 목록 (행 키에 포함)
+        extension: 출력 확장자 (행 키에 포함)
+    """
+
+    def __init__(self, job_dir, charts, extension='png'):
+        self.job_dir = job_dir
+        self.charts = list(charts)
+        self.extension = extension
+        self.manifest_path = os.path.join(job_dir, MANIFEST_NAME)
+        self._entries = {}  # 행 키 -> 매니페스트 항목
+        self.skipped = 0
+        self.recorded = 0
+
+        os.makedirs(job_dir, exist_ok=True)
+        self._load_manifest()
+
+    def _object_path(self, digest):
+        return os.path.join(self.job_dir, 'objects', digest[:2], digest + '.img')
+
+    def _load_manifest(self):
+        """매니페스트 읽기 (쓰다 만 마지막 줄은 잘라냄, 출력 파일이 없는 행은 미완료)"""
+        try:
+            with open(self.manifest_path, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            return
+        complete = data.rfind(b'\n') + 1
+        if complete < len(data):
+            # 다음 기록이 쓰다 만 줄에 이어 붙지 않도록
+            with open(self.manifest_path, 'r+b') as f:
+                f.truncate(complete)
+        for line in data[:complete].decode('utf-8').splitlines():
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if all(self._has_object(digest, size) for _, digest, size in entry['files']):
+                self._entries[entry['key']] = entry
+
+    def _has_object(self, digest, size):
+        try:
+            return os.path.getsize(self._object_path(digest)) == size
+        except OSError:
+            return False
+
+    def row_key(self, person):
+        """행 키 (행 번호 + 입력 값 + 차트 선택 -> 값이 바뀐 행은 다시 처리)"""
+        return make_cache_key(tuple(person), self.charts, self.extension)
+
+    @staticmethod
+    def _complete(entry):
+        return not entry.get('failed')
+
+    @property
+    def completed(self):
+        """완료한 행 수 (실패한 차트가 남은 행 제외)"""
+        return sum(1 for entry in self._entries.values() if self._complete(entry))
+
+    def is_done(self, person):
+        entry = self._entries.get(self.row_key(person))
+        return entry is not None and self._complete(entry)
+
+    def retry_charts(self, person):
+        """이 행에서 만들 차트 (이전 실행에서 일부만 실패했으면 실패한 차트만, iter_batch의 charts_for)"""
+        entry = self._entries.get(self.row_key(person))
+        if entry is None or self._complete(entry):
+            return list(self.charts)
+        return [chart for chart in self.charts if chart in entry['failed']]
+
+    def pending(self, persons):
+        """아직 완료하지 않은 행만 넘기는 제너레이터 (건너뛴 수는 skipped)"""
+        for person in persons:
+            if self.is_done(person):
+                self.skipped += 1
+            else:
+                yield person
+
+    def _store_object(self, data):
+        """출력 바이트 저장 (임시 파일 + os.replace) -> sha256"""
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object_path(digest)
+        if self._has_object(digest, len(data)):
+            return digest
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+        return digest
+
+    def record(self, result):
+        """
+        한 명의 결과(BatchResult)를 저장하고 매니페스트에 추가 -> 매니페스트 항목
+        실패한 차트는 항목의 'failed'에 남김 (성공한 파일은 기록, 다음 실행에서 실패한 차트만 다시 시도)
+        이전 실행에서 일부만 성공한 행이면 이전 파일과 합친 항목
+        """
+        key = self.row_key(result.person)
+        previous = self._entries.get(key)
+        files = {arcname: (digest, size) for arcname, digest, size in previous['files']} if previous else {}
+        for arcname, data in result.files:
+            files[arcname] = (self._store_object(data), len(data))
+        failed = [chart for chart, _ in result.errors]
+        if '계산' in failed:
+            # 계산 단계 실패 -> 이번에 만들려던 차트 모두 다시
+            failed = self.retry_charts(result.person)
+        entry = {'key': key, 'row': result.person.row,
+                 'files': [(arcname, digest, size) for arcname, (digest, size) in sorted(files.items())]}
+        if failed:
+            entry['failed'] = failed
+        # 출력 파일을 모두 쓴 다음에 매니페스트 기록 -> 기록된 행의 출력 파일은 항상 디스크에 있음
+        with open(self.manifest_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        self._entries[entry['key']] = entry
+        self.recorded += 1
+        return entry
+
+    def entries(self, partial=True):
+        """
+        기록한 행의 매니페스트 항목 (행 번호 순)
+        partial=False: 완료한 행만 (다시 시도할 행은 record가 이전 파일과 합친 항목을 돌려줌)
+        """
+        entries = self._entries.values() if partial else filter(self._complete, self._entries.values())
+        return sorted(entries, key=lambda entry: entry['row'])
+
+    def entry_files(self, entry):
+        """매니페스트 항목 -> [(ZIP 경로, 출력 파일 경로)] (ShardedZipSink.add에 그대로 전달)"""
+        return [(arcname, self._object_path(digest)) for arcname, digest, _ in entry['files']]
+
+    def write_zip(self, sink):
+        """기록한 모든 행의 출력을 ZipSink에 기록 (행 번호 순, 같은 입력이 반복된 행은 ZipSink가 한 번만 기록)"""
+        for entry in self.entries():
+            for arcname, path in self.entry_files(entry):
+                sink.write_file(path, arcname)
@@ -0,0 +1,344 @@
+# 일괄 처리 엔진 (여러 명 -> 프로세스 풀 -> 행 순서대로 결과)
+#
+# 입력 행(PersonRow)을 워커 프로세스로 나눠 보내 계산 + 렌더링을 워커에서 모두 처리
+#   -> 워커는 시작할 때 폰트/12지 이미지를 미리 로드 (init_render_worker)
+#   -> 결과(인코딩된 이미지 바이트)는 행 순서대로 반환 (ZIP 쓰기는 호출한 쪽 한 곳에서)
+#   -> 동시에 처리 중인 행 수를 제한해서 입력이 아무리 길어도 메모리는 일정
+# 1명 = 1작업 단위로 나누므로 인원이 워커 수보다 충분히 많으면 코어 수에 비례해서 빨라짐
+# 같은 출생 정보는 계산을, 같은 입력(이름 포함)은 렌더링을 한 번만 하고 결과를 나눠 줌
+import os
+import time
+from collections import OrderedDict, deque, namedtuple
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime
+
+import image_generator as ig
+from saju_calculator import (
+    calc_사주, calc_대운, calc_세운, calc_월운, calc_신살,
+    음력_to_양력, 양력_to_음력, 음력_문자열
+)
+
+# 차트 이름 -> ZIP 안 파일 이름 (확장자 제외)
+CHART_FILENAMES = {
+    '원국표': '01_원국표', '대운표': '02_대운표', '세운표': '03_세운표', '월운표': '04_월운표',
+    '오행차트': '05_오행분석', '십성표': '06_십성표', '신살표': '07_신살표', '12운성표': '08_12운성표',
+    '지장간표': '09_지장간표', '합충형파해표': '10_합충형파해표', '궁성표': '11_궁성표', '육친표': '12_육친표',
+    '납음오행표': '13_납음오행표', '격국표': '14_격국표', '공망표': '15_공망표', '용신표': '16_용신표',
+}
+
+# 출력 형식 (ZIP 안 확장자) -> 작업 렌더링 옵션 (image_generator._job_options)
+OUTPUT_FORMATS = {
+    'png': {},
+    'webp': {'encode': {'image_format': 'WEBP', 'quality': 90, 'method': 4}},
+    'jpg': {'encode': {'image_format': 'JPEG', 'quality': 90}, 'canvas_mode': 'RGB'},
+}
+
+# 출생 정보별 계산 결과 보관 수 / 재사용용 완료 결과 보관 바이트
+BIRTH_CACHE_SIZE = 4096
+DEDUP_CACHE_BYTES = 64 * 1024 * 1024
+
+# 한 명의 결과
+#   person: 입력 PersonRow
+#   files: [(ZIP 안 경로, 바이트)] (차트 순서대로)
+#   errors: [(차트 이름 또는 '계산', 오류 메시지)]
+BatchResult = namedtuple('BatchResult', ['person', 'files', 'errors'])
+
+
+def person_folder(person):
+    """ZIP 안 폴더 이름 (이름_생년-월-일, 입력한 날짜 기준)"""
+    return f"{person.이름}_{person.생년}-{person.생월:02d}-{person.생일:02d}"
+
+
+def normalize_person(person):
+    """같은 출생 정보가 같은 키가 되도록 정리 (양력이면 윤달 무시)"""
+    if person.음양력 == '양력' and person.윤달:
+        return person._replace(윤달=False)
+    return person
+
+
+def birth_key(person):
+    """계산 단계 키 (출생 정보 + 성별, 이름/행 번호 제외)"""
+    return (person.성별, person.생년, person.생월, person.생일, person.시, person.분,
+            person.음양력, person.윤달)
+
+
+def render_key(person):
+    """렌더링 단계 키 (행 번호를 뺀 모든 입력, 이름도 차트에 들어가므로 포함)"""
+    return tuple(person)[1:]
+
+
+def compute_birth(person, charts):
+    """
+    이름과 무관한 계산 결과 (양력 변환 + 사주/운)
+    대운/세운/월운은 해당 차트를 그릴 때만 계산
+    """
+    if person.음양력 == '음력':
+        year, month, day = 음력_to_양력(person.생년, person.생월, person.생일, person.윤달)
+        음력_str = 음력_문자열(person.생년, person.생월, person.생일, person.윤달)
+    else:
+        year, month, day = person.생년, person.생월, person.생일
+        음력_str = 음력_문자열(*양력_to_음력(year, month, day))
+    시, 분 = person.시, person.분
+    gender = '남' if person.성별 == '남성' else '여'
+
+    birth = {
+        '사주_data': calc_사주(year, month, day, 시, 분),
+        'gender': gender,
+        '양력': f"{year}-{month:02d}-{day:02d} {시:02d}:{분:02d}",
+        '음력': 음력_str,
+        'year': year,
+    }
+    birth['신살_data'] = calc_신살(birth['사주_data'], gender)
+    if '대운표' in charts:
+        birth['대운_data'] = calc_대운(year, month, day, 시, 분, gender)
+    if '세운표' in charts:
+        birth['세운_data'] = calc_세운(year, month, day, 시, 분)
+    if '월운표' in charts:
+        birth['월운_data'] = calc_월운(year, month, day, 시, 분)
+    return birth
+
+
+def person_job(person, charts, zodiac_path=None, birth=None, image_format='png'):
+    """PersonRow (+ compute_birth 결과) -> image_generator 작업 dict"""
+    if birth is None:
+        birth = compute_birth(person, charts)
+    job = {key: value for key, value in birth.items() if key not in ('양력', '음력', 'year')}
+    job.update({
+        '기본정보': {
+            '이름': person.이름,
+            '성별': person.성별,
+            '나이': datetime.now().year - birth['year'] + 1,
+            '양력': birth['양력'],
+            '음력': birth['음력'],
+        },
+        'zodiac_path': zodiac_path,
+        'charts': list(charts),
+    })
+    job.update(OUTPUT_FORMATS[image_format])
+    return job
+
+
+def render_files(job, folder, extension='png'):
+    """작업 하나 렌더링 -> ([(ZIP 안 경로, 바이트)], [(차트 이름, 오류)]) (워커 프로세스에서 실행)"""
+    files, errors = [], []
+    for name, data in ig.render_job(job).items():
+        if isinstance(data, bytes):
+            files.append((f"{folder}/{CHART_FILENAMES[name]}.{extension}", data))
+        else:
+            errors.append((name, data))
+    return files, errors
+
+
+def render_person(person, charts, zodiac_path=None, image_format='png'):
+    """한 명 계산 + 렌더링 -> BatchResult"""
+    try:
+        job = person_job(person, charts, zodiac_path, image_format=image_format)
+    except Exception as e:
+        return BatchResult(person, [], [('계산', f"Error: {e}")])
+    return BatchResult(person, *render_files(job, person_folder(person), image_format))
+
+
+class DedupStats:
+    """
+    일괄 처리 중복 제거 통계
+      rows: 처리한 인원
+      computed: 실제로 계산한 출생 정보 수 (나머지는 같은 출생 정보 재사용)
+      rendered: 실제로 렌더링한 인원 수 (나머지는 같은 입력 결과 재사용)
+    """
+
+    def __init__(self):
+        self.rows = 0
+        self.computed = 0
+        self.rendered = 0
+
+    @property
+    def compute_ratio(self):
+        """계산 중복 제거 비율 (0~1)"""
+        return 1 - self.computed / self.rows if self.rows else 0.0
+
+    @property
+    def render_ratio(self):
+        """렌더링 중복 제거 비율 (0~1)"""
+        return 1 - self.rendered / self.rows if self.rows else 0.0
+
+    def text(self):
+        return (f"{self.rows}명 중 계산 {self.computed}회 (중복 {self.compute_ratio:.1%}), "
+                f"렌더링 {self.rendered}회 (중복 {self.render_ratio:.1%})")
+
+
+class _ResultCache:
+    """완료된 렌더링 결과 LRU (바이트 합계 제한)"""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self._items = OrderedDict()
+        self._bytes = 0
+
+    def get(self, key):
+        result = self._items.get(key)
+        if result is not None:
+            self._items.move_to_end(key)
+        return result
+
+    def put(self, key, result):
+        size = sum(len(data) for _, data in result[0])
+        if size > self.max_bytes or key in self._items:
+            return
+        self._items[key] = result
+        self._bytes += size
+        while self._bytes > self.max_bytes:
+            _, (files, _) = self._items.popitem(last=False)
+            self._bytes -= sum(len(data) for _, data in files)
+
+
+def iter_batch(persons, charts, workers=None, backend='process', zodiac_path=None,
+               image_format='png', window=None, stats=None, dedup_bytes=DEDUP_CACHE_BYTES,
+               charts_for=None):
+    """
+    여러 명을 병렬로 처리해서 입력 순서대로 BatchResult를 반환하는 제너레이터
+
+    계산(양력 변환, 사주/운)은 이 프로세스에서 출생 정보별로 한 번만,
+    렌더링은 워커에서 같은 입력(이름 포함)별로 한 번만 하고 결과를 해당 행 모두에 나눠 줌
+
+    Args:
+        persons: PersonRow iterable (PersonReader 등, 끝까지 미리 읽지 않음)
+        charts: 생성할 차트 이름 목록
+        workers: 워커 수 (None이면 CPU 코어 수)
+        backend: 'process' | 'thread' | 'serial'
+        image_format: 'png' | 'webp' | 'jpg' (OUTPUT_FORMATS)
+        window: 동시에 처리 중인 최대 인원 (기본: 워커 수 x 4)
+            앞 사람이 늦게 끝나도 뒤 사람 작업이 멈추지 않을 만큼 여유를 둠
+        stats: DedupStats (중복 제거 통계를 채움)
+        dedup_bytes: 재사용하려고 보관하는 완료 결과의 최대 바이트 (렌더링 중인 것은 별도)
+        charts_for: person -> 그 행에서 만들 차트 목록 (charts의 일부, 예: BatchJob.retry_charts)
+    """
+    if backend not in ig.RENDER_BACKENDS:
+        raise ValueError(f"지원하지 않는 backend: {backend} (가능: {', '.join(ig.RENDER_BACKENDS)})")
+    if image_format not in OUTPUT_FORMATS:
+        raise ValueError(f"지원하지 않는 형식: {image_format} (가능: {', '.join(OUTPUT_FORMATS)})")
+    charts = list(charts)
+    workers = workers or os.cpu_count() or 1
+    stats = stats if stats is not None else DedupStats()
+
+    if backend == 'process':
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=ig.init_render_worker,
+                                       initargs=(zodiac_path,))
+    else:
+        ig.init_render_worker(zodiac_path)
+        executor = ThreadPoolExecutor(max_workers=workers) if backend == 'thread' else None
+
+    births = OrderedDict()  # 출생 정보 키 -> compute_birth 결과 (LRU)
+    finished = _ResultCache(dedup_bytes)
+    in_flight = {}  # 렌더링 키 -> Future
+    pending = deque()  # (person, 렌더링 키, Future 또는 완료 결과)
+
+    def submit(person):
+        person_charts = charts if charts_for is None else charts_for(person)
+        person = normalize_person(person)
+        stats.rows += 1
+        key = render_key(person)
+        if person_charts != charts:
+            key += (tuple(person_charts),)
+        result = finished.get(key)
+        if result is not None:
+            return person, key, result
+        if key in in_flight:
+            return person, key, in_flight[key]
+
+        bkey = birth_key(person)
+        try:
+            birth = births.get(bkey)
+            if birth is None:
+                birth = births[bkey] = compute_birth(person, charts)
+                stats.computed += 1
+                if len(births) > BIRTH_CACHE_SIZE:
+                    births.popitem(last=False)
+            else:
+                births.move_to_end(bkey)
+            job = person_job(person, person_charts, zodiac_path, birth, image_format)
+        except Exception as e:
+            return person, key, ([], [('계산', f"Error: {e}")])
+
+        stats.rendered += 1
+        args = (job, person_folder(person), image_format)
+        if executor is None:
+            result = render_files(*args)
+            finished.put(key, result)
+            return person, key, result
+        future = in_flight[key] = executor.submit(render_files, *args)
+        return person, key, future
+
+    def collect():
+        person, key, item = pending.popleft()
+        if isinstance(item, Future):
+            future, item = item, item.result()
+            if in_flight.get(key) is future:
+                del in_flight[key]
+                finished.put(key, item)
+        return BatchResult(person, *item)
+
+    window = window or workers * 4
+    try:
+        for person in persons:
+            pending.append(submit(person))
+            if len(pending) >= window:
+                yield collect()
+        while pending:
+            yield collect()
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+class BatchProgress:
+    """
+    처리량(명/초)과 남은 시간 추정
+    예) progress = BatchProgress(예상_인원)
+        progress.update(처리_인원) -> progress.fraction, progress.text()
+    """
+
+    def __init__(self, total=0):
+        self.total = total
+        self.done = 0
+        self.start = time.perf_counter()
+
+    def update(self, done):
+        self.done = done
+        # 예상 인원(빈 행 포함 추정치)보다 많이 처리했으면 추정치를 늘림
+        self.total = max(self.total, done)
+
+    @property
+    def elapsed(self):
+        return time.perf_counter() - self.start
+
+    @property
+    def rate(self):
+        """초당 처리 인원"""
+        elapsed = self.elapsed
+        return self.done / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def eta(self):
+        """남은 시간 (초, 추정 불가면 None)"""
+        rate = self.rate
+        if not rate:
+            return None
+        return max(self.total - self.done, 0) / rate
+
+    @property
+    def fraction(self):
+        return min(self.done / self.total, 1.0) if self.total else 0.0
+
+    def text(self):
+        eta = self.eta
+        남은_시간 = '계산 중' if eta is None else _format_seconds(eta)
+        return f"{self.done}/약 {self.total}명 · {self.rate:.1f}명/초 · 남은 시간 {남은_시간}"
+
+
+def _format_seconds(seconds):
+    seconds = int(round(seconds))
+    if seconds < 60:
+        return f"{seconds}초"
+    if seconds < 3600:
+        return f"{seconds // 60}분 {seconds % 60}초"
+    return f"{seconds // 3600}시간 {seconds % 3600 // 60}분"
@@ -0,0 +1,89 @@
+# 렌더링 벤치마크
+#   python bench_render.py svg        # PNG vs SVG 생성 시간/크기 비교
+#   python bench_render.py modes      # 캔버스 모드(RGBA/RGB/P)별 메모리/렌더링/인코딩 비교
+import gzip
+import io
+import os
+import sys
+import time
+
+import saju_calculator as sc
+import image_generator as ig
+
+ZODIAC_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'images', 'zodiac')
+
+
+def sample_job(year=1990, month=5, day=15, hour=14, minute=30, gender='남'):
+    """벤치마크용 작업 (1명, 전체 차트)"""
+    사주 = sc.calc_사주(year, month, day, hour, minute)
+    return {
+        '사주_data': 사주,
+        '대운_data': sc.calc_대운(year, month, day, hour, minute, gender),
+        '세운_data': sc.calc_세운(year, month, day, hour, minute, 기준년=2026),
+        '월운_data': sc.calc_월운(year, month, day, hour, minute, 기준년=2026, 기준월=1),
+        '기본정보': {'이름': '홍길동', '성별': gender, '양력': f'{year}-{month:02d}-{day:02d}', '음력': '-'},
+        '신살_data': sc.calc_신살(사주, gender),
+        'gender': gender,
+        'zodiac_path': ZODIAC_PATH,
+        'charts': list(ig.CHART_TASKS),
+    }
+
+
+def _timeit(func, repeat):
+    func()  # 워밍업 (폰트/스프라이트 로드)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    return (time.perf_counter() - start) / repeat, result
+
+
+def bench_svg(repeat=20):
+    """차트별 PNG 렌더링 vs SVG 생성"""
+    job = sample_job()
+    print(f"{'차트':<10} {'PNG ms':>8} {'SVG ms':>8} {'PNG KB':>8} {'SVG KB':>8} {'SVG gz KB':>10}")
+    totals = [0, 0, 0, 0, 0]
+    for name in ig.CHART_TASKS:
+        png_t, png = _timeit(lambda: ig.render_chart_bytes(name, job), repeat)
+        svg_t, svg = _timeit(lambda: ig.render_chart_svg(name, job), repeat)
+        svg = svg.encode('utf-8')
+        row = [png_t * 1000, svg_t * 1000, len(png) / 1024, len(svg) / 1024, len(gzip.compress(svg)) / 1024]
+        totals = [a + b for a, b in zip(totals, row)]
+        print(f"{name:<10} {row[0]:>8.2f} {row[1]:>8.2f} {row[2]:>8.1f} {row[3]:>8.1f} {row[4]:>10.1f}")
+    print(f"{'합계':<10} {totals[0]:>8.2f} {totals[1]:>8.2f} {totals[2]:>8.1f} {totals[3]:>8.1f} {totals[4]:>10.1f}")
+
+
+def bench_modes(repeat=10):
+    """캔버스 모드별 캔버스 메모리 / 렌더링(그리기+마무리) 시간 / PNG 인코딩 시간 / PNG 크기"""
+    job = sample_job()
+    modes = [('RGBA', {}), ('RGB', {}), ('P', {}), ('P64', {'colors': 64})]
+    print(f"{'모드':<6} {'캔버스 KB':>10} {'출력 KB':>8} {'렌더 ms':>8} {'인코딩 ms':>9} {'PNG KB':>8}")
+    for label, options in modes:
+        mode = label[:1] if label.startswith('P') else label
+        canvas_bytes = output_bytes = render_t = encode_t = png_bytes = 0
+        for name in ig.CHART_TASKS:
+            func, build_args = ig.CHART_TASKS[name]
+            with ig.canvas_mode(mode, **options):
+                t, img = _timeit(lambda: func(*build_args(job, None)), repeat)
+            buffer = io.BytesIO()
+            enc_t, _ = _timeit(lambda: (buffer.seek(0), buffer.truncate(), img.save(buffer, 'PNG')), repeat)
+            # 그리는 동안의 캔버스는 P 모드도 RGB (픽셀당 3바이트)
+            canvas_bytes += img.width * img.height * (3 if img.mode == 'P' else len(img.getbands()))
+            output_bytes += ig._image_nbytes(img)
+            render_t += t
+            encode_t += enc_t
+            png_bytes += len(buffer.getvalue())
+        print(f"{label:<6} {canvas_bytes / 1024:>10.0f} {output_bytes / 1024:>8.0f} {render_t * 1000:>8.2f}"
+              f" {encode_t * 1000:>9.2f} {png_bytes / 1024:>8.1f}")
+
+
+BENCHMARKS = {
+    'svg': bench_svg,
+    'modes': bench_modes,
+}
+
+
+if __name__ == '__main__':
+    names = sys.argv[1:] or list(BENCHMARKS)
+    for name in names:
+        print(f"== {name} ==")
+        BENCHMARKS[name]()
@@ -0,0 +1,122 @@
+# 선언형 표 레이아웃 엔진 (원국표/대운표/세운표/월운표/육친표 등 표 형태 차트 공용)
+#
+# 표 = 왼쪽 라벨 열 + 데이터 열 N개, 행마다 높이/라벨/셀 바인딩을 선언
+#   Table(label_width, cell_width, rows=(Row(...), ...))
+#   draw_table(draw, table, items, x, y, fonts)
+# 셀 바인딩은 (item, context) -> Cell(배경색, 텍스트들) 함수
+from collections import namedtuple
+from functools import lru_cache
+
+# 텍스트: pos='center'면 셀 세로 중앙 + dy, 'bottom'이면 셀 아래쪽 + dy
+Text = namedtuple('Text', ['value', 'font', 'fill', 'pos', 'dy'])
+Text.__new__.__defaults__ = ('center', 0)
+
+# 셀 내용: 배경색 + 텍스트 목록
+#   tile=True: 내용이 같으면 모양도 같은 셀 -> 타일로 한 번 그려서 붙여넣기 (draw_table의 tiles)
+Cell = namedtuple('Cell', ['fill', 'texts', 'tile'])
+Cell.__new__.__defaults__ = (False,)
+
+# 행 정의
+#   label: 라벨 문자열 / None(빈 라벨) / row_number를 받는 함수
+#   cell: (item, context) -> Cell
+Row = namedtuple('Row', ['height', 'label', 'label_fill', 'label_font', 'label_color', 'cell'])
+
+# 표 정의
+#   shape: 'rounded' (rounded_rectangle) | 'rect' (rectangle)
+Table = namedtuple('Table', ['label_width', 'cell_width', 'rows', 'border_color',
+                             'border_width', 'radius', 'shape'])
+Table.__new__.__defaults__ = ('#CCCCCC', 1, 5, 'rounded')
+
+
+@lru_cache(maxsize=256)
+def table_geometry(label_width, cell_width, row_heights, columns):
+    """
+    표 좌표를 한 번만 계산 (원점 기준, 레이아웃별 캐싱)
+
+    Returns:
+        (행별 (라벨 박스, 셀 박스들), 전체 높이)
+    """
+    rows = []
+    y = 0
+    for height in row_heights:
+        label_box = (0, y, label_width, y + height)
+        cell_boxes = tuple(
+            (label_width + i * cell_width, y, label_width + (i + 1) * cell_width, y + height)
+            for i in range(columns)
+        )
+        rows.append((label_box, cell_boxes))
+        y += height
+    return tuple(rows), y
+
+
+def table_height(table):
+    """표 전체 높이"""
+    return sum(row.height for row in table.rows)
+
+
+def _text_y(top, height, text):
+    base = top + height // 2 if text.pos == 'center' else top + height
+    return base + text.dy
+
+
+def _box(draw, table, xy, fill):
+    if table.shape == 'rounded':
+        draw.rounded_rectangle(xy, radius=table.radius, fill=fill,
+                               outline=table.border_color, width=table.border_width)
+    else:
+        draw.rectangle(xy, fill=fill, outline=table.border_color, width=table.border_width)
+
+
+def _cell_texts(draw, table, fonts, x0, y0, height, cell):
+    for text in cell.texts:
+        draw.text((x0 + table.cell_width // 2, _text_y(y0, height, text)),
+                  text.value, font=fonts[text.font], fill=text.fill, anchor='mm')
+
+
+def draw_table(draw, table, items, x, y, fonts, context=None, row_number=None, tiles=None):
+    """
+    표 그리기 -> 표 아래쪽 y 반환
+
+    Args:
+        items: 열마다 하나씩 (셀 바인딩에 전달)
+        fonts: 폰트 이름 -> 폰트 객체
+        context: 셀 바인딩에 함께 전달할 데이터
+        row_number: 라벨이 함수일 때 전달 (예: "1행")
+        tiles: tile=True 셀을 붙여넣는 함수 tiles(key, (x, y), (w, h), draw_cell)
+               draw_cell(draw)는 원점 기준으로 셀 하나를 그림 (None이면 직접 그림)
+
+    행 단위로 박스를 먼저 모두 그린 뒤 텍스트를 그림
+    (텍스트가 셀 안에 있으므로 셀별 교차 순서와 결과 동일)
+    """
+    geometry, total_height = table_geometry(
+        table.label_width, table.cell_width,
+        tuple(row.height for row in table.rows), len(items))
+
+    for row, (label_box, cell_boxes) in zip(table.rows, geometry):
+        label = row.label(row_number) if callable(row.label) else row.label
+        cells = [row.cell(item, context) for item in items]
+        tiled = [tiles is not None and cell.tile for cell in cells]
+
+        # 박스 (타일 셀은 박스+텍스트를 한 번에 붙여넣기)
+        lx0, ly0, lx1, ly1 = label_box
+        _box(draw, table, [x + lx0, y + ly0, x + lx1, y + ly1], row.label_fill)
+        for (cx0, cy0, cx1, cy1), cell, is_tile in zip(cell_boxes, cells, tiled):
+            if is_tile:
+                key = (cell, table.border_color, table.border_width, table.radius, table.shape,
+                       tuple(fonts[text.font] for text in cell.texts))
+                tiles(key, (x + cx0, y + cy0), (cx1 - cx0, cy1 - cy0),
+                      lambda d, cell=cell: (
+                          _box(d, table, [0, 0, table.cell_width, row.height], cell.fill),
+                          _cell_texts(d, table, fonts, 0, 0, row.height, cell)))
+            else:
+                _box(draw, table, [x + cx0, y + cy0, x + cx1, y + cy1], cell.fill)
+
+        # 텍스트
+        if label is not None:
+            draw.text((x + lx0 + table.label_width // 2, y + ly0 + row.height // 2), label,
+                      font=fonts[row.label_font], fill=row.label_color, anchor='mm')
+        for (cx0, cy0, cx1, cy1), cell, is_tile in zip(cell_boxes, cells, tiled):
+            if not is_tile:
+                _cell_texts(draw, table, fonts, x + cx0, y + cy0, row.height, cell)
+
+    return y + total_height
@@ -0,0 +1,237 @@
+# 그리기 연산 기록기 (프로파일러 + 최적화)
+#
+# ImageDraw 대신 그리기 연산을 기록해 두었다가 flush()에서 한 번에 실행
+#   - 최적화: 뒤에 그려지는 불투명 사각형에 완전히 가려지는 연산 제거,
+#             연속으로 같은 도형을 다시 그리는 연산 제거,
+#             이어 붙은 같은 색 사각형 채우기 병합
+#   - 통계: 차트별 연산 수 / 칠한 픽셀 수 / 연산 종류별 실행 시간
+import threading
+import time
+from collections import namedtuple
+from PIL import ImageColor, ImageDraw
+
+from text_layout import text_bbox
+
+# kind: 'rectangle' | 'rounded_rectangle' | 'ellipse' | 'line' | 'polygon' | 'text' | 'paste'
+Op = namedtuple('Op', ['kind', 'args', 'kwargs'])
+
+_SHAPES = ('rectangle', 'rounded_rectangle', 'ellipse', 'line', 'polygon')
+
+
+def _is_opaque(color):
+    if color is None:
+        return False
+    if isinstance(color, int):
+        return True
+    if isinstance(color, str):
+        try:
+            color = ImageColor.getrgb(color)
+        except ValueError:
+            return False
+    return len(color) < 4 or color[3] == 255
+
+
+def _box(xy):
+    """[x0, y0, x1, y1] 또는 [(x0, y0), (x1, y1)] -> (x0, y0, x1, y1)"""
+    if isinstance(xy[0], (tuple, list)):
+        (x0, y0), (x1, y1) = xy[0], xy[1]
+        return x0, y0, x1, y1
+    return tuple(xy[:4])
+
+
+def _points_box(xy, pad=0):
+    if isinstance(xy[0], (tuple, list)):
+        xs = [p[0] for p in xy]
+        ys = [p[1] for p in xy]
+    else:
+        xs, ys = xy[0::2], xy[1::2]
+    return min(xs) - pad, min(ys) - pad, max(xs) + pad, max(ys) + pad
+
+
+class DrawStats:
+    """차트별 그리기 통계 (스레드 안전 누적)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._charts = {}
+
+    def add(self, chart, counts, pixels, times, merged, dropped):
+        with self._lock:
+            entry = self._charts.setdefault(chart, {
+                'canvases': 0, 'ops': {}, 'pixels': {}, 'time': {}, 'merged': 0, 'dropped': 0,
+            })
+            entry['canvases'] += 1
+            entry['merged'] += merged
+            entry['dropped'] += dropped
+            for field, values in (('ops', counts), ('pixels', pixels), ('time', times)):
+                for kind, value in values.items():
+                    entry[field][kind] = entry[field].get(kind, 0) + value
+
+    def snapshot(self):
+        """차트 이름 -> 통계 (시간은 초)"""
+        with self._lock:
+            return {
+                chart: {
+                    'canvases': entry['canvases'],
+                    'ops': dict(entry['ops']),
+                    'pixels': dict(entry['pixels']),
+                    'time': {kind: round(t, 6) for kind, t in entry['time'].items()},
+                    'merged': entry['merged'],
+                    'dropped': entry['dropped'],
+                }
+                for chart, entry in self._charts.items()
+            }
+
+    def reset(self):
+        with self._lock:
+            self._charts.clear()
+
+
+DRAW_STATS = DrawStats()
+
+
+class DrawRecorder:
+    """
+    ImageDraw + Image.paste 호환 기록기
+    create_* 함수에서 img와 draw 대신 사용하고, 마지막에 flush()로 실제 이미지에 그림
+    """
+
+    def __init__(self, image, chart=None, optimize=True, stats=DRAW_STATS):
+        self.image = image
+        self.size = image.size
+        self.chart = chart or '-'
+        self.optimize = optimize
+        self.stats = stats
+        self.ops = []
+        self._draw = ImageDraw.Draw(image)
+
+    # ---------- 기록 ----------
+    def rectangle(self, xy, fill=None, outline=None, width=1):
+        self.ops.append(Op('rectangle', (xy,), {'fill': fill, 'outline': outline, 'width': width}))
+
+    def rounded_rectangle(self, xy, radius=0, fill=None, outline=None, width=1, **kwargs):
+        kwargs.update(radius=radius, fill=fill, outline=outline, width=width)
+        self.ops.append(Op('rounded_rectangle', (xy,), kwargs))
+
+    def ellipse(self, xy, fill=None, outline=None, width=1):
+        self.ops.append(Op('ellipse', (xy,), {'fill': fill, 'outline': outline, 'width': width}))
+
+    def line(self, xy, fill=None, width=0, **kwargs):
+        kwargs.update(fill=fill, width=width)
+        self.ops.append(Op('line', (xy,), kwargs))
+
+    def polygon(self, xy, fill=None, outline=None, width=1):
+        self.ops.append(Op('polygon', (xy,), {'fill': fill, 'outline': outline, 'width': width}))
+
+    def text(self, xy, text, *args, **kwargs):
+        self.ops.append(Op('text', (xy, text) + args, kwargs))
+
+    def paste(self, im, box=None, mask=None):
+        self.ops.append(Op('paste', (im, box or (0, 0), mask), {}))
+
+    # ---------- 최적화 ----------
+    def _bbox(self, op):
+        """연산이 칠할 수 있는 영역 (포함 좌표)"""
+        if op.kind in ('rectangle', 'rounded_rectangle', 'ellipse'):
+            return _box(op.args[0])
+        if op.kind in ('line', 'polygon'):
+            return _points_box(op.args[0], pad=(op.kwargs.get('width') or 1) // 2 + 1)
+        if op.kind == 'paste':
+            im, (x, y), _ = op.args
+            return x, y, x + im.size[0] - 1, y + im.size[1] - 1
+        (x, y), text = op.args[:2]
+        kw = op.kwargs
+        x0, y0, x1, y1 = text_bbox(text, kw.get('font'), kw.get('anchor'), kw.get('spacing', 4),
+                                   kw.get('align', 'left'))
+        # 소수 좌표 반올림 여유 1픽셀
+        return x + x0 - 1, y + y0 - 1, x + x1 + 1, y + y1 + 1
+
+    @staticmethod
+    def _is_cover(op):
+        """불투명 사각형 (영역 안을 완전히 덮음)"""
+        if op.kind != 'rectangle' or not _is_opaque(op.kwargs['fill']):
+            return False
+        outline = op.kwargs['outline']
+        return outline is None or _is_opaque(outline)
+
+    def _drop_hidden(self, ops):
+        """뒤의 불투명 사각형에 완전히 가려지는 연산 제거"""
+        covers = []
+        kept = []
+        for op in reversed(ops):
+            if covers:
+                x0, y0, x1, y1 = self._bbox(op)
+                if any(cx0 <= x0 and cy0 <= y0 and x1 <= cx1 and y1 <= cy1
+                       for cx0, cy0, cx1, cy1 in covers):
+                    continue
+            if self._is_cover(op):
+                covers.append(_box(op.args[0]))
+            kept.append(op)
+        kept.reverse()
+        return kept
+
+    @staticmethod
+    def _merge(prev, op):
+        """연속된 두 연산을 하나로 (불가능하면 None)"""
+        if op.kind != prev.kind or op.kind not in _SHAPES:
+            return None
+        # 같은 도형을 바로 다시 그림 (불투명이면 결과 동일)
+        if op == prev and _is_opaque(op.kwargs.get('fill')) and \
+                (op.kwargs.get('outline') is None or _is_opaque(op.kwargs.get('outline'))):
+            return prev
+        # 테두리 없는 같은 색 사각형이 가로/세로로 이어 붙음
+        if op.kind == 'rectangle' and op.kwargs['outline'] is None and prev.kwargs['outline'] is None \
+                and op.kwargs['fill'] == prev.kwargs['fill'] and _is_opaque(op.kwargs['fill']):
+            ax0, ay0, ax1, ay1 = _box(prev.args[0])
+            bx0, by0, bx1, by1 = _box(op.args[0])
+            if (ay0, ay1) == (by0, by1) and ax0 <= bx0 <= ax1 + 1:
+                return Op('rectangle', ([ax0, ay0, max(ax1, bx1), ay1],), prev.kwargs)
+            if (ax0, ax1) == (bx0, bx1) and ay0 <= by0 <= ay1 + 1:
+                return Op('rectangle', ([ax0, ay0, ax1, max(ay1, by1)],), prev.kwargs)
+        return None
+
+    def _merge_ops(self, ops):
+        merged = []
+        for op in ops:
+            if merged:
+                combined = self._merge(merged[-1], op)
+                if combined is not None:
+                    merged[-1] = combined
+                    continue
+            merged.append(op)
+        return merged
+
+    # ---------- 실행 ----------
+    def flush(self):
+        """기록된 연산을 최적화 후 실행 -> 실제 이미지 반환"""
+        ops = self.ops
+        self.ops = []
+        recorded = len(ops)
+
+        dropped = merged = 0
+        if self.optimize and ops:
+            visible = self._drop_hidden(ops)
+            dropped = recorded - len(visible)
+            ops = self._merge_ops(visible)
+            merged = len(visible) - len(ops)
+
+        width, height = self.size
+        counts, pixels, times = {}, {}, {}
+        draw = self._draw
+        for op in ops:
+            start = time.perf_counter()
+            if op.kind == 'paste':
+                self.image.paste(*op.args)
+            else:
+                getattr(draw, op.kind)(*op.args, **op.kwargs)
+            elapsed = time.perf_counter() - start
+
+            x0, y0, x1, y1 = self._bbox(op)
+            area = max(0, min(x1, width - 1) - max(x0, 0) + 1) * max(0, min(y1, height - 1) - max(y0, 0) + 1)
+            counts[op.kind] = counts.get(op.kind, 0) + 1
+            pixels[op.kind] = pixels.get(op.kind, 0) + int(area)
+            times[op.kind] = times.get(op.kind, 0.0) + elapsed
+
+        if self.stats is not None:
+            self.stats.add(self.chart, counts, pixels, times, merged, dropped)
+        return self.image
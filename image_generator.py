@@ -1,8 +1,24 @@
 # 사주 원국표 이미지 생성기
 from PIL import Image, ImageDraw, ImageFont
+import asyncio
+import atexit
+import contextvars
+import functools
+import inspect
+import io
 import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import ExitStack, contextmanager
 from functools import lru_cache
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import BrokenExecutor, ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+
+from render_cache import RenderCache, make_cache_key
+from chart_layout import Cell, Row, Table, Text, draw_table
+from svg_generator import SvgCanvas, SvgTarget
+from draw_recorder import DRAW_STATS, DrawRecorder
+from text_layout import fit_text, get_text_layout_stats, text_width, wrap_text
 
 # ============================================
 # 지지 이모지 및 동물 이름 매핑
@@ -20,13 +36,18 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 }
 
 # ============================================
-# 폰트 캐싱 (성능 최적화)
+# 폰트 관리 (성능 최적화)
 # ============================================
-_FONT_CACHE = {}
 _CHOSUN_PATH = None
 _BOLD_PATH = None
 _REGULAR_PATH = None
 
+_EMOJI_PATHS = [
+    "/usr/share/fonts/truetype/noto/NotoColorEmoji.ttf",
+    "/usr/share/fonts/truetype/ancient-scripts/Symbola_hint.ttf",
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+]
+
 def _init_font_paths():
     """폰트 경로 초기화 (한 번만 실행)"""
     global _CHOSUN_PATH, _BOLD_PATH, _REGULAR_PATH
@@ -66,50 +87,742 @@ def _init_font_paths():
 # 모듈 로드 시 폰트 경로 초기화
 _init_font_paths()
 
+@lru_cache(maxsize=1)
+def _default_font():
+    """폰트 파일이 없을 때 쓰는 기본 폰트 (같은 객체를 재사용해야 측정 캐시가 적중)"""
+    return ImageFont.load_default()
+
+
+class FontManager:
+    """
+    스레드 안전 폰트 캐시
+    - 키: (폰트 패밀리, 굵기, 크기)
+      ChosunGs도 굵기별 키 (ChosunGs를 못 읽으면 굵기에 따라 다른 폰트로 폴백)
+    - 같은 (폰트 파일, 크기)는 한 객체만 사용 (ChosunGs는 굵기가 하나뿐이라 두 키가 같은 객체)
+    - 같은 키는 동시에 요청돼도 한 번만 로드 (키별 잠금)
+    - 로드 횟수 / 로드 시간 / 적중 횟수 통계 (잠금 안에서 갱신)
+    """
+    
+    def __init__(self):
+        self._fonts = {}
+        self._files = {}
+        self._lock = threading.Lock()
+        self._key_locks = {}
+        self.load_count = 0
+        self.load_time = 0.0
+        self.hits = 0
+        self.misses = 0
+    
+    def _resolve(self, size, bold):
+        """요청 -> (캐시 키, 시도할 폰트 경로 목록)"""
+        weight = 'bold' if bold else 'regular'
+        fallback = _BOLD_PATH if bold else _REGULAR_PATH
+        if _CHOSUN_PATH:
+            # ChosunGs 우선 (실패 시 시스템 폰트로 폴백)
+            return ('ChosunGs', weight, size), [_CHOSUN_PATH, fallback]
+        return ('system', weight, size), [fallback]
+    
+    def _count_hit(self):
+        with self._lock:
+            self.hits += 1
+    
+    def _get(self, key, paths, size):
+        font = self._fonts.get(key)
+        if font is not None:
+            self._count_hit()
+            return font
+        
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        
+        with key_lock:
+            font = self._fonts.get(key)
+            if font is not None:
+                self._count_hit()
+                return font
+            
+            start = time.perf_counter()
+            font = self._load(paths, size)
+            with self._lock:
+                self.misses += 1
+                self.load_count += 1
+                self.load_time += time.perf_counter() - start
+            self._fonts[key] = font
+        return font
+    
+    def _load(self, paths, size):
+        for path in paths:
+            if not path or not os.path.exists(path):
+                continue
+            font = self._files.get((path, size))
+            if font is not None:
+                return font
+            try:
+                font = ImageFont.truetype(path, size)
+            except:
+                continue
+            return self._files.setdefault((path, size), font)
+        return None
+    
+    def get_font(self, size, bold=False):
+        key, paths = self._resolve(size, bold)
+        font = self._get(key, paths, size)
+        return font if font is not None else _default_font()
+    
+    def get_emoji_font(self, size):
+        return self._get(('emoji', 'regular', size), _EMOJI_PATHS, size)
+    
+    def __len__(self):
+        return len(self._fonts)
+    
+    def clear(self):
+        with self._lock:
+            self._fonts.clear()
+            self._files.clear()
+            self._key_locks.clear()
+    
+    def stats(self):
+        """폰트 캐시 통계"""
+        with self._lock:
+            return {
+                'fonts': len(self._fonts),
+                'keys': sorted(self._fonts, key=str),
+                'load_count': self.load_count,
+                'load_time': round(self.load_time, 4),
+                'hits': self.hits,
+                'misses': self.misses,
+            }
+
+
+FONT_MANAGER = FontManager()
+
+
 def get_font(size, bold=False):
     """폰트 캐싱으로 빠른 로드 (ChosunGs 우선)"""
-    cache_key = (size, bold)
+    target = _CANVAS_TARGET.get()
+    if target is not None and target.vector:
+        # SVG: 폰트 파일을 열지 않고 참조만 반환
+        key, paths = FONT_MANAGER._resolve(size, bold)
+        path = next((p for p in paths if p and os.path.exists(p)), None)
+        return target.font(key, path, size)
+    return FONT_MANAGER.get_font(_scaled_size(size), bold)
+
+
+def get_emoji_font(size):
+    """이모지 폰트 로드 (캐싱)"""
+    target = _CANVAS_TARGET.get()
+    if target is not None and target.vector:
+        path = next((p for p in _EMOJI_PATHS if os.path.exists(p)), None)
+        return target.font(('emoji', 'regular', size), path, size) if path else None
+    return FONT_MANAGER.get_emoji_font(_scaled_size(size))
+
+
+def layout_font(size, bold=False):
+    """텍스트 측정용 폰트 (배율/SVG와 관계없이 1배 레이아웃 픽셀 기준으로 측정)"""
+    return FONT_MANAGER.get_font(size, bold)
+
+
+def measure_width(text, size, bold=True):
+    """get_font(size, bold)로 그릴 텍스트의 폭 (측정 결과 캐싱)"""
+    return text_width(text, layout_font(size, bold))
+
+
+def wrap_lines(text, size, max_width, bold=True, max_lines=None):
+    """get_font(size, bold)로 그릴 텍스트를 max_width 안에 줄바꿈 (측정 결과 캐싱)"""
+    return wrap_text(text, layout_font(size, bold), max_width, max_lines)
+
+
+def fit_line(text, size, max_width, bold=True):
+    """get_font(size, bold)로 그릴 텍스트를 한 줄로 맞춤 (넘치면 말줄임표)"""
+    return fit_text(text, layout_font(size, bold), max_width)
+
+
+def _draw_lines(draw, xy, lines, font, fill, line_height):
+    """여러 줄을 xy 중심 기준으로 가운데 정렬"""
+    x, y = xy
+    top = y - line_height * (len(lines) - 1) / 2
+    for i, line in enumerate(lines):
+        draw.text((x, top + i * line_height), line, font=font, fill=fill, anchor='mm')
+
+# ============================================
+# 12지 이미지 캐싱 (디코딩/리사이즈 1회)
+# ============================================
+지지_이미지 = {
+    '자': 'rat.png', '축': 'ox.png', '인': 'tager.png', '묘': 'rabbit.png',
+    '진': 'dragon.png', '사': 'snake.png', '오': 'horse.png', '미': 'sheep.png',
+    '신': 'monkey.png', '유': 'rooster.png', '술': 'dog.png', '해': 'pig.png'
+}
+
+_ZODIAC_CACHE = {}
+
+def get_zodiac_sprite(zodiac_path, 지지_char, size=70):
+    """12지 이미지를 리사이즈된 상태로 캐싱하여 반환 (없으면 None)"""
+    target = _CANVAS_TARGET.get()
+    if target is not None and target.vector:
+        # SVG: 이미지 파일 참조만 반환 (디코딩 없음)
+        zodiac_file = os.path.join(zodiac_path, 지지_이미지.get(지지_char, ''))
+        return target.sprite(zodiac_file, size) if os.path.isfile(zodiac_file) else None
+    if target is None:
+        size = _scaled_size(size)
+    
+    cache_key = (zodiac_path, 지지_char, size)
+    
+    if cache_key in _ZODIAC_CACHE:
+        return _ZODIAC_CACHE[cache_key]
+    
+    sprite = None
+    if 지지_char in 지지_이미지:
+        zodiac_file = os.path.join(zodiac_path, 지지_이미지[지지_char])
+        if os.path.exists(zodiac_file):
+            try:
+                with Image.open(zodiac_file) as src:
+                    sprite = src.resize((size, size), Image.Resampling.LANCZOS)
+            except:
+                sprite = None
     
-    if cache_key in _FONT_CACHE:
-        return _FONT_CACHE[cache_key]
+    _ZODIAC_CACHE[cache_key] = sprite
+    return sprite
+
+def load_zodiac_sprites(zodiac_path, size=70):
+    """12지 이미지 전체 미리 로드 (워커 시작 시 호출)"""
+    for 지지_char in 지지_이미지:
+        get_zodiac_sprite(zodiac_path, 지지_char, size)
+    return sum(1 for key, sprite in _ZODIAC_CACHE.items() if key[0] == zodiac_path and sprite is not None)
+
+# ============================================
+# 캔버스 (모든 create_* 함수 공통)
+# ============================================
+# 기본: 차트마다 독립된 이미지 (canvas_mode로 RGBA/RGB/P 선택, 기본은 투명 RGBA)
+# 리포트 시트: 시트 캔버스의 지정 영역에 직접 그림 (중간 PNG 인코딩 없음)
+_CANVAS_TARGET = contextvars.ContextVar('_CANVAS_TARGET', default=None)
+
+# 해상도 배율 (레이아웃은 1배 기준 픽셀로 작성, 캔버스/폰트/선 굵기를 배율만큼 확대·축소)
+_RENDER_SCALE = contextvars.ContextVar('_RENDER_SCALE', default=1)
+
+
+@contextmanager
+def render_scale(scale):
+    """
+    이 블록 안에서 그리는 차트의 해상도 배율 지정
+    예) with render_scale(0.5): create_원국표(...)   # 미리보기
+        with render_scale(2): create_원국표(...)     # 인쇄용
+    (SVG 출력과 리포트 시트에는 적용 안 됨)
+    """
+    if scale <= 0:
+        raise ValueError(f"scale은 0보다 커야 합니다: {scale}")
+    token = _RENDER_SCALE.set(scale)
+    try:
+        yield
+    finally:
+        _RENDER_SCALE.reset(token)
+
+
+# 캔버스 모드 (mode, 배경색, 팔레트 색상 수)
+#   RGBA: 투명 배경 (기존 동작)
+#   RGB: 불투명 배경색 -> 픽셀당 3바이트, 붙여넣기 시 알파 합성 없음, JPEG 저장 가능
+#   P: RGB로 그린 뒤 마무리할 때 팔레트로 한 번 양자화 -> 픽셀당 1바이트, PNG 크기 감소
+CANVAS_MODES = ('RGBA', 'RGB', 'P')
+_CANVAS_MODE = contextvars.ContextVar('_CANVAS_MODE', default=('RGBA', None, 256))
+
+
+@contextmanager
+def canvas_mode(mode='RGBA', background='#FFFFFF', colors=256):
+    """
+    이 블록 안에서 그리는 차트의 캔버스 모드 지정
+    예) with canvas_mode('RGB'): create_원국표(...)            # 흰 배경
+        with canvas_mode('P', colors=64): create_원국표(...)   # 팔레트 PNG
+    (SVG 출력과 리포트 시트에는 적용 안 됨)
+    """
+    mode = mode.upper()
+    if mode not in CANVAS_MODES:
+        raise ValueError(f"지원하지 않는 캔버스 모드: {mode} (가능: {', '.join(CANVAS_MODES)})")
+    if not 2 <= colors <= 256:
+        raise ValueError(f"colors는 2~256이어야 합니다: {colors}")
+    token = _CANVAS_MODE.set((mode, None if mode == 'RGBA' else background,
+                              colors if mode == 'P' else 256))
+    try:
+        yield
+    finally:
+        _CANVAS_MODE.reset(token)
+
+
+def _raster_scale():
+    """현재 래스터 배율 (캔버스 대상이 지정된 경우는 1)"""
+    return _RENDER_SCALE.get() if _CANVAS_TARGET.get() is None else 1
+
+
+def _scaled_size(size):
+    """폰트/스프라이트 크기에 배율 적용"""
+    scale = _raster_scale()
+    return size if scale == 1 else max(1, round(size * scale))
+
+
+def _shift_xy(xy, dx, dy):
+    """좌표 이동 ([x0, y0, x1, y1] 또는 [(x, y), ...] 형식 모두 지원)"""
+    if isinstance(xy[0], (tuple, list)):
+        return [(x + dx, y + dy) for x, y in xy]
+    return [v + (dx if i % 2 == 0 else dy) for i, v in enumerate(xy)]
+
+
+class _OffsetDraw:
+    """ImageDraw 래퍼: 모든 좌표를 (dx, dy)만큼 이동해서 그림"""
     
-    # ChosunGs 폰트 우선 사용
-    if _CHOSUN_PATH:
-        try:
-            font = ImageFont.truetype(_CHOSUN_PATH, size)
-            _FONT_CACHE[cache_key] = font
-            return font
-        except:
-            pass
+    def __init__(self, draw, dx, dy):
+        self._draw = draw
+        self._dx = dx
+        self._dy = dy
     
-    # 폴백: 시스템 폰트
-    path = _BOLD_PATH if bold else _REGULAR_PATH
-    if path:
-        try:
-            font = ImageFont.truetype(path, size)
-            _FONT_CACHE[cache_key] = font
-            return font
-        except:
-            pass
+    def rectangle(self, xy, *args, **kwargs):
+        self._draw.rectangle(_shift_xy(xy, self._dx, self._dy), *args, **kwargs)
     
-    return ImageFont.load_default()
+    def rounded_rectangle(self, xy, *args, **kwargs):
+        self._draw.rounded_rectangle(_shift_xy(xy, self._dx, self._dy), *args, **kwargs)
+    
+    def ellipse(self, xy, *args, **kwargs):
+        self._draw.ellipse(_shift_xy(xy, self._dx, self._dy), *args, **kwargs)
+    
+    def line(self, xy, *args, **kwargs):
+        self._draw.line(_shift_xy(xy, self._dx, self._dy), *args, **kwargs)
+    
+    def polygon(self, xy, *args, **kwargs):
+        self._draw.polygon(_shift_xy(xy, self._dx, self._dy), *args, **kwargs)
+    
+    def text(self, xy, *args, **kwargs):
+        self._draw.text((xy[0] + self._dx, xy[1] + self._dy), *args, **kwargs)
 
-def get_emoji_font(size):
-    """이모지 폰트 로드"""
-    emoji_paths = [
-        "/usr/share/fonts/truetype/noto/NotoColorEmoji.ttf",
-        "/usr/share/fonts/truetype/ancient-scripts/Symbola_hint.ttf",
-        "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-    ]
+
+def _scale_xy(xy, scale):
+    """좌표 배율 적용 ([x0, y0, x1, y1] 또는 [(x, y), ...] 형식 모두 지원)"""
+    if isinstance(xy[0], (tuple, list)):
+        return [(x * scale, y * scale) for x, y in xy]
+    return [v * scale for v in xy]
+
+
+def _scale_width(width, scale):
+    """선 굵기 배율 적용 (0 = 가장 얇은 선은 그대로, 그 외는 최소 1픽셀)"""
+    return max(1, round(width * scale)) if width else width
+
+
+class _ScaledDraw:
+    """ImageDraw 래퍼: 1배 기준 좌표/굵기/반지름을 배율만큼 변환해서 그림"""
+    
+    def __init__(self, draw, scale):
+        self._draw = draw
+        self._scale = scale
+    
+    def rectangle(self, xy, fill=None, outline=None, width=1):
+        self._draw.rectangle(_scale_xy(xy, self._scale), fill=fill, outline=outline,
+                             width=_scale_width(width, self._scale))
+    
+    def rounded_rectangle(self, xy, radius=0, fill=None, outline=None, width=1, **kwargs):
+        self._draw.rounded_rectangle(_scale_xy(xy, self._scale), radius=radius * self._scale,
+                                     fill=fill, outline=outline,
+                                     width=_scale_width(width, self._scale), **kwargs)
+    
+    def ellipse(self, xy, fill=None, outline=None, width=1):
+        self._draw.ellipse(_scale_xy(xy, self._scale), fill=fill, outline=outline,
+                           width=_scale_width(width, self._scale))
+    
+    def line(self, xy, fill=None, width=0, **kwargs):
+        self._draw.line(_scale_xy(xy, self._scale), fill=fill,
+                        width=_scale_width(width, self._scale), **kwargs)
+    
+    def polygon(self, xy, fill=None, outline=None, width=1):
+        self._draw.polygon(_scale_xy(xy, self._scale), fill=fill, outline=outline,
+                           width=_scale_width(width, self._scale))
+    
+    def text(self, xy, text, *args, spacing=4, **kwargs):
+        # 폰트는 get_font()에서 이미 배율이 적용됨
+        self._draw.text((xy[0] * self._scale, xy[1] * self._scale), text, *args,
+                        spacing=spacing * self._scale, **kwargs)
+
+
+class _ScaledImage:
+    """배율 캔버스 (create_* 함수에서 img 대신 사용, paste 위치만 변환)"""
     
-    for path in emoji_paths:
-        if os.path.exists(path):
-            try:
-                return ImageFont.truetype(path, size)
-            except:
-                continue
+    def __init__(self, image, scale):
+        self.image = image
+        self._scale = scale
     
-    return None
+    def paste(self, im, box=None, mask=None):
+        box = box or (0, 0)
+        self.image.paste(im, (round(box[0] * self._scale), round(box[1] * self._scale)), mask)
+
+
+# 그리기 연산 기록 (draw_recorder): 차트별 통계 + 가려지는/중복 연산 제거
+_DRAW_RECORDER = {'enabled': True, 'optimize': True}
+_CURRENT_CHART = contextvars.ContextVar('_CURRENT_CHART', default=None)
+
+
+def configure_draw_recorder(enabled=True, optimize=True):
+    """
+    그리기 연산 기록 설정
+    enabled=False면 ImageDraw로 바로 그림 (통계 없음)
+    optimize=False면 기록한 그대로 실행 (통계만)
+    """
+    _DRAW_RECORDER.update(enabled=enabled, optimize=optimize)
+
+
+def get_draw_stats():
+    """차트별 그리기 통계 (연산 수 / 칠한 픽셀 수 / 연산 종류별 시간 / 병합·제거된 연산 수)"""
+    return DRAW_STATS.snapshot()
+
+
+def reset_draw_stats():
+    DRAW_STATS.reset()
+
+
+def _raster_canvas(img, scale, record=True):
+    """실제 이미지 -> create_* 함수가 쓰는 (img, draw)"""
+    if record and _DRAW_RECORDER['enabled']:
+        canvas = draw = DrawRecorder(img, _CURRENT_CHART.get(), _DRAW_RECORDER['optimize'])
+    else:
+        canvas, draw = img, ImageDraw.Draw(img)
+    if scale == 1:
+        return canvas, draw
+    return _ScaledImage(canvas, scale), _ScaledDraw(draw, scale)
+
+
+def _canvas_image(img):
+    """create_* 함수의 img -> 실제 PIL 이미지 (기록된 그리기 연산 실행)"""
+    if isinstance(img, _ScaledImage):
+        img = img.image
+    if isinstance(img, DrawRecorder):
+        img = img.flush()
+    return img
+
+
+class _CanvasRegion:
+    """시트 캔버스의 한 영역 (create_* 함수에서 img 대신 사용)"""
+    
+    def __init__(self, sheet, draw, x, y, width, height):
+        self.sheet = sheet
+        self.box = (x, y, x + width, y + height)
+        self.size = (width, height)
+        self._x = x
+        self._y = y
+        self.draw = _OffsetDraw(draw, x, y)
+    
+    def paste(self, im, box=None, mask=None):
+        box = box or (0, 0)
+        self.sheet.paste(im, (box[0] + self._x, box[1] + self._y), mask)
+
+
+class _NullDraw:
+    """크기 측정용: 아무것도 그리지 않음"""
+    
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+class _MeasureRegion(_CanvasRegion):
+    """크기 측정용 영역 (그리기 없이 차트 크기만 기록)"""
+    
+    def __init__(self, width, height):
+        self.sheet = None
+        self.box = (0, 0, width, height)
+        self.size = (width, height)
+        self.draw = _NullDraw()
+    
+    def paste(self, im, box=None, mask=None):
+        pass
+
+
+class _SheetTarget:
+    """리포트 시트 그리기 대상: 다음 차트가 그려질 위치를 지정"""
+    
+    vector = False
+    
+    def __init__(self, sheet=None, draw=None, x=0, y=0):
+        self.sheet = sheet
+        self.draw = draw
+        self.x = x
+        self.y = y
+        self.region = None
+    
+    def open_region(self, width, height):
+        if self.sheet is None:
+            self.region = _MeasureRegion(width, height)
+        else:
+            self.region = _CanvasRegion(self.sheet, self.draw, self.x, self.y, width, height)
+        return self.region, self.region.draw
+
+
+def _new_canvas(width, height):
+    """차트 캔버스 생성 -> (img, draw)"""
+    target = _CANVAS_TARGET.get()
+    if target is not None:
+        return target.open_region(width, height)
+    
+    scale = _RENDER_SCALE.get()
+    size = (width, height) if scale == 1 else (max(1, round(width * scale)), max(1, round(height * scale)))
+    mode, background, _ = _CANVAS_MODE.get()
+    if mode == 'RGBA':
+        img = Image.new('RGBA', size, (255, 255, 255, 0))
+    else:
+        # P 모드도 RGB로 그림 (팔레트 이미지에 직접 그리면 글자 안티앨리어싱이 꺼지고
+        # 타일/12지 이미지 붙여넣기 때 팔레트가 맞지 않음)
+        img = Image.new('RGB', size, background)
+    return _raster_canvas(img, scale)
+
+
+# 인코딩 옵션 (포맷 + Pillow save 인자)
+_ENCODE_OPTIONS = contextvars.ContextVar('_ENCODE_OPTIONS', default=('PNG', ()))
+
+
+@contextmanager
+def encode_options(image_format='PNG', **save_params):
+    """
+    이 블록 안에서 저장되는 차트의 인코딩 옵션 지정
+    예) with encode_options('WEBP', quality=90): create_원국표(...)
+    """
+    token = _ENCODE_OPTIONS.set((image_format.upper(), tuple(sorted(save_params.items()))))
+    try:
+        yield
+    finally:
+        _ENCODE_OPTIONS.reset(token)
+
+
+@contextmanager
+def svg_output(font_url=None, asset_url=None):
+    """
+    이 블록 안에서 호출한 create_* 함수는 PNG 대신 SVG를 생성
+    예) with svg_output(font_url='/static/fonts'): create_원국표(사주, 정보, '원국표.svg')
+    
+    Args:
+        font_url: @font-face에 쓸 폰트 기본 URL (None이면 font-family만, svg_generator.LOCAL_FILES면 로컬 경로)
+        asset_url: 12지 이미지 기본 URL (None이면 SVG에 포함, svg_generator.LOCAL_FILES면 로컬 경로)
+    """
+    token = _CANVAS_TARGET.set(SvgTarget(font_url, asset_url))
+    try:
+        yield
+    finally:
+        _CANVAS_TARGET.reset(token)
+
+
+def _finish_canvas(img, output_path):
+    """
+    캔버스 마무리
+    - output_path가 경로/파일 객체면 인코딩 옵션(기본 PNG)으로 저장 후 output_path 반환
+    - output_path가 None이면 PIL 이미지 그대로 반환 (인코딩 없음)
+    - 시트 영역이면 그려진 영역 좌표 반환
+    - SVG 캔버스면 SVG로 저장 (output_path가 None이면 SVG 문자열 반환)
+    """
+    if isinstance(img, _CanvasRegion):
+        return img.box
+    if isinstance(img, SvgCanvas):
+        if output_path is None:
+            return img.to_svg()
+        img.save(output_path)
+        return output_path
+    img = _canvas_image(img)
+    mode, _, colors = _CANVAS_MODE.get()
+    if mode == 'P':
+        img = img.quantize(colors, method=Image.Quantize.FASTOCTREE)
+    if output_path is None:
+        return img
+    image_format, save_params = _ENCODE_OPTIONS.get()
+    img.save(output_path, image_format, **dict(save_params))
+    return output_path
+
+
+# ============================================
+# 렌더링 결과 캐시 (모든 create_* 함수 앞단)
+# ============================================
+# 그리기 코드가 바뀌어 결과 이미지가 달라지면 올려야 함 (이전 캐시 무효화)
+RENDERER_VERSION = 2
+
+_RENDER_CACHE = None
+
+
+def configure_render_cache(cache_dir, max_bytes=512 * 1024 * 1024):
+    """렌더링 캐시 활성화 (cache_dir=None이면 비활성화)"""
+    global _RENDER_CACHE
+    _RENDER_CACHE = RenderCache(cache_dir, max_bytes) if cache_dir else None
+    return _RENDER_CACHE
+
+
+def get_render_cache_stats():
+    """렌더링 캐시 통계 (비활성화 상태면 None)"""
+    return _RENDER_CACHE.stats() if _RENDER_CACHE else None
+
+
+def _write_output(output_path, data):
+    """인코딩된 바이트를 경로 또는 파일 객체에 기록"""
+    if isinstance(output_path, (str, os.PathLike)):
+        with open(output_path, 'wb') as f:
+            f.write(data)
+    else:
+        output_path.write(data)
+
+
+def cached_render(chart_type, info_fields=('이름',)):
+    """
+    create_* 함수용 캐시 데코레이터
+    캐시 키 = (차트 종류, 입력 데이터, 실제로 그리는 기본정보 필드, 렌더러 버전, 인코딩 옵션, 배율, 캔버스 모드)
+    - 캐시 비활성화 / output_path=None / 시트 영역에 그릴 때는 그대로 실행
+    - 모든 create_* 함수에 scale 키워드 추가 (render_scale 블록과 동일)
+    - 모든 create_* 함수에 mode/background 키워드 추가 (canvas_mode 블록과 동일)
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+        
+        @functools.wraps(func)
+        def wrapper(*args, scale=None, mode=None, background=None, **kwargs):
+            if scale is not None:
+                with render_scale(scale):
+                    return wrapper(*args, mode=mode, background=background, **kwargs)
+            if mode is not None or background is not None:
+                current_mode, current_background, colors = _CANVAS_MODE.get()
+                with canvas_mode(mode or current_mode, background or current_background or '#FFFFFF',
+                                 colors):
+                    return wrapper(*args, **kwargs)
+            
+            # 그리기 통계용 차트 이름
+            token = _CURRENT_CHART.set(chart_type)
+            try:
+                return render(*args, **kwargs)
+            finally:
+                _CURRENT_CHART.reset(token)
+        
+        def render(*args, **kwargs):
+            cache = _RENDER_CACHE
+            if cache is None or _CANVAS_TARGET.get() is not None:
+                return func(*args, **kwargs)
+            
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            output_path = bound.arguments['output_path']
+            if output_path is None:
+                return func(*args, **kwargs)
+            
+            기본정보 = bound.arguments.get('기본정보') or {}
+            data = {k: v for k, v in bound.arguments.items() if k not in ('output_path', '기본정보')}
+            drawn_info = {field: 기본정보.get(field) for field in info_fields}
+            key = make_cache_key(chart_type, data, drawn_info, RENDERER_VERSION, _ENCODE_OPTIONS.get(),
+                                 _RENDER_SCALE.get(), _CANVAS_MODE.get())
+            
+            encoded = cache.get(key)
+            if encoded is None:
+                buffer = io.BytesIO()
+                bound.arguments['output_path'] = buffer
+                func(*bound.args, **bound.kwargs)
+                encoded = buffer.getvalue()
+                cache.put(key, encoded)
+            
+            _write_output(output_path, encoded)
+            return output_path
+        
+        return wrapper
+    return decorator
+
+
+# ============================================
+# 차트 본문 캐싱 (제목의 이름만 사람마다 다른 차트)
+# ============================================
+# 지장간표/12운성표/납음오행표/궁성표는 본문이 작은 키(일간, 원국 지지/간지)로만 결정됨
+# -> 키별로 본문을 한 번만 그리고, 복사본 위에 개인 제목만 그림
+_BODY_CACHE = OrderedDict()  # (차트, 키, 크기, 배율, 캔버스 모드) -> 본문 이미지 (오래된 것부터)
+_BODY_CACHE_LOCK = threading.Lock()
+_BODY_CACHE_MAX_BYTES = 256 * 1024 * 1024
+_BODY_CACHE_STATS = {'hits': 0, 'misses': 0, 'bytes': 0}
+
+
+def _image_nbytes(img):
+    return img.width * img.height * len(img.getbands())
+
+
+def _body_canvas(chart_type, key, width, height, draw_body):
+    """
+    본문이 그려진 캔버스 반환 -> (img, draw)
+    draw_body(draw, width, height, *key)는 key 외의 입력에 의존하면 안 됨
+    """
+    # 시트 영역에 그릴 때는 캐시 없이 바로 그림
+    if _CANVAS_TARGET.get() is not None:
+        img, draw = _new_canvas(width, height)
+        draw_body(draw, width, height, *key)
+        return img, draw
+    
+    scale = _RENDER_SCALE.get()
+    cache_key = (chart_type, key, width, height, scale, _CANVAS_MODE.get()[:2])
+    with _BODY_CACHE_LOCK:
+        body = _BODY_CACHE.get(cache_key)
+        if body is not None:
+            _BODY_CACHE.move_to_end(cache_key)
+            _BODY_CACHE_STATS['hits'] += 1
+    
+    if body is None:
+        body, body_draw = _new_canvas(width, height)
+        draw_body(body_draw, width, height, *key)
+        body = _canvas_image(body)
+        with _BODY_CACHE_LOCK:
+            _BODY_CACHE_STATS['misses'] += 1
+            if cache_key not in _BODY_CACHE:
+                _BODY_CACHE[cache_key] = body
+                _BODY_CACHE_STATS['bytes'] += _image_nbytes(body)
+            while _BODY_CACHE_STATS['bytes'] > _BODY_CACHE_MAX_BYTES and _BODY_CACHE:
+                _, old = _BODY_CACHE.popitem(last=False)
+                _BODY_CACHE_STATS['bytes'] -= _image_nbytes(old)
+    
+    return _raster_canvas(body.copy(), scale)
+
+
+def get_body_cache_stats():
+    """본문 캐시 통계"""
+    with _BODY_CACHE_LOCK:
+        return dict(_BODY_CACHE_STATS, entries=len(_BODY_CACHE))
+
+
+# ============================================
+# 표 셀 타일 캐싱 (천간/지지 색상 셀)
+# ============================================
+# 천간 10개 x 지지 12개 x 셀 크기 2~3가지 -> 셀을 한 번만 그리고 이후는 붙여넣기
+_TILE_CACHE = OrderedDict()  # (셀 키, 크기, 배율) -> 타일 이미지 (오래된 것부터)
+_TILE_CACHE_LOCK = threading.Lock()
+_TILE_CACHE_MAX_TILES = 4096
+_TILE_CACHE_STATS = {'hits': 0, 'misses': 0}
+
+
+def _get_tile(key, size, draw_cell):
+    """셀 타일 반환 (없으면 그려서 저장)"""
+    scale = _raster_scale()
+    cache_key = (key, size, scale)
+    with _TILE_CACHE_LOCK:
+        tile = _TILE_CACHE.get(cache_key)
+        if tile is not None:
+            _TILE_CACHE.move_to_end(cache_key)
+            _TILE_CACHE_STATS['hits'] += 1
+            return tile
+    
+    # 테두리가 오른쪽/아래 끝 픽셀까지 포함되므로 +1
+    width, height = size
+    tile = Image.new('RGBA', (int(width * scale) + 1, int(height * scale) + 1), (255, 255, 255, 0))
+    draw_cell(_raster_canvas(tile, scale, record=False)[1])
+    
+    with _TILE_CACHE_LOCK:
+        _TILE_CACHE_STATS['misses'] += 1
+        _TILE_CACHE[cache_key] = tile
+        while len(_TILE_CACHE) > _TILE_CACHE_MAX_TILES:
+            _TILE_CACHE.popitem(last=False)
+    return tile
+
+
+def _table_tiles(img):
+    """draw_table용 타일 붙여넣기 함수 (SVG/크기 측정 캔버스면 None -> 직접 그림)"""
+    if isinstance(img, (SvgCanvas, _MeasureRegion)):
+        return None
+    
+    def paste(key, xy, size, draw_cell):
+        tile = _get_tile(key, size, draw_cell)
+        img.paste(tile, xy, tile)
+    return paste
+
+
+def get_tile_cache_stats():
+    """셀 타일 캐시 통계"""
+    with _TILE_CACHE_LOCK:
+        return dict(_TILE_CACHE_STATS, entries=len(_TILE_CACHE))
+
 
 # ============================================
 # 색상 정의 (오행별)
@@ -173,21 +886,109 @@ def get_emoji_font(size):
 # 오행 한자
 오행_한자 = {'목': '木', '화': '火', '토': '土', '금': '金', '수': '水'}
 
+# ============================================
+# 표 레이아웃 정의 (chart_layout)
+# ============================================
+def _pillar_cell(글자, 종류, 보조, dy):
+    """천간/지지 셀 (오행 배경색 + 큰 글자 + 아래 보조 텍스트)"""
+    if 종류 == '천간':
+        오행, 한자 = 천간_오행_map[글자], 천간_한자[글자]
+    else:
+        오행, 한자 = 지지_오행_map[글자], 지지_한자[글자]
+    colors = 오행_색상[오행]
+    return Cell(colors[f'{종류}_bg'], (
+        Text(f"{글자}({한자})", 'large', colors['text'], 'center', dy),
+        Text(보조(오행) if callable(보조) else 보조, 'small', colors['text'], 'bottom', dy),
+    ), tile=True)
+
+
+def _원국_text_row(label, field, label_font='small'):
+    return Row(25, label, '#FAFAFA', label_font, '#666666',
+               lambda col, 사주: Cell('#FFFFFF', (Text(사주[field][col], 'small', '#666666'),)))
+
+
+def _원국_신살_cell(field, fill, color):
+    def cell(col, 신살_data):
+        names = 신살_data.get(field, {}).get(col, [])
+        if names:
+            return Cell(fill, (Text('\n'.join(names[:3]), 'small', color),))
+        return Cell(fill, (Text("-", 'sinsal', '#CCCCCC'),))
+    return cell
+
+
+# 원국표 (열: 시/일/월/년)
+원국_TABLE = Table(65, 120, (
+    Row(30, None, '#F5F5F5', 'medium', '#333333',
+        lambda col, 사주: Cell('#F5F5F5', (Text(f"생{col}", 'medium', '#333333'),))),
+    _원국_text_row("천간십성", '천간십성'),
+    Row(70, "천간", '#FAFAFA', 'medium', '#666666',
+        lambda col, 사주: _pillar_cell(사주[f'{col}주'][0], '천간', lambda 오행: 오행, -12)),
+    Row(70, "지지", '#FAFAFA', 'medium', '#666666',
+        lambda col, 사주: _pillar_cell(사주[f'{col}주'][1], '지지',
+                                       lambda 오행: f"{지지_동물[사주[f'{col}주'][1]]} {오행}", -12)),
+    _원국_text_row("지지십성", '지지십성'),
+    _원국_text_row("지장간", '지장간'),
+    _원국_text_row("12운성", '12운성'),
+    _원국_text_row("12신살", '12신살'),
+))
+
+원국_신살_TABLE = Table(65, 120, (
+    Row(50, "천간신살", '#FAFAFA', 'small', '#666666', _원국_신살_cell('천간신살', '#FFFEF0', '#1565C0')),
+    Row(50, "지지신살", '#FAFAFA', 'small', '#666666', _원국_신살_cell('지지신살', '#F0FFF0', '#E65100')),
+))
+
+원국_COLUMNS = ['시', '일', '월', '년']
+
+
+def _운_table(header, cell_width):
+    """대운/세운/월운 공용 표 (머리글 셀 텍스트만 다름)"""
+    return Table(55, cell_width, (
+        Row(28, lambda row_num: f"{row_num}행", '#E0E0E0', 'medium', '#333333',
+            lambda 운, ctx: Cell('#F5F5F5', (Text(header(운), 'medium', '#333333'),))),
+        Row(55, "천간", '#FAFAFA', 'medium', '#666666',
+            lambda 운, ctx: _pillar_cell(운['천간'], '천간', 운['천간_십성'], -8)),
+        Row(55, "지지", '#FAFAFA', 'medium', '#666666',
+            lambda 운, ctx: _pillar_cell(운['지지'], '지지', 운['지지_십성'], -8)),
+        Row(28, "12운성", '#FAFAFA', 'small', '#666666',
+            lambda 운, ctx: Cell('#FFFFFF', (Text(운.get('12운성', '-'), 'medium', '#555555'),))),
+        Row(28, "12신살", '#FAFAFA', 'small', '#666666',
+            lambda 운, ctx: Cell('#FFF8E1', (Text(운.get('12신살', '-'), 'medium', '#E65100'),))),
+    ), border_color='#AAAAAA')
+
+
+대운_TABLE = _운_table(lambda 운: f"{운['나이']}세", 85)
+세운_TABLE = _운_table(lambda 운: f"{운['년도']}년 ({운['나이']}세)", 100)
+월운_TABLE = _운_table(lambda 운: f"{운['년도']}.{운['월']:02d}월", 85)
+
+
+def _육친_row(행_이름, key):
+    if '십성' in 행_이름:
+        bg, field, color = '#FFFFFF', '십성', '#1565C0'
+    else:
+        bg, field, color = '#FFF8E1', '육친', '#E65100'
+    return Row(32, 행_이름[:4], '#F5F5F5', 'small', '#333333',
+               lambda col, 육친: Cell(bg, (Text(육친[col][key][field], 'medium', color),)))
+
+
+# 육친표 (열: 년/월/일/시, 각진 사각형)
+육친_TABLE = Table(55, 140, (
+    Row(28, '구분', '#E8E8E8', 'header', '#333333',
+        lambda col, 육친: Cell('#E8E8E8', (Text(f"{col}주", 'header', '#333333'),))),
+    _육친_row('천간십성', '천간'),
+    _육친_row('천간육친', '천간'),
+    _육친_row('지지십성', '지지'),
+    _육친_row('지지육친', '지지'),
+), shape='rect')
+
 # ============================================
 # 원국표 이미지 생성
 # ============================================
+@cached_render('원국표', ('이름', '양력', '음력'))
 def create_원국표(사주_data, 기본정보, output_path="원국표.png", 신살_data=None, zodiac_path=None):
     """
     원국표 이미지 생성 (큰 폰트, 확대 버전)
     """
     
-    # 12지 이미지 파일명 매핑
-    지지_이미지 = {
-        '자': 'rat.png', '축': 'ox.png', '인': 'tager.png', '묘': 'rabbit.png',
-        '진': 'dragon.png', '사': 'snake.png', '오': 'horse.png', '미': 'sheep.png',
-        '신': 'monkey.png', '유': 'rooster.png', '술': 'dog.png', '해': 'pig.png'
-    }
-    
     # 띠 이름 매핑
     지지_띠 = {
         '자': '쥐띠', '축': '소띠', '인': '호랑이띠', '묘': '토끼띠',
@@ -195,18 +996,12 @@ def create_원국표(사주_data, 기본정보, output_path="원국표.png", 신
         '신': '원숭이띠', '유': '닭띠', '술': '개띠', '해': '돼지띠'
     }
     
-    # 테두리 설정
-    border_color = '#CCCCCC'
-    border_width = 1
-    border_radius = 8
-    
     # 이미지 크기 (상하 여백 균형 조절)
     width = 600
     height = 580 if 신살_data else 465
     
     # 투명 배경
-    img = Image.new('RGBA', (width, height), (255, 255, 255, 0))
-    draw = ImageDraw.Draw(img)
+    img, draw = _new_canvas(width, height)
     
     # 폰트 (모두 bold)
     font_name = get_font(18, bold=True)
@@ -238,22 +1033,16 @@ def create_원국표(사주_data, 기본정보, output_path="원국표.png", 신
     
     # 12지 이미지 또는 동물 텍스트
     zodiac_loaded = False
-    if zodiac_path and 년지 in 지지_이미지:
-        try:
-            zodiac_file = os.path.join(zodiac_path, 지지_이미지[년지])
-            if os.path.exists(zodiac_file):
-                zodiac_img = Image.open(zodiac_file)
-                zodiac_size = 70
-                zodiac_img = zodiac_img.resize((zodiac_size, zodiac_size), Image.Resampling.LANCZOS)
-                zodiac_x = zodiac_center_x - zodiac_size // 2
-                zodiac_y = zodiac_center_y - zodiac_size // 2
-                if zodiac_img.mode == 'RGBA':
-                    img.paste(zodiac_img, (zodiac_x, zodiac_y), zodiac_img)
-                else:
-                    img.paste(zodiac_img, (zodiac_x, zodiac_y))
-                zodiac_loaded = True
-        except:
-            pass
+    zodiac_size = 70
+    zodiac_img = get_zodiac_sprite(zodiac_path, 년지, zodiac_size) if zodiac_path else None
+    if zodiac_img is not None:
+        zodiac_x = zodiac_center_x - zodiac_size // 2
+        zodiac_y = zodiac_center_y - zodiac_size // 2
+        if zodiac_img.mode == 'RGBA':
+            img.paste(zodiac_img, (zodiac_x, zodiac_y), zodiac_img)
+        else:
+            img.paste(zodiac_img, (zodiac_x, zodiac_y))
+        zodiac_loaded = True
     
     if not zodiac_loaded:
         동물명 = 지지_동물.get(년지, '')
@@ -281,224 +1070,16 @@ def create_원국표(사주_data, 기본정보, output_path="원국표.png", 신
     
     # ========== 원국표 테이블 ==========
     table_y = 105  # 상단 여백 조절
-    cell_width = 120
-    cell_height_header = 30
-    cell_height_main = 70
-    cell_height_sub = 25
-    cell_height_sinsal = 50
-    label_width = 65
-    
-    table_width = label_width + (cell_width * 4)
-    margin_x = (width - table_width) // 2
-    
-    headers = ['생시', '생일', '생월', '생년']
-    
-    # 헤더 행
-    draw.rounded_rectangle([margin_x, table_y, margin_x + label_width, table_y + cell_height_header],
-                           radius=5, fill='#F5F5F5', outline=border_color, width=border_width)
-    
-    for i, header in enumerate(headers):
-        x = margin_x + label_width + i * cell_width
-        draw.rounded_rectangle([x, table_y, x + cell_width, table_y + cell_height_header],
-                               radius=5, fill='#F5F5F5', outline=border_color, width=border_width)
-        draw.text((x + cell_width // 2, table_y + cell_height_header // 2), header, 
-                  font=font_medium, fill='#333333', anchor='mm')
-    
-    current_y = table_y + cell_height_header
-    
-    # 천간십성 행
-    draw.rounded_rectangle([margin_x, current_y, margin_x + label_width, current_y + cell_height_sub],
-                           radius=5, fill='#FAFAFA', outline=border_color, width=border_width)
-    draw.text((margin_x + label_width // 2, current_y + cell_height_sub // 2), "천간십성",
-              font=font_small, fill='#666666', anchor='mm')
-    
-    십성_list = [사주_data['천간십성']['시'], 사주_data['천간십성']['일'], 
-                사주_data['천간십성']['월'], 사주_data['천간십성']['년']]
-    
-    for i, 십성 in enumerate(십성_list):
-        x = margin_x + label_width + i * cell_width
-        draw.rounded_rectangle([x, current_y, x + cell_width, current_y + cell_height_sub],
-                               radius=5, fill='#FFFFFF', outline=border_color, width=border_width)
-        draw.text((x + cell_width // 2, current_y + cell_height_sub // 2), 십성,
-                  font=font_small, fill='#666666', anchor='mm')
-    
-    current_y += cell_height_sub
-    
-    # 천간 행
-    draw.rounded_rectangle([margin_x, current_y, margin_x + label_width, current_y + cell_height_main],
-                           radius=5, fill='#FAFAFA', outline=border_color, width=border_width)
-    draw.text((margin_x + label_width // 2, current_y + cell_height_main // 2), "천간",
-              font=font_medium, fill='#666666', anchor='mm')
-    
-    천간_list = [사주_data['시주'][0], 사주_data['일주'][0], 
-                사주_data['월주'][0], 사주_data['년주'][0]]
-    
-    for i, 천간 in enumerate(천간_list):
-        x = margin_x + label_width + i * cell_width
-        오행 = 천간_오행_map[천간]
-        bg_color = 오행_색상[오행]['천간_bg']
-        text_color = 오행_색상[오행]['text']
-        
-        draw.rounded_rectangle([x, current_y, x + cell_width, current_y + cell_height_main],
-                               radius=5, fill=bg_color, outline=border_color, width=border_width)
-        
-        한자 = 천간_한자[천간]
-        draw.text((x + cell_width // 2, current_y + cell_height_main // 2 - 12),
-                  f"{천간}({한자})", font=font_large, fill=text_color, anchor='mm')
-        draw.text((x + cell_width // 2, current_y + cell_height_main - 12),
-                  오행, font=font_small, fill=text_color, anchor='mm')
-    
-    current_y += cell_height_main
-    
-    # 지지 행
-    draw.rounded_rectangle([margin_x, current_y, margin_x + label_width, current_y + cell_height_main],
-                           radius=5, fill='#FAFAFA', outline=border_color, width=border_width)
-    draw.text((margin_x + label_width // 2, current_y + cell_height_main // 2), "지지",
-              font=font_medium, fill='#666666', anchor='mm')
-    
-    지지_list = [사주_data['시주'][1], 사주_data['일주'][1], 
-                사주_data['월주'][1], 사주_data['년주'][1]]
-    
-    for i, 지지 in enumerate(지지_list):
-        x = margin_x + label_width + i * cell_width
-        오행 = 지지_오행_map[지지]
-        bg_color = 오행_색상[오행]['지지_bg']
-        text_color = 오행_색상[오행]['text']
-        
-        draw.rounded_rectangle([x, current_y, x + cell_width, current_y + cell_height_main],
-                               radius=5, fill=bg_color, outline=border_color, width=border_width)
-        
-        한자 = 지지_한자[지지]
-        동물 = 지지_동물[지지]
-        draw.text((x + cell_width // 2, current_y + cell_height_main // 2 - 12),
-                  f"{지지}({한자})", font=font_large, fill=text_color, anchor='mm')
-        draw.text((x + cell_width // 2, current_y + cell_height_main - 12),
-                  f"{동물} {오행}", font=font_small, fill=text_color, anchor='mm')
-    
-    current_y += cell_height_main
-    
-    # 지지십성 행
-    draw.rounded_rectangle([margin_x, current_y, margin_x + label_width, current_y + cell_height_sub],
-                           radius=5, fill='#FAFAFA', outline=border_color, width=border_width)
-    draw.text((margin_x + label_width // 2, current_y + cell_height_sub // 2), "지지십성",
-              font=font_small, fill='#666666', anchor='mm')
-    
-    지지십성_list = [사주_data['지지십성']['시'], 사주_data['지지십성']['일'], 
-                   사주_data['지지십성']['월'], 사주_data['지지십성']['년']]
-    
-    for i, 십성 in enumerate(지지십성_list):
-        x = margin_x + label_width + i * cell_width
-        draw.rounded_rectangle([x, current_y, x + cell_width, current_y + cell_height_sub],
-                               radius=5, fill='#FFFFFF', outline=border_color, width=border_width)
-        draw.text((x + cell_width // 2, current_y + cell_height_sub // 2), 십성,
-                  font=font_small, fill='#666666', anchor='mm')
-    
-    current_y += cell_height_sub
-    
-    # 지장간 행
-    draw.rounded_rectangle([margin_x, current_y, margin_x + label_width, current_y + cell_height_sub],
-                           radius=5, fill='#FAFAFA', outline=border_color, width=border_width)
-    draw.text((margin_x + label_width // 2, current_y + cell_height_sub // 2), "지장간",
-              font=font_small, fill='#666666', anchor='mm')
-    
-    지장간_list = [사주_data['지장간']['시'], 사주_data['지장간']['일'], 
-                 사주_data['지장간']['월'], 사주_data['지장간']['년']]
-    
-    for i, 지장간 in enumerate(지장간_list):
-        x = margin_x + label_width + i * cell_width
-        draw.rounded_rectangle([x, current_y, x + cell_width, current_y + cell_height_sub],
-                               radius=5, fill='#FFFFFF', outline=border_color, width=border_width)
-        draw.text((x + cell_width // 2, current_y + cell_height_sub // 2), 지장간,
-                  font=font_small, fill='#666666', anchor='mm')
-    
-    current_y += cell_height_sub
-    
-    # 12운성 행
-    draw.rounded_rectangle([margin_x, current_y, margin_x + label_width, current_y + cell_height_sub],
-                           radius=5, fill='#FAFAFA', outline=border_color, width=border_width)
-    draw.text((margin_x + label_width // 2, current_y + cell_height_sub // 2), "12운성",
-              font=font_small, fill='#666666', anchor='mm')
+    margin_x = (width - (원국_TABLE.label_width + 원국_TABLE.cell_width * 4)) // 2
+    fonts = {'large': font_large, 'medium': font_medium, 'small': font_small, 'sinsal': font_sinsal}
     
-    운성_list = [사주_data['12운성']['시'], 사주_data['12운성']['일'], 
-               사주_data['12운성']['월'], 사주_data['12운성']['년']]
-    
-    for i, 운성 in enumerate(운성_list):
-        x = margin_x + label_width + i * cell_width
-        draw.rounded_rectangle([x, current_y, x + cell_width, current_y + cell_height_sub],
-                               radius=5, fill='#FFFFFF', outline=border_color, width=border_width)
-        draw.text((x + cell_width // 2, current_y + cell_height_sub // 2), 운성,
-                  font=font_small, fill='#666666', anchor='mm')
-    
-    current_y += cell_height_sub
-    
-    # 12신살 행
-    draw.rounded_rectangle([margin_x, current_y, margin_x + label_width, current_y + cell_height_sub],
-                           radius=5, fill='#FAFAFA', outline=border_color, width=border_width)
-    draw.text((margin_x + label_width // 2, current_y + cell_height_sub // 2), "12신살",
-              font=font_small, fill='#666666', anchor='mm')
-    
-    신살_list = [사주_data['12신살']['시'], 사주_data['12신살']['일'], 
-               사주_data['12신살']['월'], 사주_data['12신살']['년']]
-    
-    for i, 신살 in enumerate(신살_list):
-        x = margin_x + label_width + i * cell_width
-        draw.rounded_rectangle([x, current_y, x + cell_width, current_y + cell_height_sub],
-                               radius=5, fill='#FFFFFF', outline=border_color, width=border_width)
-        draw.text((x + cell_width // 2, current_y + cell_height_sub // 2), 신살,
-                  font=font_small, fill='#666666', anchor='mm')
-    
-    current_y += cell_height_sub
+    current_y = draw_table(draw, 원국_TABLE, 원국_COLUMNS, margin_x, table_y, fonts, 사주_data,
+                           tiles=_table_tiles(img))
     
     # 신살 데이터 있으면 추가 표시
     if 신살_data:
-        current_y += 10
-        
-        # 천간신살 행
-        draw.rounded_rectangle([margin_x, current_y, margin_x + label_width, current_y + cell_height_sinsal],
-                               radius=5, fill='#FAFAFA', outline=border_color, width=border_width)
-        draw.text((margin_x + label_width // 2, current_y + cell_height_sinsal // 2), "천간신살",
-                  font=font_small, fill='#666666', anchor='mm')
-        
-        천간_columns = ['시', '일', '월', '년']
-        for i, col in enumerate(천간_columns):
-            x = margin_x + label_width + i * cell_width
-            draw.rounded_rectangle([x, current_y, x + cell_width, current_y + cell_height_sinsal],
-                                   radius=5, fill='#FFFEF0', outline=border_color, width=border_width)
-            
-            천간_신살_dict = 신살_data.get('천간신살', {})
-            천간_신살_list = 천간_신살_dict.get(col, [])
-            if 천간_신살_list:
-                text = '\n'.join(천간_신살_list[:3])
-                draw.text((x + cell_width // 2, current_y + cell_height_sinsal // 2), text,
-                          font=get_font(12, bold=True), fill='#1565C0', anchor='mm')
-            else:
-                draw.text((x + cell_width // 2, current_y + cell_height_sinsal // 2), "-",
-                          font=font_sinsal, fill='#CCCCCC', anchor='mm')
-        
-        current_y += cell_height_sinsal
-        
-        # 지지신살 행
-        draw.rounded_rectangle([margin_x, current_y, margin_x + label_width, current_y + cell_height_sinsal],
-                               radius=5, fill='#FAFAFA', outline=border_color, width=border_width)
-        draw.text((margin_x + label_width // 2, current_y + cell_height_sinsal // 2), "지지신살",
-                  font=font_small, fill='#666666', anchor='mm')
-        
-        for i, col in enumerate(천간_columns):
-            x = margin_x + label_width + i * cell_width
-            draw.rounded_rectangle([x, current_y, x + cell_width, current_y + cell_height_sinsal],
-                                   radius=5, fill='#F0FFF0', outline=border_color, width=border_width)
-            
-            지지_신살_dict = 신살_data.get('지지신살', {})
-            지지_신살_list = 지지_신살_dict.get(col, [])
-            if 지지_신살_list:
-                text = '\n'.join(지지_신살_list[:3])
-                draw.text((x + cell_width // 2, current_y + cell_height_sinsal // 2), text,
-                          font=get_font(12, bold=True), fill='#E65100', anchor='mm')
-            else:
-                draw.text((x + cell_width // 2, current_y + cell_height_sinsal // 2), "-",
-                          font=font_sinsal, fill='#CCCCCC', anchor='mm')
-        
-        current_y += cell_height_sinsal
+        current_y = draw_table(draw, 원국_신살_TABLE, 원국_COLUMNS, margin_x, current_y + 10,
+                               fonts, 신살_data)
     
     # 하단 오행 요약
     current_y += 20
@@ -508,8 +1089,7 @@ def create_원국표(사주_data, 기본정보, output_path="원국표.png", 신
         draw.text((width // 2, current_y), summary, font=font_medium, fill='#666666', anchor='mm')
     
     # 저장
-    img.save(output_path, 'PNG')
-    return output_path
+    return _finish_canvas(img, output_path)
 
 
 # ============================================
@@ -517,6 +1097,7 @@ def create_원국표(사주_data, 기본정보, output_path="원국표.png", 신
 # ============================================# ============================================
 # 대운표 이미지 생성
 # ============================================
+@cached_render('대운표')
 def create_대운표(대운_data, 기본정보, output_path="대운표.png"):
     """
     대운표 이미지 생성 (2행 구조, 투명 배경)
@@ -549,8 +1130,7 @@ def create_대운표(대운_data, 기본정보, output_path="대운표.png"):
     height = vertical_margin * 2 + title_area + row_height * 2 + row_gap
     
     # 투명 배경
-    img = Image.new('RGBA', (width, height), (255, 255, 255, 0))
-    draw = ImageDraw.Draw(img)
+    img, draw = _new_canvas(width, height)
     
     # 폰트 (축소)
     font_title = get_font(24, bold=True)
@@ -559,9 +1139,6 @@ def create_대운표(대운_data, 기본정보, output_path="대운표.png"):
     font_medium = get_font(12, bold=True)
     font_small = get_font(10, bold=True)
     
-    border_color = '#AAAAAA'
-    border_width = 1
-    
     # 제목
     title_y = vertical_margin + 18
     subtitle_y = vertical_margin + 38
@@ -569,103 +1146,13 @@ def create_대운표(대운_data, 기본정보, output_path="대운표.png"):
     draw.text((width // 2, title_y), f"{기본정보['이름']}님 대운표", font=font_title, fill='#333333', anchor='mm')
     draw.text((width // 2, subtitle_y), f"대운수: {대운수}세 시작 | {방향}", font=font_subtitle, fill='#666666', anchor='mm')
     
+    fonts = {'large': font_large, 'medium': font_medium, 'small': font_small}
+    
+    tiles = _table_tiles(img)
+    
     def draw_대운_row(대운_list, start_y, row_num):
-        current_y = start_y
-        start_x = margin
-        
-        # 나이 행
-        draw.rounded_rectangle([start_x, current_y, start_x + label_width, current_y + cell_height_small],
-                               radius=5, fill='#E0E0E0', outline=border_color, width=border_width)
-        draw.text((start_x + label_width // 2, current_y + cell_height_small // 2),
-                  f"{row_num}행", font=font_medium, fill='#333333', anchor='mm')
-        
-        for i, 대운 in enumerate(대운_list):
-            x = start_x + label_width + i * cell_width
-            draw.rounded_rectangle([x, current_y, x + cell_width, current_y + cell_height_small],
-                                   radius=5, fill='#F5F5F5', outline=border_color, width=border_width)
-            draw.text((x + cell_width // 2, current_y + cell_height_small // 2),
-                      f"{대운['나이']}세", font=font_medium, fill='#333333', anchor='mm')
-        
-        current_y += cell_height_small
-        
-        # 천간 행
-        draw.rounded_rectangle([start_x, current_y, start_x + label_width, current_y + cell_height_main],
-                               radius=5, fill='#FAFAFA', outline=border_color, width=border_width)
-        draw.text((start_x + label_width // 2, current_y + cell_height_main // 2),
-                  "천간", font=font_medium, fill='#666666', anchor='mm')
-        
-        for i, 대운 in enumerate(대운_list):
-            x = start_x + label_width + i * cell_width
-            천간 = 대운['천간']
-            오행 = 천간_오행_map[천간]
-            bg_color = 오행_색상[오행]['천간_bg']
-            text_color = 오행_색상[오행]['text']
-            
-            draw.rounded_rectangle([x, current_y, x + cell_width, current_y + cell_height_main],
-                                   radius=5, fill=bg_color, outline=border_color, width=border_width)
-            
-            한자 = 천간_한자[천간]
-            draw.text((x + cell_width // 2, current_y + cell_height_main // 2 - 8),
-                      f"{천간}({한자})", font=font_large, fill=text_color, anchor='mm')
-            draw.text((x + cell_width // 2, current_y + cell_height_main - 8),
-                      대운['천간_십성'], font=font_small, fill=text_color, anchor='mm')
-        
-        current_y += cell_height_main
-        
-        # 지지 행
-        draw.rounded_rectangle([start_x, current_y, start_x + label_width, current_y + cell_height_main],
-                               radius=5, fill='#FAFAFA', outline=border_color, width=border_width)
-        draw.text((start_x + label_width // 2, current_y + cell_height_main // 2),
-                  "지지", font=font_medium, fill='#666666', anchor='mm')
-        
-        for i, 대운 in enumerate(대운_list):
-            x = start_x + label_width + i * cell_width
-            지지 = 대운['지지']
-            오행 = 지지_오행_map[지지]
-            bg_color = 오행_색상[오행]['지지_bg']
-            text_color = 오행_색상[오행]['text']
-            
-            draw.rounded_rectangle([x, current_y, x + cell_width, current_y + cell_height_main],
-                                   radius=5, fill=bg_color, outline=border_color, width=border_width)
-            
-            한자 = 지지_한자[지지]
-            draw.text((x + cell_width // 2, current_y + cell_height_main // 2 - 8),
-                      f"{지지}({한자})", font=font_large, fill=text_color, anchor='mm')
-            draw.text((x + cell_width // 2, current_y + cell_height_main - 8),
-                      대운['지지_십성'], font=font_small, fill=text_color, anchor='mm')
-        
-        current_y += cell_height_main
-        
-        # 12운성 행
-        draw.rounded_rectangle([start_x, current_y, start_x + label_width, current_y + cell_height_small],
-                               radius=5, fill='#FAFAFA', outline=border_color, width=border_width)
-        draw.text((start_x + label_width // 2, current_y + cell_height_small // 2),
-                  "12운성", font=font_small, fill='#666666', anchor='mm')
-        
-        for i, 대운 in enumerate(대운_list):
-            x = start_x + label_width + i * cell_width
-            draw.rounded_rectangle([x, current_y, x + cell_width, current_y + cell_height_small],
-                                   radius=5, fill='#FFFFFF', outline=border_color, width=border_width)
-            draw.text((x + cell_width // 2, current_y + cell_height_small // 2),
-                      대운['12운성'], font=font_medium, fill='#555555', anchor='mm')
-        
-        current_y += cell_height_small
-        
-        # 12신살 행
-        draw.rounded_rectangle([start_x, current_y, start_x + label_width, current_y + cell_height_small],
-                               radius=5, fill='#FAFAFA', outline=border_color, width=border_width)
-        draw.text((start_x + label_width // 2, current_y + cell_height_small // 2),
-                  "12신살", font=font_small, fill='#666666', anchor='mm')
-        
-        for i, 대운 in enumerate(대운_list):
-            x = start_x + label_width + i * cell_width
-            신살 = 대운.get('12신살', '-')
-            draw.rounded_rectangle([x, current_y, x + cell_width, current_y + cell_height_small],
-                                   radius=5, fill='#FFF8E1', outline=border_color, width=border_width)
-            draw.text((x + cell_width // 2, current_y + cell_height_small // 2),
-                      신살, font=font_medium, fill='#E65100', anchor='mm')
-        
-        return current_y + cell_height_small
+        return draw_table(draw, 대운_TABLE, 대운_list, margin, start_y, fonts, row_number=row_num,
+                          tiles=tiles)
     
     # 테이블 시작
     table_start_y = vertical_margin + title_area
@@ -677,8 +1164,7 @@ def create_대운표(대운_data, 기본정보, output_path="대운표.png"):
     y2_end = draw_대운_row(row2, y1_end + row_gap, 2)
     
     # 저장
-    img.save(output_path, 'PNG')
-    return output_path
+    return _finish_canvas(img, output_path)
 
 
 # ============================================
@@ -686,6 +1172,7 @@ def create_대운표(대운_data, 기본정보, output_path="대운표.png"):
 # ============================================# ============================================
 # 세운표 이미지 생성
 # ============================================
+@cached_render('세운표')
 def create_세운표(세운_data, 기본정보, output_path="세운표.png"):
     """
     세운표 이미지 생성 (2행 구조, 투명 배경)
@@ -716,8 +1203,7 @@ def create_세운표(세운_data, 기본정보, output_path="세운표.png"):
     height = vertical_margin * 2 + title_area + row_height * 2 + row_gap
     
     # 투명 배경
-    img = Image.new('RGBA', (width, height), (255, 255, 255, 0))
-    draw = ImageDraw.Draw(img)
+    img, draw = _new_canvas(width, height)
     
     # 폰트 (축소)
     font_title = get_font(24, bold=True)
@@ -726,113 +1212,19 @@ def create_세운표(세운_data, 기본정보, output_path="세운표.png"):
     font_medium = get_font(12, bold=True)
     font_small = get_font(10, bold=True)
     
-    border_color = '#AAAAAA'
-    border_width = 1
-    
     # 제목
     title_y = vertical_margin + 18
     subtitle_y = vertical_margin + 38
     draw.text((width // 2, title_y), f"{기본정보['이름']}님 세운표", font=font_title, fill='#333333', anchor='mm')
     draw.text((width // 2, subtitle_y), f"{세운_list[0]['년도']}년 ~ {세운_list[-1]['년도']}년 (10년)", font=font_subtitle, fill='#666666', anchor='mm')
     
+    fonts = {'large': font_large, 'medium': font_medium, 'small': font_small}
+    
+    tiles = _table_tiles(img)
+    
     def draw_세운_row(세운_list, start_y, row_num):
-        current_y = start_y
-        start_x = margin
-        
-        # 년도/나이 행
-        draw.rounded_rectangle([start_x, current_y, start_x + label_width, current_y + cell_height_small],
-                               radius=5, fill='#E0E0E0', outline=border_color, width=border_width)
-        draw.text((start_x + label_width // 2, current_y + cell_height_small // 2),
-                  f"{row_num}행", font=font_medium, fill='#333333', anchor='mm')
-        
-        for i, 세운 in enumerate(세운_list):
-            x = start_x + label_width + i * cell_width
-            draw.rounded_rectangle([x, current_y, x + cell_width, current_y + cell_height_small],
-                                   radius=5, fill='#F5F5F5', outline=border_color, width=border_width)
-            draw.text((x + cell_width // 2, current_y + cell_height_small // 2),
-                      f"{세운['년도']}년 ({세운['나이']}세)", font=font_medium, fill='#333333', anchor='mm')
-        
-        current_y += cell_height_small
-        
-        # 천간 행
-        draw.rounded_rectangle([start_x, current_y, start_x + label_width, current_y + cell_height_main],
-                               radius=5, fill='#FAFAFA', outline=border_color, width=border_width)
-        draw.text((start_x + label_width // 2, current_y + cell_height_main // 2),
-                  "천간", font=font_medium, fill='#666666', anchor='mm')
-        
-        for i, 세운 in enumerate(세운_list):
-            x = start_x + label_width + i * cell_width
-            천간 = 세운['천간']
-            오행 = 천간_오행_map[천간]
-            bg_color = 오행_색상[오행]['천간_bg']
-            text_color = 오행_색상[오행]['text']
-            
-            draw.rounded_rectangle([x, current_y, x + cell_width, current_y + cell_height_main],
-                                   radius=5, fill=bg_color, outline=border_color, width=border_width)
-            
-            한자 = 천간_한자[천간]
-            draw.text((x + cell_width // 2, current_y + cell_height_main // 2 - 8),
-                      f"{천간}({한자})", font=font_large, fill=text_color, anchor='mm')
-            draw.text((x + cell_width // 2, current_y + cell_height_main - 8),
-                      세운['천간_십성'], font=font_small, fill=text_color, anchor='mm')
-        
-        current_y += cell_height_main
-        
-        # 지지 행
-        draw.rounded_rectangle([start_x, current_y, start_x + label_width, current_y + cell_height_main],
-                               radius=5, fill='#FAFAFA', outline=border_color, width=border_width)
-        draw.text((start_x + label_width // 2, current_y + cell_height_main // 2),
-                  "지지", font=font_medium, fill='#666666', anchor='mm')
-        
-        for i, 세운 in enumerate(세운_list):
-            x = start_x + label_width + i * cell_width
-            지지 = 세운['지지']
-            오행 = 지지_오행_map[지지]
-            bg_color = 오행_색상[오행]['지지_bg']
-            text_color = 오행_색상[오행]['text']
-            
-            draw.rounded_rectangle([x, current_y, x + cell_width, current_y + cell_height_main],
-                                   radius=5, fill=bg_color, outline=border_color, width=border_width)
-            
-            한자 = 지지_한자[지지]
-            draw.text((x + cell_width // 2, current_y + cell_height_main // 2 - 8),
-                      f"{지지}({한자})", font=font_large, fill=text_color, anchor='mm')
-            draw.text((x + cell_width // 2, current_y + cell_height_main - 8),
-                      세운['지지_십성'], font=font_small, fill=text_color, anchor='mm')
-        
-        current_y += cell_height_main
-        
-        # 12운성 행
-        draw.rounded_rectangle([start_x, current_y, start_x + label_width, current_y + cell_height_small],
-                               radius=5, fill='#FAFAFA', outline=border_color, width=border_width)
-        draw.text((start_x + label_width // 2, current_y + cell_height_small // 2),
-                  "12운성", font=font_small, fill='#666666', anchor='mm')
-        
-        for i, 세운 in enumerate(세운_list):
-            x = start_x + label_width + i * cell_width
-            운성 = 세운.get('12운성', '-')
-            draw.rounded_rectangle([x, current_y, x + cell_width, current_y + cell_height_small],
-                                   radius=5, fill='#FFFFFF', outline=border_color, width=border_width)
-            draw.text((x + cell_width // 2, current_y + cell_height_small // 2),
-                      운성, font=font_medium, fill='#555555', anchor='mm')
-        
-        current_y += cell_height_small
-        
-        # 12신살 행
-        draw.rounded_rectangle([start_x, current_y, start_x + label_width, current_y + cell_height_small],
-                               radius=5, fill='#FAFAFA', outline=border_color, width=border_width)
-        draw.text((start_x + label_width // 2, current_y + cell_height_small // 2),
-                  "12신살", font=font_small, fill='#666666', anchor='mm')
-        
-        for i, 세운 in enumerate(세운_list):
-            x = start_x + label_width + i * cell_width
-            신살 = 세운.get('12신살', '-')
-            draw.rounded_rectangle([x, current_y, x + cell_width, current_y + cell_height_small],
-                                   radius=5, fill='#FFF8E1', outline=border_color, width=border_width)
-            draw.text((x + cell_width // 2, current_y + cell_height_small // 2),
-                      신살, font=font_medium, fill='#E65100', anchor='mm')
-        
-        return current_y + cell_height_small
+        return draw_table(draw, 세운_TABLE, 세운_list, margin, start_y, fonts, row_number=row_num,
+                          tiles=tiles)
     
     # 테이블 시작
     table_start_y = vertical_margin + title_area
@@ -844,8 +1236,7 @@ def create_세운표(세운_data, 기본정보, output_path="세운표.png"):
     y2_end = draw_세운_row(row2, y1_end + row_gap, 2)
     
     # 저장
-    img.save(output_path, 'PNG')
-    return output_path
+    return _finish_canvas(img, output_path)
 
 
 # ============================================
@@ -853,6 +1244,7 @@ def create_세운표(세운_data, 기본정보, output_path="세운표.png"):
 # ============================================# ============================================
 # 월운표 이미지 생성
 # ============================================
+@cached_render('월운표')
 def create_월운표(월운_data, 기본정보, output_path="월운표.png"):
     """
     월운표 이미지 생성 (3행 구조, 투명 배경)
@@ -884,8 +1276,7 @@ def create_월운표(월운_data, 기본정보, output_path="월운표.png"):
     height = vertical_margin * 2 + title_area + row_height * 3 + row_gap * 2  # 3행
     
     # 투명 배경
-    img = Image.new('RGBA', (width, height), (255, 255, 255, 0))
-    draw = ImageDraw.Draw(img)
+    img, draw = _new_canvas(width, height)
     
     # 폰트 (ChosunGs 자동 적용)
     font_title = get_font(24, bold=True)
@@ -894,113 +1285,19 @@ def create_월운표(월운_data, 기본정보, output_path="월운표.png"):
     font_medium = get_font(10, bold=True)
     font_small = get_font(9, bold=True)
     
-    border_color = '#AAAAAA'
-    border_width = 1
-    
     # 제목
     title_y = vertical_margin + 18
     subtitle_y = vertical_margin + 38
     draw.text((width // 2, title_y), f"{기본정보['이름']}님 월운표", font=font_title, fill='#333333', anchor='mm')
     draw.text((width // 2, subtitle_y), f"{월운_list[0]['년도']}년 {월운_list[0]['월']}월 ~ {월운_list[-1]['년도']}년 {월운_list[-1]['월']}월 (18개월)", font=font_subtitle, fill='#666666', anchor='mm')
     
+    fonts = {'large': font_large, 'medium': font_medium, 'small': font_small}
+    
+    tiles = _table_tiles(img)
+    
     def draw_월운_row(월운_list, start_y, row_num):
-        current_y = start_y
-        start_x = margin
-        
-        # 월 행
-        draw.rounded_rectangle([start_x, current_y, start_x + label_width, current_y + cell_height_small],
-                               radius=5, fill='#E0E0E0', outline=border_color, width=border_width)
-        draw.text((start_x + label_width // 2, current_y + cell_height_small // 2),
-                  f"{row_num}행", font=font_medium, fill='#333333', anchor='mm')
-        
-        for i, 월운 in enumerate(월운_list):
-            x = start_x + label_width + i * cell_width
-            draw.rounded_rectangle([x, current_y, x + cell_width, current_y + cell_height_small],
-                                   radius=5, fill='#F5F5F5', outline=border_color, width=border_width)
-            draw.text((x + cell_width // 2, current_y + cell_height_small // 2),
-                      f"{월운['년도']}.{월운['월']:02d}월", font=font_medium, fill='#333333', anchor='mm')
-        
-        current_y += cell_height_small
-        
-        # 천간 행
-        draw.rounded_rectangle([start_x, current_y, start_x + label_width, current_y + cell_height_main],
-                               radius=5, fill='#FAFAFA', outline=border_color, width=border_width)
-        draw.text((start_x + label_width // 2, current_y + cell_height_main // 2),
-                  "천간", font=font_medium, fill='#666666', anchor='mm')
-        
-        for i, 월운 in enumerate(월운_list):
-            x = start_x + label_width + i * cell_width
-            천간 = 월운['천간']
-            오행 = 천간_오행_map[천간]
-            bg_color = 오행_색상[오행]['천간_bg']
-            text_color = 오행_색상[오행]['text']
-            
-            draw.rounded_rectangle([x, current_y, x + cell_width, current_y + cell_height_main],
-                                   radius=5, fill=bg_color, outline=border_color, width=border_width)
-            
-            한자 = 천간_한자[천간]
-            draw.text((x + cell_width // 2, current_y + cell_height_main // 2 - 8),
-                      f"{천간}({한자})", font=font_large, fill=text_color, anchor='mm')
-            draw.text((x + cell_width // 2, current_y + cell_height_main - 8),
-                      월운['천간_십성'], font=font_small, fill=text_color, anchor='mm')
-        
-        current_y += cell_height_main
-        
-        # 지지 행
-        draw.rounded_rectangle([start_x, current_y, start_x + label_width, current_y + cell_height_main],
-                               radius=5, fill='#FAFAFA', outline=border_color, width=border_width)
-        draw.text((start_x + label_width // 2, current_y + cell_height_main // 2),
-                  "지지", font=font_medium, fill='#666666', anchor='mm')
-        
-        for i, 월운 in enumerate(월운_list):
-            x = start_x + label_width + i * cell_width
-            지지 = 월운['지지']
-            오행 = 지지_오행_map[지지]
-            bg_color = 오행_색상[오행]['지지_bg']
-            text_color = 오행_색상[오행]['text']
-            
-            draw.rounded_rectangle([x, current_y, x + cell_width, current_y + cell_height_main],
-                                   radius=5, fill=bg_color, outline=border_color, width=border_width)
-            
-            한자 = 지지_한자[지지]
-            draw.text((x + cell_width // 2, current_y + cell_height_main // 2 - 8),
-                      f"{지지}({한자})", font=font_large, fill=text_color, anchor='mm')
-            draw.text((x + cell_width // 2, current_y + cell_height_main - 8),
-                      월운['지지_십성'], font=font_small, fill=text_color, anchor='mm')
-        
-        current_y += cell_height_main
-        
-        # 12운성 행
-        draw.rounded_rectangle([start_x, current_y, start_x + label_width, current_y + cell_height_small],
-                               radius=5, fill='#FAFAFA', outline=border_color, width=border_width)
-        draw.text((start_x + label_width // 2, current_y + cell_height_small // 2),
-                  "12운성", font=font_small, fill='#666666', anchor='mm')
-        
-        for i, 월운 in enumerate(월운_list):
-            x = start_x + label_width + i * cell_width
-            운성 = 월운.get('12운성', '-')
-            draw.rounded_rectangle([x, current_y, x + cell_width, current_y + cell_height_small],
-                                   radius=5, fill='#FFFFFF', outline=border_color, width=border_width)
-            draw.text((x + cell_width // 2, current_y + cell_height_small // 2),
-                      운성, font=font_medium, fill='#555555', anchor='mm')
-        
-        current_y += cell_height_small
-        
-        # 12신살 행
-        draw.rounded_rectangle([start_x, current_y, start_x + label_width, current_y + cell_height_small],
-                               radius=5, fill='#FAFAFA', outline=border_color, width=border_width)
-        draw.text((start_x + label_width // 2, current_y + cell_height_small // 2),
-                  "12신살", font=font_small, fill='#666666', anchor='mm')
-        
-        for i, 월운 in enumerate(월운_list):
-            x = start_x + label_width + i * cell_width
-            신살 = 월운.get('12신살', '-')
-            draw.rounded_rectangle([x, current_y, x + cell_width, current_y + cell_height_small],
-                                   radius=5, fill='#FFF8E1', outline=border_color, width=border_width)
-            draw.text((x + cell_width // 2, current_y + cell_height_small // 2),
-                      신살, font=font_medium, fill='#E65100', anchor='mm')
-        
-        return current_y + cell_height_small
+        return draw_table(draw, 월운_TABLE, 월운_list, margin, start_y, fonts, row_number=row_num,
+                          tiles=tiles)
     
     # 테이블 시작
     table_start_y = vertical_margin + title_area
@@ -1015,8 +1312,7 @@ def create_월운표(월운_data, 기본정보, output_path="월운표.png"):
     y3_end = draw_월운_row(row3, y2_end + row_gap, 3)
     
     # 저장
-    img.save(output_path, 'PNG')
-    return output_path
+    return _finish_canvas(img, output_path)
 
 
 # ============================================
@@ -1024,6 +1320,7 @@ def create_월운표(월운_data, 기본정보, output_path="월운표.png"):
 # ============================================# ============================================
 # 오행 차트 이미지 생성
 # ============================================
+@cached_render('오행차트')
 def create_오행차트(사주_data, 기본정보, output_path="오행차트.png"):
     """
     오행 분포 + 상생상극 통합 이미지
@@ -1041,8 +1338,7 @@ def create_오행차트(사주_data, 기본정보, output_path="오행차트.png
     height = 400
     
     # 이미지 생성
-    img = Image.new('RGBA', (width, height), (255, 255, 255, 0))
-    draw = ImageDraw.Draw(img)
+    img, draw = _new_canvas(width, height)
     
     # 폰트 (통일)
     font_title = get_font(28, bold=True)
@@ -1214,13 +1510,13 @@ def create_오행차트(사주_data, 기본정보, output_path="오행차트.png
         draw.text((x, y + 12), f"{값}개", font=font_small, fill='#FFFFFF', anchor='mm')
     
     # 저장
-    img.save(output_path, 'PNG')
-    return output_path
+    return _finish_canvas(img, output_path)
 
 
 # ============================================
 # 십성표 이미지 생성
 # ============================================
+@cached_render('십성표')
 def create_십성표(사주_data, 기본정보, output_path="십성표.png"):
     """
     십성 분석표 이미지 생성 (유무+보조+키워드 구조)
@@ -1293,8 +1589,7 @@ def create_십성표(사주_data, 기본정보, output_path="십성표.png"):
     width = 520
     height = 400
     
-    img = Image.new('RGBA', (width, height), (255, 255, 255, 0))
-    draw = ImageDraw.Draw(img)
+    img, draw = _new_canvas(width, height)
     
     # 폰트 (통일)
     font_title = get_font(24, bold=True)
@@ -1408,8 +1703,7 @@ def create_십성표(사주_data, 기본정보, output_path="십성표.png"):
             
             current_y += row_height
     
-    img.save(output_path, 'PNG')
-    return output_path
+    return _finish_canvas(img, output_path)
 
 
 # ============================================
@@ -1417,6 +1711,7 @@ def create_십성표(사주_data, 기본정보, output_path="십성표.png"):
 # ============================================
 import math
 
+@cached_render('오행도', ())
 def create_오행도(사주_data, 기본정보, output_path="오행도.png"):
     """
     오행 상생상극 원형 다이어그램
@@ -1453,8 +1748,7 @@ def create_오행도(사주_data, 기본정보, output_path="오행도.png"):
     height = 550
     
     # 이미지 생성 (라이트 테마)
-    img = Image.new('RGBA', (width, height), (255, 255, 255, 0))
-    draw = ImageDraw.Draw(img)
+    img, draw = _new_canvas(width, height)
     
     # 폰트 (통일)
     font_title = get_font(28, bold=True)
@@ -1660,13 +1954,13 @@ def create_오행도(사주_data, 기본정보, output_path="오행도.png"):
               font=font_small, fill='#1565C0', anchor='lm')
     
     # 저장
-    img.save(output_path, 'PNG')
-    return output_path
+    return _finish_canvas(img, output_path)
 
 
 # ============================================
 # 신살표 이미지 생성
 # ============================================
+@cached_render('신살표')
 def create_신살표(신살_data, 기본정보, output_path="신살표.png"):
     """
     신살 분석표 이미지 생성 (길신/흉신 분리) - 라이트 테마
@@ -1689,8 +1983,7 @@ def create_신살표(신살_data, 기본정보, output_path="신살표.png"):
     height = table_y + table_height + summary_height + 10
     
     # 이미지 생성 (라이트 테마)
-    img = Image.new('RGBA', (width, height), (255, 255, 255, 0))
-    draw = ImageDraw.Draw(img)
+    img, draw = _new_canvas(width, height)
     
     # 폰트 (통일)
     font_title = get_font(24, bold=True)
@@ -1724,8 +2017,10 @@ def create_신살표(신살_data, 기본정보, output_path="신살표.png"):
         for 신살명, 위치 in 길신:
             draw.rectangle([col1_x, current_y, col1_x + col_width, current_y + row_height],
                            fill='#F5F5F5', outline='#E0E0E0')
+            # 이름이 길면 위치 표시와 겹치지 않게 자름
+            이름_폭 = col_width - 26 - measure_width(f"({위치})", 11)
             draw.text((col1_x + 10, current_y + row_height // 2), 
-                      f"{신살명}", font=font_medium, fill='#1565C0', anchor='lm')
+                      fit_line(신살명, 12, 이름_폭), font=font_medium, fill='#1565C0', anchor='lm')
             draw.text((col1_x + col_width - 10, current_y + row_height // 2), 
                       f"({위치})", font=font_small, fill='#42A5F5', anchor='rm')
             current_y += row_height
@@ -1759,8 +2054,10 @@ def create_신살표(신살_data, 기본정보, output_path="신살표.png"):
         for 신살명, 위치 in 흉신:
             draw.rectangle([col2_x, current_y, col2_x + col_width, current_y + row_height],
                            fill='#F5F5F5', outline='#E0E0E0')
+            # 이름이 길면 위치 표시와 겹치지 않게 자름
+            이름_폭 = col_width - 26 - measure_width(f"({위치})", 11)
             draw.text((col2_x + 10, current_y + row_height // 2), 
-                      f"{신살명}", font=font_medium, fill='#C62828', anchor='lm')
+                      fit_line(신살명, 12, 이름_폭), font=font_medium, fill='#C62828', anchor='lm')
             draw.text((col2_x + col_width - 10, current_y + row_height // 2), 
                       f"({위치})", font=font_small, fill='#E57373', anchor='rm')
             current_y += row_height
@@ -1793,8 +2090,10 @@ def create_신살표(신살_data, 기본정보, output_path="신살표.png"):
         for 신살명, 위치 in 특수신살:
             draw.rectangle([col3_x, current_y, col3_x + col_width, current_y + row_height],
                            fill='#F5F5F5', outline='#E0E0E0')
+            # 이름이 길면 위치 표시와 겹치지 않게 자름
+            이름_폭 = col_width - 26 - measure_width(f"({위치})", 11)
             draw.text((col3_x + 10, current_y + row_height // 2), 
-                      f"{신살명}", font=font_medium, fill='#7B1FA2', anchor='lm')
+                      fit_line(신살명, 12, 이름_폭), font=font_medium, fill='#7B1FA2', anchor='lm')
             draw.text((col3_x + col_width - 10, current_y + row_height // 2), 
                       f"({위치})", font=font_small, fill='#AB47BC', anchor='rm')
             current_y += row_height
@@ -1839,45 +2138,49 @@ def create_신살표(신살_data, 기본정보, output_path="신살표.png"):
               총평, font=font_medium, fill=총평_color, anchor='mm')
     
     # 저장
-    img.save(output_path, 'PNG')
-    return output_path
+    return _finish_canvas(img, output_path)
 
 
 # ============================================
 # 12운성표 이미지 생성
 # ============================================
+@cached_render('12운성표')
 def create_12운성표(사주_data, 기본정보, output_path="12운성표.png"):
     """12운성 전체 테이블 이미지 생성"""
     
-    from saju_calculator import calc_12운성_전체, 지지, 운성_순서
+    일간 = 사주_data['일주'][0]
+    
+    # 이미지 크기
+    width = 700
+    height = 265
+    
+    # 본문은 일간 + 원국 지지로만 결정됨 -> 캐시된 본문 위에 제목만 그림
+    key = (일간, 사주_data['년주'][1], 사주_data['월주'][1], 사주_data['일주'][1], 사주_data['시주'][1])
+    img, draw = _body_canvas('12운성표', key, width, height, _draw_12운성표_body)
+    
+    font_title = get_font(24, bold=True)  # 제목 크게
+    
+    # 제목
+    draw.text((width // 2, 22), f"{기본정보['이름']}님 12운성표 (일간: {일간})", 
+              font=font_title, fill='#333333', anchor='mm')
+    
+    return _finish_canvas(img, output_path)
+
+
+def _draw_12운성표_body(draw, width, height, 일간, 년지, 월지, 일지, 시지):
+    """12운성표 본문 (제목 제외)"""
+    
+    from saju_calculator import calc_12운성_전체, 지지
     
-    일간 = 사주_data['일주'][0]
     운성_전체 = calc_12운성_전체(일간)
     
     # 원국 지지들
-    원국_지지 = {
-        '년': 사주_data['년주'][1],
-        '월': 사주_data['월주'][1],
-        '일': 사주_data['일주'][1],
-        '시': 사주_data['시주'][1],
-    }
-    
-    # 이미지 크기
-    width = 700
-    height = 265
-    
-    img = Image.new('RGBA', (width, height), (255, 255, 255, 0))
-    draw = ImageDraw.Draw(img)
+    원국_지지 = {'년': 년지, '월': 월지, '일': 일지, '시': 시지}
     
-    font_title = get_font(24, bold=True)  # 제목 크게
     font_header = get_font(12, bold=True)
     font_medium = get_font(16, bold=True)
     font_small = get_font(12, bold=True)
     
-    # 제목
-    draw.text((width // 2, 22), f"{기본정보['이름']}님 12운성표 (일간: {일간})", 
-              font=font_title, fill='#333333', anchor='mm')
-    
     # 운성별 에너지 레벨
     에너지 = {
         '장생': ('상승', '#4CAF50'), '목욕': ('불안', '#FFC107'), '관대': ('성장', '#8BC34A'),
@@ -1976,42 +2279,43 @@ def create_12운성표(사주_data, 기본정보, output_path="12운성표.png")
     draw.text((legend_x1, legend_y), "강한 운성: 건록, 제왕, 관대", font=font_small, fill='#1565C0', anchor='mm')
     draw.text((legend_x2, legend_y), "약한 운성: 병, 사, 묘, 절", font=font_small, fill='#C62828', anchor='mm')
     draw.text((legend_x3, legend_y), "시작 운성: 장생, 태, 양", font=font_small, fill='#7B1FA2', anchor='mm')
-    
-    img.save(output_path, 'PNG')
-    return output_path
 
 
 # ============================================
 # 지장간표 이미지 생성
 # ============================================
+@cached_render('지장간표')
 def create_지장간표(사주_data, 기본정보, output_path="지장간표.png"):
     """지장간 테이블 이미지 생성"""
     
-    from saju_calculator import calc_지장간_전체, 지지
-    
-    지장간_전체 = calc_지장간_전체()
-    
-    원국_지지 = {
-        '년': 사주_data['년주'][1],
-        '월': 사주_data['월주'][1],
-        '일': 사주_data['일주'][1],
-        '시': 사주_data['시주'][1],
-    }
-    
     width = 700
     height = 290
     
-    img = Image.new('RGBA', (width, height), (255, 255, 255, 0))
-    draw = ImageDraw.Draw(img)
+    # 본문은 원국 지지 4개로만 결정됨 -> 캐시된 본문 위에 제목만 그림
+    key = (사주_data['년주'][1], 사주_data['월주'][1], 사주_data['일주'][1], 사주_data['시주'][1])
+    img, draw = _body_canvas('지장간표', key, width, height, _draw_지장간표_body)
     
     font_title = get_font(24, bold=True)
-    font_header = get_font(12, bold=True)
-    font_medium = get_font(14, bold=True)
-    font_small = get_font(12, bold=True)
     
     draw.text((width // 2, 20), f"{기본정보['이름']}님 지장간표", 
               font=font_title, fill='#333333', anchor='mm')
     
+    return _finish_canvas(img, output_path)
+
+
+def _draw_지장간표_body(draw, width, height, 년지, 월지, 일지, 시지):
+    """지장간표 본문 (제목 제외)"""
+    
+    from saju_calculator import calc_지장간_전체, 지지
+    
+    지장간_전체 = calc_지장간_전체()
+    
+    원국_지지 = {'년': 년지, '월': 월지, '일': 일지, '시': 시지}
+    
+    font_header = get_font(12, bold=True)
+    font_medium = get_font(14, bold=True)
+    font_small = get_font(12, bold=True)
+    
     table_y = 55
     col_width = 50
     row_height = 28
@@ -2090,14 +2394,12 @@ def create_지장간표(사주_data, 기본정보, output_path="지장간표.png
     desc_y = summary_y + 88
     draw.text((width // 2, desc_y), "* 지장간: 지지 속에 숨어있는 천간 (본기가 가장 강함)", 
               font=font_small, fill='#666666', anchor='mm')
-    
-    img.save(output_path, 'PNG')
-    return output_path
 
 
 # ============================================
 # 합충형파해표 이미지 생성
 # ============================================
+@cached_render('합충형파해표')
 def create_합충형파해표(사주_data, 기본정보, output_path="합충형파해표.png"):
     """합충형파해 관계 분석 이미지"""
     
@@ -2109,8 +2411,7 @@ def create_합충형파해표(사주_data, 기본정보, output_path="합충형
     width = 650
     height = 540
     
-    img = Image.new('RGBA', (width, height), (255, 255, 255, 0))
-    draw = ImageDraw.Draw(img)
+    img, draw = _new_canvas(width, height)
     
     # 폰트 (크게)
     font_title = get_font(24, bold=True)
@@ -2175,7 +2476,9 @@ def create_합충형파해표(사주_data, 기본정보, output_path="합충형
             else:
                 result_str = ', '.join([f"{r['지지']}({r['위치']})" for r in 결과])
             
-            draw.text((370, current_y + 14), result_str, font=font_medium, fill='#333333', anchor='mm')
+            # 결과가 많으면 행 폭에 맞춰 자름
+            draw.text((370, current_y + 14), fit_line(result_str, 14, 470),
+                      font=font_medium, fill='#333333', anchor='mm')
             draw.text((370, current_y + 32), 설명, font=font_small, fill='#666666', anchor='mm')
         else:
             draw.text((370, current_y + row_height // 2), "해당 없음", font=font_medium, fill='#BDBDBD', anchor='mm')
@@ -2197,34 +2500,42 @@ def create_합충형파해표(사주_data, 기본정보, output_path="합충형
     draw.text((width // 2, summary_y + 22), f"합: {합_count}개 | 충돌: {충돌_count}개 -> {총평}", 
               font=get_font(16, bold=True), fill=총평_color, anchor='mm')
     
-    img.save(output_path, 'PNG')
-    return output_path
+    return _finish_canvas(img, output_path)
 
 
 # ============================================
 # 궁성표 이미지 생성  
 # ============================================
+@cached_render('궁성표')
 def create_궁성표(사주_data, 기본정보, output_path="궁성표.png"):
     """사주 궁성 분석 이미지"""
     
-    from saju_calculator import calc_궁성
-    
-    궁성 = calc_궁성(사주_data)
-    
     width = 700
     height = 280
     
-    img = Image.new('RGBA', (width, height), (255, 255, 255, 0))
-    draw = ImageDraw.Draw(img)
+    # 본문은 4주(간지)로만 결정됨 -> 캐시된 본문 위에 제목만 그림
+    key = tuple(tuple(사주_data[주]) for 주 in ('년주', '월주', '일주', '시주'))
+    img, draw = _body_canvas('궁성표', key, width, height, _draw_궁성표_body)
     
     font_title = get_font(24, bold=True)
-    font_header = get_font(12, bold=True)
-    font_medium = get_font(14, bold=True)
-    font_small = get_font(11, bold=True)
     
     draw.text((width // 2, 22), f"{기본정보['이름']}님 사주 궁성표", 
               font=font_title, fill='#333333', anchor='mm')
     
+    return _finish_canvas(img, output_path)
+
+
+def _draw_궁성표_body(draw, width, height, 년주, 월주, 일주, 시주):
+    """궁성표 본문 (제목 제외)"""
+    
+    from saju_calculator import calc_궁성
+    
+    궁성 = calc_궁성({'년주': 년주, '월주': 월주, '일주': 일주, '시주': 시주})
+    
+    font_header = get_font(12, bold=True)
+    font_medium = get_font(14, bold=True)
+    font_small = get_font(11, bold=True)
+    
     # 박스 설정 (균형 맞춤)
     box_width = 158
     box_height = 130
@@ -2257,18 +2568,10 @@ def create_궁성표(사주_data, 기본정보, output_path="궁성표.png"):
         draw.text((x + box_width // 2, box_y + 75), 정보['궁'], 
                   font=font_medium, fill=헤더_색상[주], anchor='mm')
         
-        # 의미 (2줄로 나누기)
-        의미 = 정보['의미']
-        if len(의미) > 14:
-            line1 = 의미[:14]
-            line2 = 의미[14:28] if len(의미) > 14 else ''
-            draw.text((x + box_width // 2, box_y + 98), line1, 
-                      font=font_small, fill='#666666', anchor='mm')
-            draw.text((x + box_width // 2, box_y + 115), line2, 
-                      font=font_small, fill='#666666', anchor='mm')
-        else:
-            draw.text((x + box_width // 2, box_y + 105), 의미, 
-                      font=font_small, fill='#666666', anchor='mm')
+        # 의미 (박스 폭에 맞춰 최대 2줄)
+        의미_lines = wrap_lines(정보['의미'], 11, box_width - 12, max_lines=2)
+        _draw_lines(draw, (x + box_width // 2, box_y + 106), 의미_lines,
+                    font_small, '#666666', 17)
     
     # 시간대 설명 (배경색 추가)
     time_y = box_y + box_height + 15
@@ -2279,14 +2582,12 @@ def create_궁성표(사주_data, 기본정보, output_path="궁성표.png"):
               font=get_font(13, bold=True), fill='#E65100', anchor='mm')
     draw.text((width // 2, time_y + 40), "년주:1~15세 | 월주:15~30세 | 일주:30~45세 | 시주:45세~", 
               font=font_medium, fill='#795548', anchor='mm')
-    
-    img.save(output_path, 'PNG')
-    return output_path
 
 
 # ============================================
 # 육친표 이미지 생성
 # ============================================
+@cached_render('육친표')
 def create_육친표(사주_data, 기본정보, gender='남', output_path="육친표.png"):
     """육친 관계 분석 이미지"""
     
@@ -2297,8 +2598,7 @@ def create_육친표(사주_data, 기본정보, gender='남', output_path="육
     width = 650
     height = 295
     
-    img = Image.new('RGBA', (width, height), (255, 255, 255, 0))
-    draw = ImageDraw.Draw(img)
+    img, draw = _new_canvas(width, height)
     
     font_title = get_font(24, bold=True)
     font_header = get_font(12, bold=True)
@@ -2310,47 +2610,13 @@ def create_육친표(사주_data, 기본정보, gender='남', output_path="육
               font=font_title, fill='#333333', anchor='mm')
     
     table_y = 55
-    label_width = 55
-    col_width = 140
-    row_height = 32
-    table_width = label_width + col_width * 4
+    table_width = 육친_TABLE.label_width + 육친_TABLE.cell_width * 4
     start_x = (width - table_width) // 2  # 중앙 정렬
+    fonts = {'header': font_header, 'medium': font_medium, 'small': font_small}
     
-    headers = ['구분', '년주', '월주', '일주', '시주']
-    for i, h in enumerate(headers):
-        if i == 0:
-            x, w = start_x, label_width
-        else:
-            x, w = start_x + label_width + (i-1) * col_width, col_width
-        draw.rectangle([x, table_y, x + w, table_y + 28], fill='#E8E8E8', outline='#CCCCCC')
-        draw.text((x + w // 2, table_y + 14), h, font=font_header, fill='#333333', anchor='mm')
-    
-    rows = [('천간십성', '천간'), ('천간육친', '천간'), ('지지십성', '지지'), ('지지육친', '지지')]
-    
-    for row_idx, (행_이름, key) in enumerate(rows):
-        current_y = table_y + 28 + row_idx * row_height
-        
-        draw.rectangle([start_x, current_y, start_x + label_width, current_y + row_height],
-                       fill='#F5F5F5', outline='#CCCCCC')
-        draw.text((start_x + label_width // 2, current_y + row_height // 2), 행_이름[:4], 
-                  font=font_small, fill='#333333', anchor='mm')
-        
-        for i, col in enumerate(['년', '월', '일', '시']):
-            x = start_x + label_width + i * col_width
-            if '십성' in 행_이름:
-                값 = 육친[col][key]['십성']
-                color = '#1565C0'
-            else:
-                값 = 육친[col][key]['육친']
-                color = '#E65100'
-            
-            bg = '#FFFFFF' if '십성' in 행_이름 else '#FFF8E1'
-            draw.rectangle([x, current_y, x + col_width, current_y + row_height],
-                           fill=bg, outline='#CCCCCC')
-            draw.text((x + col_width // 2, current_y + row_height // 2), 값, 
-                      font=font_medium, fill=color, anchor='mm')
+    table_end_y = draw_table(draw, 육친_TABLE, ['년', '월', '일', '시'], start_x, table_y, fonts, 육친)
     
-    ref_y = table_y + 28 + len(rows) * row_height + 20
+    ref_y = table_end_y + 20
     draw.rectangle([20, ref_y, width - 20, ref_y + 55], fill='#FAFAFA', outline='#E0E0E0')
     draw.text((width // 2, ref_y + 12), f"[ 육친 참고 ({성별_텍스트}) ]", font=font_header, fill='#333333', anchor='mm')
     
@@ -2360,32 +2626,41 @@ def create_육친표(사주_data, 기본정보, gender='남', output_path="육
         참고 = "정관=남편 | 편관=애인 | 식신=딸 | 상관=아들 | 정인=어머니"
     draw.text((width // 2, ref_y + 38), 참고, font=font_small, fill='#666666', anchor='mm')
     
-    img.save(output_path, 'PNG')
-    return output_path
+    return _finish_canvas(img, output_path)
 
 
 # ============================================
 # 납음오행표 이미지 생성
 # ============================================
+@cached_render('납음오행표')
 def create_납음오행표(사주_data, 기본정보, output_path="납음오행표.png"):
     """납음오행 분석 이미지"""
     
-    from saju_calculator import calc_납음오행
-    
-    납음 = calc_납음오행(사주_data)
-    
     width = 650
     height = 250
     
-    img = Image.new('RGBA', (width, height), (255, 255, 255, 0))
-    draw = ImageDraw.Draw(img)
+    # 본문은 4주(간지)로만 결정됨 -> 캐시된 본문 위에 제목만 그림
+    key = tuple(tuple(사주_data[주]) for 주 in ('년주', '월주', '일주', '시주'))
+    img, draw = _body_canvas('납음오행표', key, width, height, _draw_납음오행표_body)
     
     font_title = get_font(24, bold=True)
+    
+    draw.text((width // 2, 20), f"{기본정보['이름']}님 납음오행표", font=font_title, fill='#333333', anchor='mm')
+    
+    return _finish_canvas(img, output_path)
+
+
+def _draw_납음오행표_body(draw, width, height, 년주, 월주, 일주, 시주):
+    """납음오행표 본문 (제목 제외)"""
+    
+    from saju_calculator import calc_납음오행
+    
+    납음 = calc_납음오행({'년주': 년주, '월주': 월주, '일주': 일주, '시주': 시주})
+    
     font_header = get_font(12, bold=True)
     font_medium = get_font(14, bold=True)
     font_small = get_font(12, bold=True)
     
-    draw.text((width // 2, 20), f"{기본정보['이름']}님 납음오행표", font=font_title, fill='#333333', anchor='mm')
     draw.text((width // 2, 42), "(60갑자의 소리 오행)", font=font_small, fill='#666666', anchor='mm')
     
     box_width = 145
@@ -2416,14 +2691,12 @@ def create_납음오행표(사주_data, 기본정보, output_path="납음오행
     일주_납음 = 납음['일']
     draw.text((width // 2, summary_y + 20), f"본명 납음: {일주_납음['납음']}({일주_납음['오행']}) - {일주_납음['설명'][:15]}", 
               font=font_medium, fill='#E65100', anchor='mm')
-    
-    img.save(output_path, 'PNG')
-    return output_path
 
 
 # ============================================
 # 격국표 이미지 생성
 # ============================================
+@cached_render('격국표')
 def create_격국표(사주_data, 기본정보, output_path="격국표.png"):
     """격국 분석 이미지"""
     
@@ -2434,8 +2707,7 @@ def create_격국표(사주_data, 기본정보, output_path="격국표.png"):
     width = 550
     height = 240
     
-    img = Image.new('RGBA', (width, height), (255, 255, 255, 0))
-    draw = ImageDraw.Draw(img)
+    img, draw = _new_canvas(width, height)
     
     font_title = get_font(24, bold=True)
     font_header = get_font(12, bold=True)
@@ -2466,13 +2738,13 @@ def create_격국표(사주_data, 기본정보, output_path="격국표.png"):
     설명 = 격국_설명.get(격국['정격'], '특수한 구성')
     draw.text((width // 2, desc_y), f"특성: {설명}", font=font_small, fill='#666666', anchor='mm')
     
-    img.save(output_path, 'PNG')
-    return output_path
+    return _finish_canvas(img, output_path)
 
 
 # ============================================
 # 공망표 이미지 생성
 # ============================================
+@cached_render('공망표')
 def create_공망표(사주_data, 기본정보, output_path="공망표.png"):
     """공망 분석 이미지"""
     
@@ -2483,8 +2755,7 @@ def create_공망표(사주_data, 기본정보, output_path="공망표.png"):
     width = 600
     height = 275
     
-    img = Image.new('RGBA', (width, height), (255, 255, 255, 0))
-    draw = ImageDraw.Draw(img)
+    img, draw = _new_canvas(width, height)
     
     font_title = get_font(24, bold=True)
     font_header = get_font(12, bold=True)
@@ -2522,14 +2793,14 @@ def create_공망표(사주_data, 기본정보, output_path="공망표.png"):
     
     draw.text((30, 해당_y + 55), "* 공망: 해당 궁의 일이 허무하거나 늦게 이루어짐", font=font_small, fill='#666666', anchor='lm')
     
-    img.save(output_path, 'PNG')
-    return output_path
+    return _finish_canvas(img, output_path)
 
 
 
 # ============================================
 # 용신표 이미지 생성
 # ============================================
+@cached_render('용신표')
 def create_용신표(사주_data, 기본정보, output_path="용신표.png"):
     """
     용신 분석 이미지 생성
@@ -2543,10 +2814,9 @@ def create_용신표(사주_data, 기본정보, output_path="용신표.png"):
     
     # 이미지 크기 (상하 여백 동일: 약 13px)
     width = 580
-    height = 400
+    height = 423
     
-    img = Image.new('RGBA', (width, height), (255, 255, 255, 0))
-    draw = ImageDraw.Draw(img)
+    img, draw = _new_canvas(width, height)
     
     # 폰트 (통일)
     font_title = get_font(24, bold=True)
@@ -2594,7 +2864,7 @@ def create_용신표(사주_data, 기본정보, output_path="용신표.png"):
     # ========== 조후/억부/통관 3박스 ==========
     box_y = 95
     box_width = 175
-    box_height = 90
+    box_height = 100
     box_gap = 10
     start_x = (width - (box_width * 3 + box_gap * 2)) // 2
     
@@ -2626,10 +2896,10 @@ def create_용신표(사주_data, 기본정보, output_path="용신표.png"):
             draw.text((x + box_width // 2, box_y + 52), '-', 
                       font=font_large, fill='#BDBDBD', anchor='mm')
         
-        # 설명 (길이 늘림)
-        설명_short = 설명[:22] + '..' if len(설명) > 22 else 설명
-        draw.text((x + box_width // 2, box_y + 78), 설명_short, 
-                  font=font_desc, fill='#666666', anchor='mm')
+        # 설명 (박스 폭에 맞춰 최대 2줄)
+        설명_lines = wrap_lines(설명, 11, box_width - 10, max_lines=2)
+        _draw_lines(draw, (x + box_width // 2, box_y + 82), 설명_lines,
+                    font_desc, '#666666', 14)
     
     # ========== [최종 구조 요약] ==========
     summary_y = box_y + box_height + 18
@@ -2641,7 +2911,7 @@ def create_용신표(사주_data, 기본정보, output_path="용신표.png"):
     # ========== 5신 박스 ==========
     신_y = summary_y + 45
     신_box_width = 100
-    신_box_height = 75
+    신_box_height = 88
     신_gap = 8
     신_start_x = (width - (신_box_width * 5 + 신_gap * 4)) // 2
     
@@ -2686,10 +2956,10 @@ def create_용신표(사주_data, 기본정보, output_path="용신표.png"):
             draw.text((x + 신_box_width // 2, 신_y + 42), '-', 
                       font=font_large, fill='#BDBDBD', anchor='mm')
         
-        # 역할 (bold)
-        역할_short = 역할[:8] if 역할 and len(역할) > 8 else (역할 or '-')
-        draw.text((x + 신_box_width // 2, 신_y + 65), 역할_short, 
-                  font=font_desc, fill='#333333', anchor='mm')
+        # 역할 (bold, 박스 폭에 맞춰 최대 2줄)
+        역할_lines = wrap_lines(역할 or '-', 11, 신_box_width - 8, max_lines=2)
+        _draw_lines(draw, (x + 신_box_width // 2, 신_y + 71), 역할_lines,
+                    font_desc, '#333333', 14)
     
     # ========== 최종 순환 구조 ==========
     cycle_y = 신_y + 신_box_height + 12
@@ -2718,20 +2988,24 @@ def create_용신표(사주_data, 기본정보, output_path="용신표.png"):
     draw.text((width // 2, cycle_y + 36), 순환_str, 
               font=get_font(16, bold=True), fill='#1B5E20', anchor='mm')
     
-    img.save(output_path, 'PNG')
-    return output_path
+    return _finish_canvas(img, output_path)
 
 
 # ============================================
 # 일진표 (달력) 이미지 생성
 # ============================================
-def create_일진표(year, month, 기본정보=None, output_path="일진표.png"):
-    """월별 일진 달력 이미지 (세운표 사이즈)"""
+@cached_render('일진표')
+def create_일진표(year, month, 기본정보=None, output_path="일진표.png", 일진_데이터=None):
+    """
+    월별 일진 달력 이미지 (세운표 사이즈)
+    일진_데이터: calc_일진표 결과 (여러 달을 한 번에 계산한 경우 전달, None이면 계산)
+    """
     
     from saju_calculator import calc_일진표
     import calendar
     
-    일진_데이터 = calc_일진표(year, month)
+    if 일진_데이터 is None:
+        일진_데이터 = calc_일진표(year, month)
     
     # 셀 크기
     cell_width = 120
@@ -2757,13 +3031,13 @@ def create_일진표(year, month, 기본정보=None, output_path="일진표.png"
     width = table_width + (margin_x * 2)
     height = margin_top + table_height + margin_bottom
     
-    img = Image.new('RGBA', (width, height), (255, 255, 255, 0))
-    draw = ImageDraw.Draw(img)
+    # 요일 헤더 + 칸 배경은 빈칸 위치로만 결정 -> 템플릿 재사용
+    빈칸 = tuple(tuple(day == 0 for day in week) for week in weeks)
+    img, draw = _body_canvas('일진표', (빈칸,), width, height, _draw_일진표_grid)
     
     # 폰트 크기 키움
     font_title = get_font(20, bold=True)
     font_subtitle = get_font(20)
-    font_header = get_font(13, bold=True)
     font_day = get_font(15, bold=True)
     font_ganji = get_font(20)
     font_hanja = get_font(16)
@@ -2777,11 +3051,46 @@ def create_일진표(year, month, 기본정보=None, output_path="일진표.png"
     draw.text((width // 2, 22), title_text, font=font_title, fill='#333333', anchor='mm')
     draw.text((width // 2, 48), f"월주: {일진_데이터['월주']}", font=font_subtitle, fill='#1565C0', anchor='mm')
     
-    요일 = ['일', '월', '화', '수', '목', '금', '토']
-    요일_색상 = ['#C62828', '#333333', '#333333', '#333333', '#333333', '#333333', '#1565C0']
+    # 날짜 -> 일진 (직접 조회)
+    days_by_num = {d['day']: d for d in 일진_데이터['days'] if d}
     
     start_x = margin_x
-    start_y = margin_top
+    current_y = margin_top + header_height
+    
+    for week in weeks:
+        for day_idx, day in enumerate(week):
+            x = start_x + day_idx * cell_width
+            day_data = days_by_num.get(day) if day else None
+            
+            if day_data:
+                날짜_색상 = '#C62828' if day_idx == 0 else '#1565C0' if day_idx == 6 else '#333333'
+                # 날짜 (왼쪽 상단)
+                draw.text((x + 8, current_y + 14), str(day), font=font_day, fill=날짜_색상, anchor='lm')
+                # 음력 (오른쪽 상단)
+                draw.text((x + cell_width - 8, current_y + 14), day_data['음력'], font=font_lunar, fill='#999999', anchor='rm')
+                # 일진 간지 (중앙)
+                draw.text((x + cell_width // 2, current_y + 38), day_data['일진'], font=font_ganji, fill='#333333', anchor='mm')
+                # 한자 (하단)
+                draw.text((x + cell_width // 2, current_y + 56), f"{day_data['천간_한자']}{day_data['지지_한자']}", 
+                          font=font_hanja, fill='#888888', anchor='mm')
+        
+        current_y += cell_height
+    
+    return _finish_canvas(img, output_path)
+
+
+def _draw_일진표_grid(draw, width, height, 빈칸):
+    """일진표 요일 헤더 + 칸 배경 (빈칸: 주별 빈 칸 여부)"""
+    cell_width = 120
+    cell_height = 72
+    header_height = 28
+    start_x = 25
+    start_y = 70
+    
+    font_header = get_font(13, bold=True)
+    
+    요일 = ['일', '월', '화', '수', '목', '금', '토']
+    요일_색상 = ['#C62828', '#333333', '#333333', '#333333', '#333333', '#333333', '#1565C0']
     
     # 요일 헤더
     for i, (요일명, 색상) in enumerate(zip(요일, 요일_색상)):
@@ -2791,38 +3100,353 @@ def create_일진표(year, month, 기본정보=None, output_path="일진표.png"
     
     current_y = start_y + header_height
     
-    for week in weeks:
-        for day_idx, day in enumerate(week):
+    for week in 빈칸:
+        for day_idx, empty in enumerate(week):
             x = start_x + day_idx * cell_width
             
-            if day == 0:
+            if empty:
                 draw.rectangle([x, current_y, x + cell_width, current_y + cell_height], fill='#FAFAFA', outline='#CCCCCC', width=1)
             else:
                 bg_color = '#FFEBEE' if day_idx == 0 else '#E3F2FD' if day_idx == 6 else '#FFFFFF'
                 draw.rectangle([x, current_y, x + cell_width, current_y + cell_height], fill=bg_color, outline='#CCCCCC', width=1)
-                
-                day_data = None
-                for d in 일진_데이터['days']:
-                    if d and d['day'] == day:
-                        day_data = d
-                        break
-                
-                if day_data:
-                    날짜_색상 = '#C62828' if day_idx == 0 else '#1565C0' if day_idx == 6 else '#333333'
-                    # 날짜 (왼쪽 상단)
-                    draw.text((x + 8, current_y + 14), str(day), font=font_day, fill=날짜_색상, anchor='lm')
-                    # 음력 (오른쪽 상단)
-                    draw.text((x + cell_width - 8, current_y + 14), day_data['음력'], font=font_lunar, fill='#999999', anchor='rm')
-                    # 일진 간지 (중앙)
-                    draw.text((x + cell_width // 2, current_y + 38), day_data['일진'], font=font_ganji, fill='#333333', anchor='mm')
-                    # 한자 (하단)
-                    draw.text((x + cell_width // 2, current_y + 56), f"{day_data['천간_한자']}{day_data['지지_한자']}", 
-                              font=font_hanja, fill='#888888', anchor='mm')
         
         current_y += cell_height
+
+
+def create_일진표_year(year, start_month=1, months=12, 기본정보=None, output_dir=None,
+                       max_workers=4, backend='thread'):
+    """
+    여러 달 일진표 한 번에 생성 (start_month부터 months개월, 연도 넘어가면 다음 해)
     
-    img.save(output_path, 'PNG')
-    return output_path
+    - 일진/음력 데이터는 전체 기간을 한 번에 계산
+    - 요일 헤더/칸 배경 템플릿은 달력 모양별로 한 번만 그림
+    - 월별 렌더링은 병렬 실행 (backend: 'thread' | 'process' | 'serial')
+      어느 backend든 호출한 쪽의 render_scale/canvas_mode/encode_options 설정으로 렌더링
+    
+    Args:
+        output_dir: 저장 폴더 ("{년}년_{월:02d}월_일진표.png"), None이면 PIL 이미지 반환
+    
+    Returns:
+        list: (년, 월, 파일 경로 또는 이미지) - 월 순서
+    """
+    from saju_calculator import calc_일진표_범위
+    
+    월별_데이터 = calc_일진표_범위(year, start_month, months)
+    
+    def output_for(data):
+        if output_dir is None:
+            return None
+        return os.path.join(output_dir, f"{data['year']}년_{data['month']:02d}월_일진표.png")
+    
+    calls = [(data['year'], data['month'], 기본정보, output_for(data), data) for data in 월별_데이터]
+    
+    with _executor(backend, max_workers) as executor:
+        if executor is None:
+            results = [create_일진표(*args) for args in calls]
+        else:
+            futures = [_submit_call(executor.submit, backend, create_일진표, *args) for args in calls]
+            results = [future.result() for future in futures]
+    
+    return [(data['year'], data['month'], result) for data, result in zip(월별_데이터, results)]
+
+
+# ============================================
+# 차트 작업 정의 (병렬/배치 생성 공용)
+# ============================================
+# 작업(job) dict: 사주_data, 대운_data, 세운_data, 월운_data, 기본정보,
+#                 신살_data, gender, zodiac_path, charts(생성할 차트 이름 목록)
+# 차트 이름 -> (생성 함수, (job, 출력 대상) -> 위치 인자)
+CHART_TASKS = {
+    '원국표': (create_원국표, lambda job, out: (job['사주_data'], job['기본정보'], out,
+                                               job.get('신살_data'), job.get('zodiac_path'))),
+    '대운표': (create_대운표, lambda job, out: (job['대운_data'], job['기본정보'], out)),
+    '세운표': (create_세운표, lambda job, out: (job['세운_data'], job['기본정보'], out)),
+    '월운표': (create_월운표, lambda job, out: (job['월운_data'], job['기본정보'], out)),
+    '오행차트': (create_오행차트, lambda job, out: (job['사주_data'], job['기본정보'], out)),
+    '십성표': (create_십성표, lambda job, out: (job['사주_data'], job['기본정보'], out)),
+    '신살표': (create_신살표, lambda job, out: (job['신살_data'], job['기본정보'], out)),
+    '12운성표': (create_12운성표, lambda job, out: (job['사주_data'], job['기본정보'], out)),
+    '지장간표': (create_지장간표, lambda job, out: (job['사주_data'], job['기본정보'], out)),
+    '합충형파해표': (create_합충형파해표, lambda job, out: (job['사주_data'], job['기본정보'], out)),
+    '궁성표': (create_궁성표, lambda job, out: (job['사주_data'], job['기본정보'], out)),
+    '육친표': (create_육친표, lambda job, out: (job['사주_data'], job['기본정보'],
+                                               job.get('gender', '남'), out)),
+    '납음오행표': (create_납음오행표, lambda job, out: (job['사주_data'], job['기본정보'], out)),
+    '격국표': (create_격국표, lambda job, out: (job['사주_data'], job['기본정보'], out)),
+    '공망표': (create_공망표, lambda job, out: (job['사주_data'], job['기본정보'], out)),
+    '용신표': (create_용신표, lambda job, out: (job['사주_data'], job['기본정보'], out)),
+}
+
+# generate_all_images_parallel 기본 생성 목록 (신살표는 신살_data 있을 때만)
+DEFAULT_CHARTS = ['원국표', '대운표', '세운표', '월운표', '12운성표', '지장간표', '납음오행표', '오행차트']
+
+RENDER_BACKENDS = ('thread', 'process', 'serial')
+
+
+def _job_charts(job):
+    """작업에서 생성할 차트 목록 결정"""
+    charts = job.get('charts')
+    if charts:
+        return list(charts)
+    charts = list(DEFAULT_CHARTS)
+    if job.get('신살_data'):
+        charts.append('신살표')
+    return charts
+
+
+def render_chart_bytes(name, job):
+    """
+    차트 하나를 메모리에서 렌더링하여 인코딩된 바이트로 반환
+    (파일 저장 없이 BytesIO로 바로 인코딩)
+    """
+    func, build_args = CHART_TASKS[name]
+    buffer = io.BytesIO()
+    func(*build_args(job, buffer))
+    return buffer.getvalue()
+
+
+def render_chart_svg(name, job, font_url=None, asset_url=None):
+    """차트 하나를 SVG 문자열로 렌더링"""
+    func, build_args = CHART_TASKS[name]
+    with svg_output(font_url, asset_url):
+        return func(*build_args(job, None))
+
+
+@contextmanager
+def _job_options(job):
+    """
+    작업별 렌더링 옵션 적용 (프로세스 워커에도 전달되도록 작업 dict에 담음)
+      'scale': render_scale 배율
+      'canvas_mode': canvas_mode 인자 (예: 'RGB' 또는 {'mode': 'P', 'colors': 64})
+      'encode': encode_options 인자 (예: 'WEBP' 또는 {'image_format': 'WEBP', 'quality': 90})
+    """
+    with ExitStack() as stack:
+        if job.get('scale') is not None:
+            stack.enter_context(render_scale(job['scale']))
+        mode = job.get('canvas_mode')
+        if mode is not None:
+            stack.enter_context(canvas_mode(**mode) if isinstance(mode, dict) else canvas_mode(mode))
+        encode = job.get('encode')
+        if encode is not None:
+            stack.enter_context(encode_options(**encode) if isinstance(encode, dict) else encode_options(encode))
+        yield
+
+
+def _render_chart_result(name, job):
+    """차트 하나 렌더링 -> (차트 이름, PNG 바이트) (실패 시 "Error: ..." 문자열)"""
+    try:
+        with _job_options(job):
+            return name, render_chart_bytes(name, job)
+    except Exception as e:
+        return name, f"Error: {e}"
+
+
+def render_job(job):
+    """
+    작업 하나(1명)의 차트들을 바이트로 렌더링
+    
+    Returns:
+        dict: 차트 이름 -> PNG 바이트 (실패 시 "Error: ..." 문자열)
+    """
+    return dict(_render_chart_result(name, job) for name in _job_charts(job))
+
+
+def init_render_worker(zodiac_path=None):
+    """
+    렌더링 워커 초기화 (프로세스 풀 initializer)
+    - 폰트 미리 로드
+    - 12지 이미지 디코딩/리사이즈
+    """
+    # fork로 뜬 워커는 풀을 만들 때의 설정(render_scale 등)을 물려받음 -> 기본값으로 되돌림
+    # (작업마다 호출한 쪽의 설정을 _run_with_settings로 따로 전달)
+    _reset_render_settings()
+    preload_fonts()
+    if zodiac_path:
+        load_zodiac_sprites(zodiac_path)
+
+
+# 프로세스 워커에 작업마다 전달하는 렌더링 설정 (contextvars는 프로세스 경계를 넘지 못함)
+_RENDER_SETTINGS = (_RENDER_SCALE, _CANVAS_MODE, _ENCODE_OPTIONS)
+
+
+def _render_settings():
+    """현재 렌더링 설정 스냅샷 (render_scale, canvas_mode, encode_options)"""
+    return tuple(var.get() for var in _RENDER_SETTINGS)
+
+
+def _reset_render_settings():
+    """렌더링 설정과 캔버스 대상을 기본값으로"""
+    defaults = contextvars.Context()
+    for var in _RENDER_SETTINGS + (_CANVAS_TARGET, _CURRENT_CHART):
+        var.set(defaults.run(var.get))
+
+
+def _run_with_settings(settings, fn, *args):
+    """호출한 쪽의 렌더링 설정을 적용해서 실행 (프로세스 워커에서)"""
+    tokens = [var.set(value) for var, value in zip(_RENDER_SETTINGS, settings)]
+    try:
+        return fn(*args)
+    finally:
+        for var, token in zip(reversed(_RENDER_SETTINGS), reversed(tokens)):
+            var.reset(token)
+
+
+# 프로세스 풀은 (워커 수, 12지 경로)별로 하나만 만들어 재사용
+#   -> 워커 시작 + 폰트/12지 이미지 로드는 처음 한 번만 (호출마다 풀을 만들면 그 시간이 매번 듦)
+_PROCESS_POOLS = {}
+_PROCESS_POOLS_LOCK = threading.Lock()
+
+
+def _process_pool(max_workers, zodiac_path=None):
+    """공유 프로세스 풀 (처음 쓸 때 생성)"""
+    key = (max_workers, zodiac_path)
+    with _PROCESS_POOLS_LOCK:
+        pool = _PROCESS_POOLS.get(key)
+        if pool is None:
+            pool = _PROCESS_POOLS[key] = ProcessPoolExecutor(max_workers=max_workers,
+                                                             initializer=init_render_worker,
+                                                             initargs=(zodiac_path,))
+    return pool
+
+
+def _discard_process_pool(pool):
+    """깨진 공유 풀(워커가 죽음)을 버림 -> 다음 호출에서 새로 만듦"""
+    with _PROCESS_POOLS_LOCK:
+        keys = [key for key, value in _PROCESS_POOLS.items() if value is pool]
+        for key in keys:
+            del _PROCESS_POOLS[key]
+    if keys:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_render_pools():
+    """공유 프로세스 풀 모두 종료 (프로그램 종료 시 자동 호출)"""
+    with _PROCESS_POOLS_LOCK:
+        pools = list(_PROCESS_POOLS.values())
+        _PROCESS_POOLS.clear()
+    for pool in pools:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+atexit.register(shutdown_render_pools)
+
+
+@contextmanager
+def _executor(backend, max_workers, zodiac_path=None, wait=True):
+    """
+    백엔드별 실행기 (serial이면 None)
+    - thread: 호출마다 새 스레드 풀, 블록이 끝나면 종료 (wait=False면 기다리지 않음)
+    - process: 공유 프로세스 풀, 블록이 끝나도 유지 (남은 작업 취소는 호출한 쪽에서)
+    """
+    if backend not in RENDER_BACKENDS:
+        raise ValueError(f"지원하지 않는 backend: {backend} (가능: {', '.join(RENDER_BACKENDS)})")
+    
+    if backend == 'serial':
+        yield None
+    elif backend == 'process':
+        pool = _process_pool(max_workers, zodiac_path)
+        try:
+            yield pool
+        except BrokenExecutor:
+            _discard_process_pool(pool)
+            raise
+    else:
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            yield executor
+        finally:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+
+def _submit_call(submit, backend, fn, *args):
+    """
+    실행기에 함수 호출 제출 (현재 render_scale/canvas_mode/encode_options 설정을 함께 전달)
+    - thread: 현재 컨텍스트를 복사해서 실행
+    - process: 설정 스냅샷을 인자로 넘겨 워커에서 적용
+    """
+    if backend == 'thread':
+        return submit(contextvars.copy_context().run, fn, *args)
+    return submit(_run_with_settings, _render_settings(), fn, *args)
+
+
+def _submit_chart(submit, backend, name, job):
+    """차트 하나를 실행기에 제출"""
+    return _submit_call(submit, backend, _render_chart_result, name, job)
+
+
+# ============================================
+# 스트리밍 이미지 생성 (완성되는 순서대로 반환)
+# ============================================
+def iter_images(job, backend='thread', max_workers=4, zodiac_path=None):
+    """
+    작업 하나(1명)의 차트를 완성되는 순서대로 (차트 이름, PNG 바이트)로 반환하는 제너레이터
+    첫 차트는 전체가 아니라 차트 하나 렌더링 시간 만에 나옴
+    
+    Args:
+        job: 작업 dict ('charts'로 차트 선택, 'scale'/'canvas_mode'로 렌더링 옵션)
+        backend: 'thread' | 'process' | 'serial'
+    
+    실패한 차트는 바이트 대신 "Error: ..." 문자열
+    중간에 반복을 멈추면 아직 시작하지 않은 차트는 취소
+    """
+    names = _job_charts(job)
+    
+    with _executor(backend, max_workers, zodiac_path) as executor:
+        if executor is None:
+            if zodiac_path:
+                load_zodiac_sprites(zodiac_path)
+            for name in names:
+                yield _render_chart_result(name, job)
+            return
+        
+        futures = {_submit_chart(executor.submit, backend, name, job): name for name in names}
+        try:
+            for future in as_completed(futures):
+                try:
+                    yield future.result()
+                except BrokenExecutor as e:
+                    _discard_process_pool(executor)
+                    yield futures[future], f"Error: {e}"
+                except Exception as e:
+                    yield futures[future], f"Error: {e}"
+        finally:
+            # 중간에 멈추면 아직 시작하지 않은 차트 취소 (공유 풀은 종료하지 않음)
+            for future in futures:
+                future.cancel()
+
+
+async def aiter_images(job, backend='thread', max_workers=4, zodiac_path=None):
+    """
+    iter_images의 비동기 버전 (이벤트 루프를 막지 않음)
+    예) async for name, data in aiter_images(job): await websocket.send_bytes(data)
+    
+    backend='serial'이면 워커 스레드 하나에서 순서대로 렌더링
+    """
+    names = _job_charts(job)
+    if backend == 'serial':
+        backend, max_workers = 'thread', 1
+    
+    loop = asyncio.get_running_loop()
+    
+    # 스레드 풀 종료를 기다리지 않음 (이벤트 루프를 막지 않게)
+    with _executor(backend, max_workers, zodiac_path, wait=False) as executor:
+        async def run(name):
+            try:
+                return await _submit_chart(lambda *args: loop.run_in_executor(executor, *args),
+                                           backend, name, job)
+            except BrokenExecutor as e:
+                _discard_process_pool(executor)
+                return name, f"Error: {e}"
+            except Exception as e:
+                return name, f"Error: {e}"
+        
+        tasks = [asyncio.ensure_future(run(name)) for name in names]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
 
 
 # ============================================
@@ -2830,72 +3454,222 @@ def create_일진표(year, month, 기본정보=None, output_path="일진표.png"
 # ============================================
 def generate_all_images_parallel(사주_data, 대운_data, 세운_data, 월운_data, 
                                   기본정보, 신살_data=None, output_dir="/tmp",
-                                  zodiac_path=None, max_workers=4):
+                                  zodiac_path=None, max_workers=4, backend='thread'):
     """
     모든 이미지를 병렬로 생성 (대형 서비스용 최적화)
     
     Args:
-        max_workers: 동시 처리 스레드 수 (기본 4)
+        max_workers: 동시 처리 워커 수 (기본 4)
+        backend: 'thread' | 'process' | 'serial'
+            - thread: 스레드 풀 (GIL 때문에 렌더링 병렬성 제한)
+            - process: 프로세스 풀 (워커가 폰트/12지 이미지 미리 로드)
+            - serial: 순차 실행
+    
+    iter_images로 완성되는 순서대로 PNG 바이트를 받아 파일로 저장
     
     Returns:
         dict: 이미지 파일 경로들
     """
-    import os
-    
-    # 이미지 생성 태스크 정의
-    tasks = [
-        ('원국표', create_원국표, (사주_data, 기본정보, f"{output_dir}/원국표.png", 신살_data, zodiac_path)),
-        ('대운표', create_대운표, (대운_data, 기본정보, f"{output_dir}/대운표.png")),
-        ('세운표', create_세운표, (세운_data, 기본정보, f"{output_dir}/세운표.png")),
-        ('월운표', create_월운표, (월운_data, 기본정보, f"{output_dir}/월운표.png")),
-        ('12운성표', create_12운성표, (사주_data, 기본정보, f"{output_dir}/12운성표.png")),
-        ('지장간표', create_지장간표, (사주_data, 기본정보, f"{output_dir}/지장간표.png")),
-        ('납음오행표', create_납음오행표, (사주_data, 기본정보, f"{output_dir}/납음오행표.png")),
-        ('오행차트', create_오행차트, (사주_data, 기본정보, f"{output_dir}/오행차트.png")),
-    ]
+    job = {
+        '사주_data': 사주_data,
+        '대운_data': 대운_data,
+        '세운_data': 세운_data,
+        '월운_data': 월운_data,
+        '기본정보': 기본정보,
+        '신살_data': 신살_data,
+        'zodiac_path': zodiac_path,
+    }
+    results = {}
+    for name, result in iter_images(job, backend, max_workers, zodiac_path):
+        if isinstance(result, bytes):
+            path = f"{output_dir}/{name}.png"
+            with open(path, 'wb') as f:
+                f.write(result)
+            result = path
+        results[name] = result
     
-    # 신살 데이터가 있으면 신살표 추가
-    if 신살_data:
-        tasks.append(('신살표', create_신살표, (신살_data, 기본정보, f"{output_dir}/신살표.png")))
+    return results
+
+
+def generate_images_batch(jobs, backend='process', max_workers=None, zodiac_path=None, chunksize=1):
+    """
+    여러 명의 차트를 한 번에 생성 (작업 목록 단위)
     
-    results = {}
+    Args:
+        jobs: 작업 dict 목록 (1명 = 1작업, 'charts'로 차트 선택)
+        backend: 'process' | 'thread' | 'serial'
+        max_workers: 워커 수 (None이면 CPU 코어 수)
+        zodiac_path: 워커 초기화 시 미리 로드할 12지 이미지 경로
+        chunksize: 프로세스 풀에 한 번에 넘길 작업 수 (작업이 많을 때 IPC 절감)
     
-    # 병렬 실행
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        future_to_name = {}
-        
-        for name, func, args in tasks:
-            future = executor.submit(func, *args)
-            future_to_name[future] = name
-        
-        for future in as_completed(future_to_name):
-            name = future_to_name[future]
-            try:
-                result = future.result()
-                results[name] = result
-            except Exception as e:
-                results[name] = f"Error: {e}"
+    Returns:
+        list: 작업 순서대로 {차트 이름: PNG 바이트}
+    """
+    with _executor(backend, max_workers, zodiac_path) as executor:
+        if executor is None:
+            if zodiac_path:
+                load_zodiac_sprites(zodiac_path)
+            return [render_job(job) for job in jobs]
+        # executor.map은 호출한 쪽의 설정을 전달하지 않으므로 설정 스냅샷을 함께 넘김
+        run = functools.partial(_run_with_settings, _render_settings(), render_job)
+        if backend == 'process':
+            return list(executor.map(run, jobs, chunksize=chunksize))
+        return list(executor.map(run, jobs))
+
+
+# ============================================
+# 리포트 시트 (여러 차트를 한 장에)
+# ============================================
+def _draw_report_header(draw, 기본정보, width, y=0):
+    """리포트 공통 헤더 (이름 + 양력/음력) -> 헤더 높이 반환"""
+    font_name = get_font(28, bold=True)
+    font_info = get_font(14, bold=True)
     
-    return results
+    draw.text((width // 2, y + 30), f"{기본정보['이름']}님 사주 분석 리포트",
+              font=font_name, fill='#333333', anchor='mm')
+    
+    info = [f"{key}: {기본정보[key]}" for key in ('양력', '음력') if 기본정보.get(key)]
+    if info:
+        draw.text((width // 2, y + 62), "  |  ".join(info), font=font_info, fill='#666666', anchor='mm')
+    
+    draw.line([(40, y + 84), (width - 40, y + 84)], fill='#E0E0E0', width=2)
+    return 96
+
+
+def _draw_chart_into(sheet, draw, name, job, x, y):
+    """차트 하나를 시트의 (x, y) 위치에 직접 그림"""
+    func, build_args = CHART_TASKS[name]
+    token = _CANVAS_TARGET.set(_SheetTarget(sheet, draw, x, y))
+    try:
+        func(*build_args(job, None))
+    finally:
+        _CANVAS_TARGET.reset(token)
+
+
+def measure_chart(name, job):
+    """차트를 그리지 않고 크기만 측정 -> (width, height)"""
+    func, build_args = CHART_TASKS[name]
+    target = _SheetTarget()
+    token = _CANVAS_TARGET.set(target)
+    try:
+        func(*build_args(job, None))
+    finally:
+        _CANVAS_TARGET.reset(token)
+    return target.region.size
+
+
+def create_report_sheet(job, output_path="리포트.png", columns=2, output_format=None):
+    """
+    선택한 차트들을 한 장의 리포트로 생성 (인코딩 1회)
+    - 각 차트는 시트의 자기 영역에 직접 그림 (차트별 PNG 인코딩/디코딩 없음)
+    - 헤더(이름/양력/음력)와 폰트는 모든 차트가 공유
+    
+    Args:
+        job: 작업 dict (generate_images_batch와 동일, 'charts'로 차트 선택)
+        columns: 한 줄에 놓을 차트 수 (PNG)
+        output_format: 'PNG' | 'PDF' (None이면 파일 확장자로 판단)
+            - PDF: 차트마다 한 페이지 (Pillow 다중 페이지 PDF)
+    """
+    if output_format is None:
+        is_pdf = isinstance(output_path, str) and output_path.lower().endswith('.pdf')
+        output_format = 'PDF' if is_pdf else 'PNG'
+    output_format = output_format.upper()
+    
+    margin = 30
+    gap = 20
+    names = _job_charts(job)
+    sizes = {name: measure_chart(name, job) for name in names}
+    
+    # PDF: 차트별 페이지
+    if output_format == 'PDF':
+        pages = []
+        for name in names:
+            chart_w, chart_h = sizes[name]
+            width = chart_w + margin * 2
+            page = Image.new('RGB', (width, 96 + chart_h + margin), '#FFFFFF')
+            draw = ImageDraw.Draw(page)
+            header_h = _draw_report_header(draw, job['기본정보'], width)
+            _draw_chart_into(page, draw, name, job, margin, header_h)
+            pages.append(page)
+        
+        if output_path is None:
+            return pages
+        pages[0].save(output_path, 'PDF', save_all=True, append_images=pages[1:], resolution=96)
+        return output_path
+    
+    # PNG: 격자 배치 (열 너비 = 가장 넓은 차트)
+    col_width = max(w for w, h in sizes.values())
+    rows = [names[i:i + columns] for i in range(0, len(names), columns)]
+    row_heights = [max(sizes[name][1] for name in row) for row in rows]
+    
+    width = margin * 2 + col_width * columns + gap * (columns - 1)
+    height = 96 + sum(row_heights) + gap * (len(rows) - 1) + margin
+    
+    sheet = Image.new('RGBA', (width, height), (255, 255, 255, 255))
+    draw = ImageDraw.Draw(sheet)
+    y = _draw_report_header(draw, job['기본정보'], width)
+    
+    for row, row_height in zip(rows, row_heights):
+        for col, name in enumerate(row):
+            chart_w, chart_h = sizes[name]
+            x = margin + col * (col_width + gap) + (col_width - chart_w) // 2
+            _draw_chart_into(sheet, draw, name, job, x, y)
+        y += row_height + gap
+    
+    if output_path is None:
+        return sheet
+    sheet.save(output_path, 'PNG')
+    return output_path
+
+
+# 차트별 실제 사용 폰트 (크기, bold)
+CHART_FONT_SIZES = {
+    '원국표': [(10, True), (12, False), (12, True), (14, True), (18, True), (28, True), (36, True)],
+    '대운표': [(10, True), (12, True), (24, True)],
+    '세운표': [(10, True), (12, True), (24, True)],
+    '월운표': [(9, True), (10, True), (11, True), (22, True), (24, True)],
+    '오행차트': [(14, True), (16, True), (24, True), (28, True)],
+    '십성표': [(11, True), (12, True), (24, True)],
+    '오행도': [(12, True), (14, True), (20, True), (28, True)],
+    '신살표': [(11, True), (12, True), (14, True), (24, True)],
+    '12운성표': [(12, True), (14, True), (16, True), (24, True)],
+    '지장간표': [(12, True), (14, True), (24, True)],
+    '합충형파해표': [(12, True), (14, True), (16, True), (24, True)],
+    '궁성표': [(11, True), (12, True), (13, True), (14, True), (18, True), (24, True)],
+    '육친표': [(12, True), (14, True), (24, True)],
+    '납음오행표': [(12, True), (14, True), (24, True)],
+    '격국표': [(12, True), (14, True), (18, True), (24, True)],
+    '공망표': [(12, True), (14, True), (20, True), (24, True)],
+    '용신표': [(11, True), (12, True), (14, True), (16, True), (24, True), (28, True)],
+    '일진표': [(9, False), (13, True), (15, True), (16, False), (20, False), (20, True)],
+    '리포트': [(14, True), (28, True)],
+}
 
 
-def preload_fonts():
+def preload_fonts(charts=None):
     """
-    자주 사용하는 폰트 미리 로드 (앱 시작 시 호출)
+    차트에서 쓰는 폰트 미리 로드 (앱/워커 시작 시 호출)
+    charts: 차트 이름 목록 (None이면 전체)
     """
-    common_sizes = [10, 11, 12, 14, 16, 18, 20, 22, 24, 28, 32, 36, 40]
+    sizes = set()
+    for name in (charts or CHART_FONT_SIZES):
+        sizes.update(CHART_FONT_SIZES.get(name, []))
     
-    for size in common_sizes:
-        get_font(size, bold=True)
-        get_font(size, bold=False)
+    for size, bold in sorted(sizes):
+        get_font(size, bold=bold)
     
-    return len(_FONT_CACHE)
+    return len(FONT_MANAGER)
 
 
 def get_cache_stats():
     """캐시 상태 확인"""
     return {
-        'font_cache_size': len(_FONT_CACHE),
+        'font_cache_size': len(FONT_MANAGER),
+        'font_manager': FONT_MANAGER.stats(),
         'bold_font_path': _BOLD_PATH,
         'regular_font_path': _REGULAR_PATH,
+        'render_cache': get_render_cache_stats(),
+        'body_cache': get_body_cache_stats(),
+        'tile_cache': get_tile_cache_stats(),
+        'text_layout': get_text_layout_stats(),
     }
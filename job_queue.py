@@ -0,0 +1,567 @@
+# 일괄 작업 큐 (SQLite + 별도 워커 프로세스, Streamlit 스크립트와 분리)
+#
+# 탭은 작업을 넣고(submit) 상태/진행률만 읽음(get)
+#   -> 다시 실행(rerun)/탭 이동/브라우저 종료와 관계없이 작업은 워커에서 계속됨
+# 워커는 `python -m saju worker`로 뜨는 프로세스 (ensure_workers가 대기 작업이 있을 때 띄움)
+#   -> 서버 하나에서 동시에 실행하는 작업은 max_running개까지 (나머지는 대기)
+#   -> 대기 작업은 priority가 작은 것부터, 같으면 들어온 순서대로
+#   -> 워커는 nice 값을 올려서 실행 -> 같은 서버의 1명 렌더링(탭1)이 CPU를 먼저 씀
+# 결과(샤드 ZIP, 오류 목록)는 작업 디렉터리에 남음
+# 워커가 죽으면(하트비트 끊김 + 맡은 워커 pid 없음) 작업을 다시 대기로 돌림 -> BatchJob 체크포인트에서 이어서 실행
+#   -> 하트비트는 작업 실행 내내 별도 스레드가 기록 (체크포인트 재생/풀 시작처럼 진행률이 없는 구간 포함)
+#   -> claim마다 새 토큰을 발급, 진행률/종료 기록은 토큰이 맞을 때만 (작업을 잃은 워커는 멈춤)
+# 예)
+#   queue = JobQueue(path)
+#   queue.submit(job_id, 'batch', params, job_dir); queue.ensure_workers()   # 'export': 계산 데이터만
+#   queue.get(job_id).status / .done / .total / .result
+import json
+import os
+import shutil
+import sqlite3
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from collections import namedtuple
+from contextlib import closing
+
+# 우선순위 (작을수록 먼저, 대기 작업 순서만 정함 -> 실행 중인 작업을 멈추지는 않음)
+#   INTERACTIVE: 사람이 바로 결과를 기다리는 작은 작업 (웹앱에서 인원이 적은 일괄 작업)
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BATCH = 10
+
+# 워커 프로세스 nice 값 (대화형 렌더링보다 CPU 양보)
+WORKER_NICE = 10
+
+# 진행률 기록 간격 / 하트비트 간격 / 이 시간 동안 하트비트가 없으면 죽은 작업으로 봄 (초)
+PROGRESS_INTERVAL = 1.0
+HEARTBEAT_INTERVAL = 10.0
+STALE_SECONDS = 120
+
+# 대기 작업이 없을 때 확인 간격 / 이 시간 동안 작업이 없으면 워커 종료 (초)
+POLL_INTERVAL = 1.0
+IDLE_TIMEOUT = 60
+
+# 작업 상태
+#   queued -> running -> done | failed | cancelled
+#   running 중 cancel -> cancelling -> cancelled (진행 중인 행까지 마치고 종료)
+ACTIVE_STATUSES = ('queued', 'running', 'cancelling')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    status TEXT NOT NULL,
+    priority INTEGER NOT NULL,
+    params TEXT NOT NULL,
+    job_dir TEXT NOT NULL,
+    created REAL NOT NULL,
+    started REAL,
+    finished REAL,
+    heartbeat REAL,
+    done INTEGER NOT NULL DEFAULT 0,
+    total INTEGER NOT NULL DEFAULT 0,
+    message TEXT NOT NULL DEFAULT '',
+    result TEXT NOT NULL DEFAULT '{}',
+    error TEXT,
+    owner INTEGER,
+    token TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_queued ON jobs (status, priority, created);
+CREATE TABLE IF NOT EXISTS workers (
+    pid INTEGER PRIMARY KEY,
+    started REAL NOT NULL
+);
+"""
+
+# 큐의 작업 하나 (params, result는 dict)
+QueueJob = namedtuple('QueueJob', [
+    'id', 'kind', 'status', 'priority', 'params', 'job_dir', 'created', 'started', 'finished',
+    'heartbeat', 'done', 'total', 'message', 'result', 'error', 'owner', 'token',
+])
+
+# 이전 스키마로 만든 큐 파일에 추가할 열
+_ADDED_COLUMNS = (('owner', 'INTEGER'), ('token', 'TEXT'))
+
+
+def _row_to_job(row):
+    if row is None:
+        return None
+    job = QueueJob(*row)
+    return job._replace(params=json.loads(job.params), result=json.loads(job.result))
+
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class JobQueue:
+    """
+    SQLite 작업 큐 (여러 Streamlit 세션/워커 프로세스가 같은 파일을 공유)
+
+    Args:
+        path: SQLite 파일 경로 (디렉터리 없으면 생성)
+        max_running: 동시에 실행하는 최대 작업 수 (= 띄우는 최대 워커 수)
+    """
+
+    def __init__(self, path, max_running=1):
+        self.path = path
+        self.max_running = max_running
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with closing(self._connect()) as db:
+            db.execute('PRAGMA journal_mode=WAL')
+            db.executescript(_SCHEMA)
+            db.execute('BEGIN IMMEDIATE')
+            columns = {row[1] for row in db.execute('PRAGMA table_info(jobs)')}
+            for column, column_type in _ADDED_COLUMNS:
+                if column not in columns:
+                    db.execute(f'ALTER TABLE jobs ADD COLUMN {column} {column_type}')
+            db.execute('COMMIT')
+
+    def _connect(self):
+        # 호출마다 연결 (Streamlit 세션 스레드/워커 프로세스 어디서 불러도 안전)
+        # isolation_level=None: 자동 커밋, 여러 문장은 BEGIN IMMEDIATE로 직접 묶음
+        return sqlite3.connect(self.path, timeout=30, isolation_level=None)
+
+    def submit(self, job_id, kind, params, job_dir, priority=PRIORITY_BATCH):
+        """
+        작업 추가 -> QueueJob
+        같은 ID가 이미 대기/실행 중이면 그 작업을 그대로 반환, 끝난 작업이면 다시 대기로
+        """
+        now = time.time()
+        with closing(self._connect()) as db:
+            db.execute(
+                "INSERT INTO jobs (id, kind, status, priority, params, job_dir, created) "
+                "VALUES (?, ?, 'queued', ?, ?, ?, ?) "
+                "ON CONFLICT(id) DO UPDATE SET status = 'queued', kind = excluded.kind, "
+                "priority = excluded.priority, params = excluded.params, job_dir = excluded.job_dir, "
+                "created = excluded.created, started = NULL, finished = NULL, heartbeat = NULL, "
+                "done = 0, total = 0, message = '', result = '{}', error = NULL, owner = NULL, token = NULL "
+                "WHERE jobs.status NOT IN (?, ?, ?)",
+                (job_id, kind, priority, json.dumps(params, ensure_ascii=False), job_dir, now, *ACTIVE_STATUSES))
+        return self.get(job_id)
+
+    def get(self, job_id):
+        """작업 상태 -> QueueJob (없으면 None)"""
+        with closing(self._connect()) as db:
+            row = db.execute(f"SELECT {', '.join(QueueJob._fields)} FROM jobs WHERE id = ?",
+                             (job_id,)).fetchone()
+        return _row_to_job(row)
+
+    def position(self, job_id):
+        """대기 중인 작업의 순번 (1이면 다음 차례, 대기 중이 아니면 0)"""
+        with closing(self._connect()) as db:
+            row = db.execute(
+                "SELECT COUNT(*) FROM jobs AS other, jobs AS job WHERE job.id = ? "
+                "AND job.status = 'queued' AND other.status = 'queued' "
+                "AND (other.priority < job.priority OR "
+                "     (other.priority = job.priority AND other.created <= job.created))",
+                (job_id,)).fetchone()
+        return row[0]
+
+    def cancel(self, job_id):
+        """작업 취소 (대기 중이면 바로, 실행 중이면 워커가 다음 진행률 기록 때 멈춤)"""
+        with closing(self._connect()) as db:
+            db.execute(
+                "UPDATE jobs SET status = CASE status WHEN 'queued' THEN 'cancelled' ELSE 'cancelling' END, "
+                "finished = CASE status WHEN 'queued' THEN ? ELSE finished END "
+                "WHERE id = ? AND status IN ('queued', 'running')",
+                (time.time(), job_id))
+
+    def _dead_jobs(self, db, now):
+        """하트비트가 끊기고 맡은 워커 프로세스도 없는 실행 중 작업 -> [(id, status)]"""
+        rows = db.execute("SELECT id, status, owner FROM jobs "
+                          "WHERE status IN ('running', 'cancelling') AND heartbeat < ?",
+                          (now - STALE_SECONDS,)).fetchall()
+        return [(job_id, status) for job_id, status, owner in rows if owner is None or not _pid_alive(owner)]
+
+    def claim(self, owner=None):
+        """
+        다음 대기 작업을 running으로 바꿔서 반환 (워커에서 호출, owner: 워커 pid)
+        실행 중인 작업이 max_running개면 None (워커가 더 떠 있어도 동시 실행 수는 제한됨)
+        반환한 작업의 token으로 진행률/종료를 기록
+        """
+        now = time.time()
+        owner = os.getpid() if owner is None else owner
+        token = uuid.uuid4().hex
+        with closing(self._connect()) as db:
+            db.execute('BEGIN IMMEDIATE')
+            try:
+                # 워커가 죽은 작업은 다시 대기로 (체크포인트에서 이어서 실행), 취소 중이던 것은 취소로
+                for job_id, status in self._dead_jobs(db, now):
+                    if status == 'running':
+                        db.execute("UPDATE jobs SET status = 'queued', owner = NULL, token = NULL "
+                                   "WHERE id = ?", (job_id,))
+                    else:
+                        db.execute("UPDATE jobs SET status = 'cancelled', finished = ? WHERE id = ?",
+                                   (now, job_id))
+                running = db.execute("SELECT COUNT(*) FROM jobs WHERE status IN ('running', 'cancelling')"
+                                     ).fetchone()[0]
+                row = None
+                if running < self.max_running:
+                    row = db.execute(f"SELECT {', '.join(QueueJob._fields)} FROM jobs WHERE status = 'queued' "
+                                     "ORDER BY priority, created LIMIT 1").fetchone()
+                if row is not None:
+                    db.execute("UPDATE jobs SET status = 'running', started = ?, heartbeat = ?, "
+                               "owner = ?, token = ? WHERE id = ?", (now, now, owner, token, row[0]))
+                db.execute('COMMIT')
+            except BaseException:
+                db.execute('ROLLBACK')
+                raise
+        job = _row_to_job(row)
+        if job is None:
+            return None
+        return job._replace(status='running', started=now, heartbeat=now, owner=owner, token=token)
+
+    def heartbeat(self, job):
+        """하트비트만 기록 -> 작업을 계속 맡고 있으면 True"""
+        with closing(self._connect()) as db:
+            cursor = db.execute("UPDATE jobs SET heartbeat = ? WHERE id = ? AND token = ?",
+                                (time.time(), job.id, job.token))
+        return cursor.rowcount > 0
+
+    def update_progress(self, job, done, total, message='', result=None):
+        """
+        진행률 + 하트비트 기록 -> 현재 상태
+        'cancelling'이면 작업을 멈춰야 함, None이면 작업을 잃음 (다른 워커가 맡음) -> 결과를 더 쓰지 말 것
+        """
+        with closing(self._connect()) as db:
+            db.execute(
+                "UPDATE jobs SET done = ?, total = ?, message = ?, result = COALESCE(?, result), heartbeat = ? "
+                "WHERE id = ? AND token = ?",
+                (done, total, message, json.dumps(result, ensure_ascii=False) if result is not None else None,
+                 time.time(), job.id, job.token))
+            row = db.execute("SELECT status FROM jobs WHERE id = ? AND token = ?", (job.id, job.token)).fetchone()
+        return row[0] if row else None
+
+    def finish(self, job, status, result=None, error=None, message=None):
+        """작업 종료 기록 (done | failed | cancelled, 작업을 잃었으면 기록하지 않음)"""
+        with closing(self._connect()) as db:
+            db.execute(
+                "UPDATE jobs SET status = ?, finished = ?, result = COALESCE(?, result), error = ?, "
+                "message = COALESCE(?, message), token = NULL WHERE id = ? AND token = ?",
+                (status, time.time(), json.dumps(result, ensure_ascii=False) if result is not None else None,
+                 error, message, job.id, job.token))
+
+    # ============================================
+    # 워커 프로세스 관리
+    # ============================================
+
+    def _live_workers(self, db):
+        """살아 있는 워커 pid (죽은 워커 기록은 정리)"""
+        pids = [pid for (pid,) in db.execute("SELECT pid FROM workers")]
+        dead = [pid for pid in pids if not _pid_alive(pid)]
+        if dead:
+            db.executemany("DELETE FROM workers WHERE pid = ?", [(pid,) for pid in dead])
+        return [pid for pid in pids if pid not in dead]
+
+    def ensure_workers(self):
+        """대기 작업이 있는데 워커가 모자라면 띄움 (최대 max_running개) -> 새로 띄운 수"""
+        with closing(self._connect()) as db:
+            # 대기 작업 + 워커가 죽어서 다시 대기로 돌릴 작업
+            queued = db.execute("SELECT COUNT(*) FROM jobs WHERE status = 'queued'").fetchone()[0]
+            queued += len(self._dead_jobs(db, time.time()))
+            missing = min(queued, self.max_running - len(self._live_workers(db)))
+        for _ in range(max(missing, 0)):
+            self._spawn_worker()
+        return max(missing, 0)
+
+    def _spawn_worker(self):
+        log_path = os.path.join(os.path.dirname(os.path.abspath(self.path)), 'worker.log')
+        with open(log_path, 'ab') as log:
+            # 새 세션으로 띄워서 Streamlit 프로세스가 재시작돼도 작업은 계속됨
+            process = subprocess.Popen(
+                [sys.executable, '-m', 'saju', 'worker', '--queue', self.path,
+                 '--max-running', str(self.max_running)],
+                cwd=os.path.dirname(os.path.abspath(__file__)),
+                stdin=subprocess.DEVNULL, stdout=log, stderr=log, start_new_session=True)
+        with closing(self._connect()) as db:
+            db.execute("INSERT OR REPLACE INTO workers (pid, started) VALUES (?, ?)", (process.pid, time.time()))
+        return process.pid
+
+    def register_worker(self, pid):
+        with closing(self._connect()) as db:
+            db.execute("INSERT OR REPLACE INTO workers (pid, started) VALUES (?, ?)", (pid, time.time()))
+
+    def unregister_worker(self, pid):
+        with closing(self._connect()) as db:
+            db.execute("DELETE FROM workers WHERE pid = ?", (pid,))
+
+
+# ============================================
+# 워커
+# ============================================
+
+class _Heartbeat:
+    """작업 실행 중 HEARTBEAT_INTERVAL마다 하트비트를 기록하는 스레드 (with 블록 동안)"""
+
+    def __init__(self, queue, job, interval=HEARTBEAT_INTERVAL):
+        self.queue = queue
+        self.job = job
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f'heartbeat-{job.id}', daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                if not self.queue.heartbeat(self.job):
+                    return
+            except sqlite3.Error:
+                pass  # 잠깐 잠긴 경우 등 -> 다음 간격에 다시
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+
+
+def run_worker(queue, idle_timeout=IDLE_TIMEOUT, log=print):
+    """
+    대기 작업을 하나씩 꺼내서 실행 (idle_timeout초 동안 작업이 없으면 종료)
+    작업 종류별 실행 함수는 JOB_HANDLERS
+    """
+    try:
+        os.nice(WORKER_NICE)
+    except (AttributeError, OSError):
+        pass
+    pid = os.getpid()
+    queue.register_worker(pid)
+    idle_since = time.monotonic()
+    try:
+        while True:
+            job = queue.claim(pid)
+            if job is None:
+                if time.monotonic() - idle_since >= idle_timeout:
+                    return
+                time.sleep(POLL_INTERVAL)
+                continue
+            log(f"작업 시작: {job.id} ({job.kind})")
+            try:
+                with _Heartbeat(queue, job):
+                    status = JOB_HANDLERS[job.kind](queue, job)
+            except Exception as e:
+                queue.finish(job, 'failed', error=f"{type(e).__name__}: {e}")
+                log(f"작업 실패: {job.id} - {e}")
+            else:
+                log(f"작업 종료: {job.id} ({status})")
+            idle_since = time.monotonic()
+    finally:
+        queue.unregister_worker(pid)
+
+
+def batch_error_path(job_dir):
+    """일괄 작업 오류 목록 파일 (한 줄에 [행, 이름, 차트 또는 None, 메시지])"""
+    return os.path.join(job_dir, 'errors.jsonl')
+
+
+def read_batch_errors(job_dir):
+    """오류 목록 -> (입력 오류 [(행, 이름, 메시지)], 차트 실패 [(행, 이름, 차트, 메시지)])"""
+    skipped, failed = [], []
+    try:
+        with open(batch_error_path(job_dir), encoding='utf-8') as f:
+            for line in f:
+                try:
+                    row, name, chart, message = json.loads(line)
+                except ValueError:
+                    continue
+                if chart is None:
+                    skipped.append((row, name, message))
+                else:
+                    failed.append((row, name, chart, message))
+    except FileNotFoundError:
+        pass
+    return skipped, failed
+
+
+def run_batch_job(queue, job):
+    """
+    'batch' 작업 실행 (워커 프로세스에서)
+    params: input(입력 파일 경로), charts, image_format, workers, zodiac_path, render_cache,
+            shard_people, shard_bytes, shard_name
+    result: shards(완성된 ZipShard dict 목록), skipped_rows, failed_charts, reused, dedup
+    """
+    from batch_input import RowError, open_persons
+    from batch_job import BatchJob
+    from batch_pipeline import BatchProgress, DedupStats, iter_batch
+    from zip_sink import ShardedZipSink
+
+    params = job.params
+    if params.get('render_cache'):
+        import image_generator
+        image_generator.configure_render_cache(params['render_cache'])
+
+    image_format = params.get('image_format', 'png')
+    checkpoint = BatchJob(job.job_dir, params['charts'], image_format)
+    reader = open_persons(params['input'])
+    progress = BatchProgress(max(reader.estimated - checkpoint.completed, 0))
+    stats = DedupStats()
+    result = {'shards': [], 'skipped_rows': 0, 'failed_charts': 0, 'reused': 0, 'dedup': ''}
+
+    shard_dir = os.path.join(job.job_dir, 'shards')
+    shutil.rmtree(shard_dir, ignore_errors=True)
+    shards = ShardedZipSink(shard_dir, params.get('shard_people'), params.get('shard_bytes'),
+                            name=params.get('shard_name', 'part{index:03d}.zip'))
+    errors = open(batch_error_path(job.job_dir), 'w', encoding='utf-8')
+
+    def add_error(row, name, chart, message):
+        errors.write(json.dumps([row, name, chart, message], ensure_ascii=False) + '\n')
+
+    def valid_rows():
+        for row in reader:
+            if isinstance(row, RowError):
+                result['skipped_rows'] += 1
+                add_error(row.row, row.이름, None, row.message)
+            else:
+                yield row
+
+    def publish(completed):
+        result['shards'].extend(shard._asdict() for shard in completed)
+        return bool(completed)
+
+    status = 'running'
+    try:
+        # 이전 실행에서 완료한 행이 앞 샤드부터 (일부 차트가 실패한 행은 다시 시도한 뒤 합쳐서)
+        for entry in checkpoint.entries(partial=False):
+            publish(shards.add(checkpoint.entry_files(entry)))
+        last_report = 0.0
+        results = iter_batch(checkpoint.pending(valid_rows()), params['charts'], params.get('workers'),
+                             zodiac_path=params.get('zodiac_path'), image_format=image_format, stats=stats,
+                             charts_for=checkpoint.retry_charts)
+        try:
+            for batch_result in results:
+                entry = checkpoint.record(batch_result)
+                new_shard = bool(entry['files']) and publish(shards.add(checkpoint.entry_files(entry)))
+                for chart, message in batch_result.errors:
+                    result['failed_charts'] += 1
+                    add_error(batch_result.person.row, batch_result.person.이름, chart, message)
+
+                progress.update(progress.done + 1)
+                now = time.perf_counter()
+                if new_shard or now - last_report >= PROGRESS_INTERVAL:
+                    last_report = now
+                    errors.flush()
+                    status = queue.update_progress(job, progress.done, progress.total, progress.text(),
+                                                   result)
+                    if status != 'running':
+                        break
+        finally:
+            results.close()
+        if status is None:
+            # 다른 워커가 이 작업을 맡음 -> 샤드 디렉터리를 더 건드리지 않음
+            shards.discard(remove=False)
+            return 'lost'
+        publish([shard for shard in [shards.close()] if shard])
+    except BaseException:
+        shards.discard()
+        raise
+    finally:
+        errors.close()
+
+    result['reused'] = checkpoint.skipped
+    result['dedup'] = stats.text() if stats.rows else ''
+    status = 'cancelled' if status == 'cancelling' else 'done'
+    queue.update_progress(job, progress.done, progress.total, progress.text(), result)
+    queue.finish(job, status, result,
+                 message=f"{progress.done}명 처리 / {progress.elapsed:.1f}초 / ZIP {len(shards.shards)}개")
+    return status
+
+
+def run_export_job(queue, job):
+    """
+    'export' 작업 실행 (워커 프로세스에서, 이미지 없이 계산 데이터만)
+    params: input(입력 파일 경로), export_format, workers, output_name
+    result: output(완성된 파일 경로, 끝나기 전에는 None), export_format, rows, skipped_rows
+    쓰는 중에는 '.part' 파일 -> 다 쓴 뒤에 output_name으로 바꿈 (취소/실패하면 삭제)
+    """
+    from batch_export import ExportWriter, iter_export
+    from batch_input import RowError, open_persons
+    from batch_pipeline import BatchProgress
+
+    params = job.params
+    reader = open_persons(params['input'])
+    progress = BatchProgress(reader.estimated)
+    result = {'output': None, 'export_format': params['export_format'], 'rows': 0, 'skipped_rows': 0}
+    output = os.path.join(job.job_dir, params['output_name'])
+    partial = output + '.part'
+    errors = open(batch_error_path(job.job_dir), 'w', encoding='utf-8')
+
+    def add_error(row, name, message):
+        result['skipped_rows'] += 1
+        errors.write(json.dumps([row, name, None, message], ensure_ascii=False) + '\n')
+
+    def valid_rows():
+        for row in reader:
+            if isinstance(row, RowError):
+                add_error(row.row, row.이름, row.message)
+            else:
+                yield row
+
+    status = 'running'
+    try:
+        with ExportWriter(partial, params['export_format']) as writer:
+            last_report = 0.0
+            results = iter_export(valid_rows(), params.get('workers'))
+            try:
+                for export_result in results:
+                    if export_result.error is None:
+                        writer.write(export_result.values)
+                    else:
+                        add_error(export_result.person.row, export_result.person.이름, export_result.error)
+
+                    progress.update(progress.done + 1)
+                    now = time.perf_counter()
+                    if now - last_report >= PROGRESS_INTERVAL:
+                        last_report = now
+                        errors.flush()
+                        status = queue.update_progress(job, progress.done, progress.total, progress.text())
+                        if status != 'running':
+                            break
+            finally:
+                results.close()
+        result['rows'] = writer.rows
+    except BaseException:
+        _remove(partial)
+        raise
+    finally:
+        errors.close()
+
+    if status is None:
+        # 다른 워커가 이 작업을 맡음 -> 같은 '.part' 파일을 쓰고 있을 수 있으므로 그대로 둠
+        return 'lost'
+    if status == 'cancelling':
+        _remove(partial)
+        status = 'cancelled'
+        message = f"{progress.done}명 계산 후 중단 / {progress.elapsed:.1f}초"
+    else:
+        os.replace(partial, output)
+        result['output'] = output
+        status = 'done'
+        message = f"{result['rows']}명 내보내기 / {progress.elapsed:.1f}초"
+    queue.update_progress(job, progress.done, progress.total, progress.text(), result)
+    queue.finish(job, status, result, message=message)
+    return status
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+# 작업 종류 -> 실행 함수 (queue, job) -> 종료 상태
+JOB_HANDLERS = {
+    'batch': run_batch_job,
+    'export': run_export_job,
+}
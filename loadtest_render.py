@@ -0,0 +1,143 @@
+# 렌더링 서버 부하 테스트 (로컬)
+#   python loadtest_render.py                           # 임시 서버를 띄워서 측정
+#   python loadtest_render.py --workers 8 --concurrency 16 --requests 400
+#   python loadtest_render.py --address unix:/tmp/saju_render.sock   # 실행 중인 서버 측정
+import argparse
+import os
+import random
+import signal
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+import bench_render
+from render_server import RenderClient, RenderServerError
+
+SERVER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'render_server.py')
+
+
+def make_jobs(count, charts=None, seed=0):
+    """서로 다른 생년월일의 작업 목록 (렌더링 캐시/본문 캐시 적중을 피함)"""
+    rng = random.Random(seed)
+    jobs = []
+    for _ in range(count):
+        job = bench_render.sample_job(rng.randint(1950, 2005), rng.randint(1, 12), rng.randint(1, 28),
+                                      rng.randint(0, 23), rng.choice((0, 30)), rng.choice('남여'))
+        if charts:
+            job['charts'] = charts
+        jobs.append(job)
+    return jobs
+
+
+def percentile(values, p):
+    """최근접 순위 백분위수"""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(p / 100 * len(ordered) + 0.5) - 1))
+    return ordered[index]
+
+
+def start_server(workers):
+    """임시 Unix 소켓으로 서버 실행 -> (프로세스, 주소)"""
+    address = f"unix:{os.path.join(tempfile.mkdtemp(prefix='saju_render_'), 'render.sock')}"
+    process = subprocess.Popen([sys.executable, SERVER_SCRIPT, '--socket', address[len('unix:'):],
+                                '--workers', str(workers)], stdout=subprocess.DEVNULL)
+    client = RenderClient(address, timeout=5)
+    deadline = time.time() + 60
+    while True:
+        try:
+            client.ping()
+            return process, address
+        except RenderServerError:
+            if process.poll() is not None or time.time() > deadline:
+                process.kill()
+                raise
+            time.sleep(0.1)
+
+
+def run(address, jobs, concurrency, requests):
+    """동시 클라이언트 concurrency개로 requests번 요청 -> (요청별 (전체, 첫 차트) 시간, 소요 시간, 오류 수)"""
+    client = RenderClient(address)
+    samples = []
+    errors = []
+    lock = threading.Lock()
+    counter = iter(range(requests))
+
+    def worker():
+        while True:
+            with lock:
+                i = next(counter, None)
+            if i is None:
+                return
+            start = time.perf_counter()
+            first = None
+            try:
+                for _, data in client.iter_images(jobs[i % len(jobs)]):
+                    if first is None:
+                        first = time.perf_counter() - start
+                    if isinstance(data, str):
+                        raise RenderServerError(data)
+            except RenderServerError as e:
+                with lock:
+                    errors.append(str(e))
+                continue
+            with lock:
+                samples.append((time.perf_counter() - start, first))
+
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return samples, time.perf_counter() - start, errors
+
+
+def report(samples, elapsed, errors, charts_per_request):
+    totals = [s[0] * 1000 for s in samples]
+    firsts = [s[1] * 1000 for s in samples if s[1] is not None]
+    print(f"요청 {len(samples)}개 / 오류 {len(errors)}개 / {elapsed:.2f}초")
+    print(f"처리량: {len(samples) / elapsed:.1f} 요청/초 ({len(samples) * charts_per_request / elapsed:.1f} 차트/초)")
+    print(f"{'':<10} {'p50':>8} {'p90':>8} {'p99':>8} {'평균':>8} {'최대':>8}  (ms)")
+    for label, values in (('전체 응답', totals), ('첫 차트', firsts)):
+        if values:
+            print(f"{label:<10} {percentile(values, 50):>8.1f} {percentile(values, 90):>8.1f}"
+                  f" {percentile(values, 99):>8.1f} {statistics.mean(values):>8.1f} {max(values):>8.1f}")
+    for message in sorted(set(errors))[:5]:
+        print(f"  오류: {message}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="렌더링 서버 부하 테스트")
+    parser.add_argument('--address', help="실행 중인 서버 주소 (없으면 임시 서버 실행)")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help="임시 서버 워커 수")
+    parser.add_argument('--concurrency', type=int, default=8, help="동시 클라이언트 수")
+    parser.add_argument('--requests', type=int, default=200, help="총 요청 수")
+    parser.add_argument('--charts', default=None, help="요청당 차트 (쉼표 구분, 기본: 전체 16개)")
+    parser.add_argument('--warmup', type=int, default=0, help="측정 전 요청 수 (기본: 워커 수)")
+    args = parser.parse_args(argv)
+
+    charts = args.charts.split(',') if args.charts else None
+    jobs = make_jobs(50, charts)
+    charts_per_request = len(jobs[0]['charts'])
+
+    process = None
+    address = args.address
+    if address is None:
+        process, address = start_server(args.workers)
+    try:
+        warmup = args.warmup or args.workers
+        run(address, jobs, min(warmup, args.concurrency), warmup)
+        samples, elapsed, errors = run(address, jobs, args.concurrency, args.requests)
+        print(f"서버: {address} / 동시 {args.concurrency} / 요청당 차트 {charts_per_request}개")
+        report(samples, elapsed, errors, charts_per_request)
+    finally:
+        if process is not None:
+            process.send_signal(signal.SIGTERM)
+            process.wait(timeout=30)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,163 @@
+# 렌더링 결과 디스크 캐시 (내용 주소 기반)
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+
+
+def make_cache_key(*parts):
+    """
+    입력값들의 안정적인 해시 키 생성
+    - dict 키 정렬, 튜플/리스트 동일 취급 -> 같은 입력이면 항상 같은 키
+    """
+    payload = json.dumps(parts, sort_keys=True, ensure_ascii=False,
+                         separators=(',', ':'), default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class RenderCache:
+    """
+    인코딩된 이미지 바이트를 디스크에 저장하는 캐시
+    - 크기 제한 LRU 삭제 (최근 사용 순서)
+    - 임시 파일 + os.replace로 원자적 저장 (중간에 죽어도 깨진 파일 없음)
+    - 적중률 / 절약한 바이트 수 통계
+
+    여러 프로세스가 같은 디렉토리를 공유해도 안전하지만,
+    LRU 순서와 용량 계산은 프로세스별로 관리됨 (근사치)
+    """
+
+    SUFFIX = '.img'
+
+    def __init__(self, cache_dir, max_bytes=512 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._index = OrderedDict()  # key -> 바이트 크기 (오래된 것부터)
+        self._total_bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+        self.stores = 0
+        self.evictions = 0
+
+        os.makedirs(cache_dir, exist_ok=True)
+        self._load_index()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key[:2], key + self.SUFFIX)
+
+    def _load_index(self):
+        """기존 캐시 파일 스캔 (수정 시각 순서 = LRU 순서)"""
+        entries = []
+        for root, dirs, files in os.walk(self.cache_dir):
+            for name in files:
+                if not name.endswith(self.SUFFIX):
+                    continue
+                try:
+                    st = os.stat(os.path.join(root, name))
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, name[:-len(self.SUFFIX)], st.st_size))
+
+        for mtime, key, size in sorted(entries):
+            self._index[key] = size
+            self._total_bytes += size
+        self._evict()
+
+    def get(self, key):
+        """캐시 조회 (없으면 None)"""
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            with self._lock:
+                self.misses += 1
+                self._forget(key)
+            return None
+
+        with self._lock:
+            self.hits += 1
+            self.bytes_saved += len(data)
+            if key not in self._index:
+                self._total_bytes += len(data)
+            self._index[key] = len(data)
+            self._index.move_to_end(key)
+
+        try:
+            os.utime(path)  # 재시작 후에도 LRU 순서 유지
+        except OSError:
+            pass
+        return data
+
+    def put(self, key, data):
+        """캐시 저장 (원자적 쓰기)"""
+        if len(data) > self.max_bytes:
+            return
+
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return
+
+        with self._lock:
+            self.stores += 1
+            self._forget(key)
+            self._index[key] = len(data)
+            self._total_bytes += len(data)
+            self._evict()
+
+    def _forget(self, key):
+        size = self._index.pop(key, None)
+        if size is not None:
+            self._total_bytes -= size
+
+    def _evict(self):
+        """용량 초과 시 가장 오래 안 쓴 항목부터 삭제"""
+        while self._total_bytes > self.max_bytes and self._index:
+            key, size = self._index.popitem(last=False)
+            self._total_bytes -= size
+            self.evictions += 1
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
+
+    def clear(self):
+        """캐시 전체 삭제"""
+        with self._lock:
+            for key in list(self._index):
+                try:
+                    os.remove(self._path(key))
+                except OSError:
+                    pass
+            self._index.clear()
+            self._total_bytes = 0
+
+    def stats(self):
+        """캐시 통계"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'bytes_saved': self.bytes_saved,
+                'stores': self.stores,
+                'evictions': self.evictions,
+                'entries': len(self._index),
+                'total_bytes': self._total_bytes,
+                'max_bytes': self.max_bytes,
+            }
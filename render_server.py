@@ -0,0 +1,310 @@
+# 렌더링 서버 (표준 라이브러리만 사용, prefork)
+#
+# 부모 프로세스가 폰트/12지 이미지를 미리 로드한 뒤 워커 N개를 fork
+#   -> 워커는 처음부터 준비된 상태로 같은 리스닝 소켓에서 accept
+#   -> 워커가 죽으면 부모가 다시 띄움 (max_requests마다 교체도 가능)
+# 실행:
+#   python render_server.py --socket /tmp/saju_render.sock --workers 4
+#   python render_server.py --port 8765 --workers 4
+#
+# 프로토콜 (메시지 = 4바이트 길이(big endian) + 본문)
+#   요청: JSON {"job": {... image_generator.iter_images 작업 ...}}  또는 {"op": "ping"}
+#   응답: 차트마다 JSON {"name": 차트, "error": null 또는 메시지} + (성공 시) 인코딩된 이미지 바이트
+#         마지막에 JSON {"done": true, "elapsed": 초}
+# os.fork를 쓰므로 Linux/macOS 전용
+import argparse
+import json
+import os
+import signal
+import socket
+import struct
+import sys
+import time
+
+import image_generator as ig
+
+ZODIAC_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'images', 'zodiac')
+DEFAULT_ADDRESS = os.environ.get('SAJU_RENDER_SERVER', 'unix:/tmp/saju_render.sock')
+
+_HEADER = struct.Struct('>I')
+MAX_MESSAGE = 64 * 1024 * 1024
+
+
+class RenderServerError(Exception):
+    """렌더링 서버 통신 오류"""
+
+
+class _Shutdown(Exception):
+    """부모 프로세스 종료 신호"""
+
+
+# ============================================
+# 메시지 송수신
+# ============================================
+def _recv_exact(sock, size):
+    chunks = []
+    while size:
+        chunk = sock.recv(min(size, 1024 * 1024))
+        if not chunk:
+            raise EOFError
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b''.join(chunks)
+
+
+def recv_message(sock):
+    """메시지 하나 수신 -> 바이트"""
+    (size,) = _HEADER.unpack(_recv_exact(sock, _HEADER.size))
+    if size > MAX_MESSAGE:
+        raise RenderServerError(f"메시지가 너무 큽니다: {size} bytes")
+    return _recv_exact(sock, size)
+
+
+def send_message(sock, data):
+    sock.sendall(_HEADER.pack(len(data)) + data)
+
+
+def recv_json(sock):
+    return json.loads(recv_message(sock).decode('utf-8'))
+
+
+def send_json(sock, obj):
+    send_message(sock, json.dumps(obj, ensure_ascii=False).encode('utf-8'))
+
+
+def parse_address(address):
+    """'unix:/경로' | '호스트:포트' | (호스트, 포트) -> (소켓 패밀리, 주소)"""
+    if isinstance(address, tuple):
+        return socket.AF_INET, address
+    if address.startswith('unix:'):
+        return socket.AF_UNIX, address[len('unix:'):]
+    host, _, port = address.rpartition(':')
+    return socket.AF_INET, (host or '127.0.0.1', int(port))
+
+
+# ============================================
+# 서버
+# ============================================
+def _handle_request(conn, request, zodiac_path):
+    if request.get('op') == 'ping':
+        send_json(conn, {'done': True, 'pid': os.getpid()})
+        return
+
+    job = dict(request['job'])
+    job.setdefault('zodiac_path', zodiac_path)
+    start = time.perf_counter()
+    for name, data in ig.iter_images(job, backend='serial'):
+        if isinstance(data, bytes):
+            send_json(conn, {'name': name, 'error': None})
+            send_message(conn, data)
+        else:
+            send_json(conn, {'name': name, 'error': data})
+    send_json(conn, {'done': True, 'elapsed': round(time.perf_counter() - start, 4)})
+
+
+def _serve_connection(conn, zodiac_path):
+    """연결 하나 처리 (클라이언트가 닫을 때까지 요청 반복) -> 처리한 요청 수"""
+    handled = 0
+    with conn:
+        while True:
+            try:
+                request = recv_json(conn)
+            except (EOFError, ConnectionError, socket.timeout):
+                return handled
+            try:
+                _handle_request(conn, request, zodiac_path)
+            except (ConnectionError, socket.timeout):
+                return handled
+            except Exception as e:
+                send_json(conn, {'done': True, 'error': f"{type(e).__name__}: {e}"})
+            handled += 1
+
+
+def _worker_loop(listener, zodiac_path, max_requests, timeout):
+    """워커: 공유 리스닝 소켓에서 accept 반복 (max_requests 처리 후 종료 -> 부모가 교체)"""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    handled = 0
+    while not max_requests or handled < max_requests:
+        try:
+            conn, _ = listener.accept()
+        except InterruptedError:
+            continue
+        conn.settimeout(timeout)
+        handled += _serve_connection(conn, zodiac_path)
+    os._exit(0)
+
+
+class RenderServer:
+    """
+    prefork 렌더링 서버
+
+    Args:
+        address: 'unix:/경로' 또는 '호스트:포트'
+        workers: 워커 프로세스 수
+        zodiac_path: 12지 이미지 경로 (요청 작업에 없을 때 사용)
+        max_requests: 워커당 처리 요청 수 (0이면 무제한, 메모리 증가 대비 교체용)
+        timeout: 연결 유휴 제한 시간 (초)
+    """
+
+    def __init__(self, address=DEFAULT_ADDRESS, workers=None, zodiac_path=ZODIAC_PATH,
+                 max_requests=0, timeout=60):
+        self.address = address
+        self.workers = workers or os.cpu_count() or 1
+        self.zodiac_path = zodiac_path
+        self.max_requests = max_requests
+        self.timeout = timeout
+        self._children = set()
+        self._listener = None
+
+    def _bind(self):
+        family, addr = parse_address(self.address)
+        if family == socket.AF_UNIX and os.path.exists(addr):
+            os.unlink(addr)
+        listener = socket.socket(family, socket.SOCK_STREAM)
+        if family == socket.AF_INET:
+            listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        listener.bind(addr)
+        listener.listen(128)
+        return listener
+
+    def _spawn(self):
+        pid = os.fork()
+        if pid == 0:
+            try:
+                _worker_loop(self._listener, self.zodiac_path, self.max_requests, self.timeout)
+            finally:
+                os._exit(1)
+        self._children.add(pid)
+
+    @staticmethod
+    def _stop(signum, frame):
+        # waitpid는 신호로 중단돼도 자동 재시도되므로 예외로 빠져나옴
+        raise _Shutdown
+
+    def serve_forever(self):
+        """워커를 띄우고 종료 신호(SIGINT/SIGTERM)까지 감시"""
+        # fork 전에 한 번만 로드 -> 모든 워커가 준비된 상태로 시작 (copy-on-write 공유)
+        ig.init_render_worker(self.zodiac_path)
+        self._listener = self._bind()
+        signal.signal(signal.SIGINT, self._stop)
+        signal.signal(signal.SIGTERM, self._stop)
+
+        try:
+            for _ in range(self.workers):
+                self._spawn()
+            print(f"렌더링 서버 시작: {self.address} (워커 {self.workers}개)", flush=True)
+
+            while True:
+                try:
+                    pid, _ = os.waitpid(-1, 0)
+                except ChildProcessError:
+                    break
+                self._children.discard(pid)
+                self._spawn()
+        except _Shutdown:
+            pass
+        finally:
+            self.shutdown()
+
+    def shutdown(self):
+        for pid in list(self._children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        for pid in list(self._children):
+            try:
+                os.waitpid(pid, 0)
+            except ChildProcessError:
+                pass
+        self._children.clear()
+        if self._listener is not None:
+            self._listener.close()
+            family, addr = parse_address(self.address)
+            if family == socket.AF_UNIX and os.path.exists(addr):
+                os.unlink(addr)
+            self._listener = None
+
+
+# ============================================
+# 클라이언트 (app.py 등에서 image_generator.iter_images 대신 사용)
+# ============================================
+class RenderClient:
+    """
+    렌더링 서버 클라이언트
+    예) client = RenderClient('unix:/tmp/saju_render.sock')
+        for name, data in client.iter_images(job): ...
+    """
+
+    def __init__(self, address=DEFAULT_ADDRESS, timeout=60):
+        self.address = address
+        self.timeout = timeout
+
+    def _connect(self):
+        family, addr = parse_address(self.address)
+        sock = socket.socket(family, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(addr)
+        except OSError as e:
+            sock.close()
+            raise RenderServerError(f"렌더링 서버 연결 실패 ({self.address}): {e}") from e
+        return sock
+
+    def ping(self):
+        """서버 응답 확인 -> 응답한 워커 pid"""
+        with self._connect() as sock:
+            send_json(sock, {'op': 'ping'})
+            return recv_json(sock)['pid']
+
+    def iter_images(self, job, **kwargs):
+        """
+        image_generator.iter_images와 같은 형식으로 (차트 이름, 바이트) 반환
+        (backend/max_workers 등 나머지 인자는 서버 쪽에서 결정하므로 무시)
+        """
+        with self._connect() as sock:
+            try:
+                send_json(sock, {'job': job})
+                while True:
+                    header = recv_json(sock)
+                    if header.get('done'):
+                        if header.get('error'):
+                            raise RenderServerError(header['error'])
+                        return
+                    if header['error'] is not None:
+                        yield header['name'], header['error']
+                    else:
+                        yield header['name'], recv_message(sock)
+            except (EOFError, ConnectionError, socket.timeout) as e:
+                raise RenderServerError(f"렌더링 서버 응답 중단: {e}") from e
+
+    def render_job(self, job):
+        """작업 하나 렌더링 -> {차트 이름: 바이트}"""
+        return dict(self.iter_images(job))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="사주 차트 렌더링 서버 (prefork)")
+    parser.add_argument('--socket', help="Unix 소켓 경로")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, help="TCP 포트 (--socket 대신)")
+    parser.add_argument('--workers', type=int, default=None, help="워커 수 (기본: CPU 코어 수)")
+    parser.add_argument('--max-requests', type=int, default=0, help="워커당 처리 요청 수 후 교체 (0: 무제한)")
+    parser.add_argument('--render-cache', default=None, help="렌더링 캐시 디렉터리")
+    args = parser.parse_args(argv)
+
+    if args.port:
+        address = f"{args.host}:{args.port}"
+    elif args.socket:
+        address = f"unix:{args.socket}"
+    else:
+        address = DEFAULT_ADDRESS
+    if args.render_cache:
+        ig.configure_render_cache(args.render_cache)
+
+    RenderServer(address, args.workers, max_requests=args.max_requests).serve_forever()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,264 @@
+# 사주 이미지 일괄 생성 CLI (Streamlit 없이 실행, cron/작업 실행기용)
+#   python -m saju batch input.xlsx -o out.zip
+#   python -m saju batch input.xlsx -o out.zip --charts 원국표,대운표 --workers 8 --format webp
+#   python -m saju batch input.xlsx -o - > out.zip           # stdout으로 출력
+#   python -m saju batch input.xlsx -o out.zip --job-dir jobs/0412   # 중단되면 같은 명령으로 이어서
+#   python -m saju batch input.xlsx -o out.zip --shard-people 500   # out.part001.zip ... (500명씩, 찰 때마다 완성)
+#   python -m saju export input.csv -o charts.parquet              # 계산 결과 열 형식 내보내기 (분석용)
+#   python -m saju worker --queue /tmp/saju_batch_jobs/queue.sqlite3   # 작업 큐 워커 (보통 웹앱이 띄움)
+#
+# 입력 열은 웹앱 일괄 처리 탭과 같음: 이름, 성별, 생년, 생월, 생일, 시, 분, 음양력, (윤달)
+# 입력 형식: 엑셀(.xlsx/.xls), CSV, JSONL(.jsonl/.ndjson), Parquet(pyarrow 필요)
+# 입력은 읽는 대로 처리하고, ZIP은 출력 파일에 바로 씀 (전체를 메모리에 올리지 않음)
+import argparse
+import os
+import sys
+import time
+
+from batch_input import INPUT_EXTENSIONS, RowError, open_persons
+from batch_pipeline import CHART_FILENAMES, OUTPUT_FORMATS, BatchProgress, DedupStats, iter_batch
+from zip_sink import ShardedZipSink, ZipSink
+
+ZODIAC_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'images', 'zodiac')
+
+# 진행 상황 출력 간격 (초)
+PROGRESS_INTERVAL = 2.0
+
+
+def _log(message):
+    print(message, file=sys.stderr, flush=True)
+
+
+def _parse_charts(value):
+    if not value or value == 'all':
+        return list(CHART_FILENAMES)
+    charts = [name.strip() for name in value.split(',') if name.strip()]
+    unknown = [name for name in charts if name not in CHART_FILENAMES]
+    if unknown:
+        raise argparse.ArgumentTypeError(
+            f"알 수 없는 차트: {', '.join(unknown)} (가능: {', '.join(CHART_FILENAMES)})")
+    return charts
+
+
+def _open_output(path):
+    if path == '-':
+        return sys.stdout.buffer
+    return open(path, 'wb')
+
+
+def _valid_rows(reader, skipped_rows):
+    """오류 행은 로그를 남기고 skipped_rows에 모으고, 검증된 행만 넘김"""
+    for row in reader:
+        if isinstance(row, RowError):
+            skipped_rows.append(row)
+            _log(f"  건너뜀: {row.row}행 {row.이름 or ''} - {row.message}")
+        else:
+            yield row
+
+
+def _open_input(path):
+    try:
+        return open_persons(path)
+    except (OSError, ValueError) as e:
+        _log(f"입력 파일 오류: {e}")
+        return None
+
+
+def _open_shards(args):
+    """--shard-people/--shard-size -> 출력 경로 옆에 이름.part001.zip, part002.zip ... 로 나눠 씀"""
+    directory, filename = os.path.split(os.path.abspath(args.output))
+    stem = os.path.splitext(filename)[0].replace('{', '{{').replace('}', '}}')
+    max_bytes = int(args.shard_size * 1024 * 1024) if args.shard_size else None
+    return ShardedZipSink(directory, args.shard_people, max_bytes, name=stem + '.part{index:03d}.zip')
+
+
+def _log_shards(shards):
+    for shard in shards:
+        _log(f"  파일 완료: {shard.path} ({shard.people}명, {shard.size / 1024 / 1024:.1f}MB)")
+
+
+def run_batch(args):
+    sharded = bool(args.shard_people or args.shard_size)
+    if sharded and args.output == '-':
+        _log("--shard-people/--shard-size는 stdout(-)으로 쓸 수 없습니다")
+        return 2
+    reader = _open_input(args.input)
+    if reader is None:
+        return 2
+    skipped_rows = []
+
+    job = None
+    rows = _valid_rows(reader, skipped_rows)
+    if args.job_dir:
+        from batch_job import BatchJob
+        job = BatchJob(args.job_dir, args.charts, args.format)
+        if job.completed:
+            _log(f"이전 실행에서 완료한 {job.completed}명은 건너뜀 ({args.job_dir})")
+        rows = job.pending(rows)
+
+    progress = BatchProgress(max(reader.estimated - (job.completed if job else 0), 0))
+    stats = DedupStats()
+    failed = 0
+    last_report = 0.0
+    _log(f"입력: {args.input} (약 {reader.estimated}명), 차트 {len(args.charts)}개, "
+         f"형식 {args.format}, 워커 {args.workers or os.cpu_count()}개")
+
+    # 나눠 쓰면 샤드가 찰 때마다 바로 완성 (이전 실행에서 완료한 행이 앞 샤드부터)
+    # 하나로 쓰면 job_dir가 있을 때 작업 디렉터리에 체크포인트하고 마지막에 ZIP 작성
+    output = None if sharded else _open_output(args.output)
+    sink = _open_shards(args) if sharded else ZipSink(fileobj=output)
+    try:
+        if sharded and job is not None:
+            for entry in job.entries(partial=False):
+                _log_shards(sink.add(job.entry_files(entry)))
+        results = iter_batch(rows, args.charts, args.workers, args.backend,
+                             zodiac_path=ZODIAC_PATH, image_format=args.format, stats=stats,
+                             charts_for=job.retry_charts if job is not None else None)
+        for result in results:
+            entry = job.record(result) if job is not None else None
+            if sharded:
+                if entry is not None:
+                    if entry['files']:
+                        _log_shards(sink.add(job.entry_files(entry)))
+                elif result.files:
+                    _log_shards(sink.add(result.files))
+            elif job is None:
+                for arcname, data in result.files:
+                    sink.write(arcname, data)
+            for chart, message in result.errors:
+                failed += 1
+                _log(f"  실패: {result.person.row}행 {result.person.이름} {chart} - {message}")
+
+            progress.update(progress.done + 1)
+            now = time.perf_counter()
+            if now - last_report >= PROGRESS_INTERVAL:
+                last_report = now
+                _log(f"  {progress.text()}")
+        if sharded:
+            _log_shards([shard for shard in [sink.close()] if shard])
+        else:
+            if job is not None:
+                job.write_zip(sink)
+            sink.close()
+    except BaseException:
+        sink.discard()
+        raise
+    finally:
+        if output is not None and output is not sys.stdout.buffer:
+            output.close()
+
+    elapsed = progress.elapsed
+    _log(f"완료: {progress.done}명 / {elapsed:.1f}초 / {progress.rate:.2f}명/초 "
+         f"({progress.rate * len(args.charts):.1f}차트/초)")
+    if sharded:
+        _log(f"ZIP {len(sink.shards)}개, 항목 {sum(shard.entries for shard in sink.shards)}개")
+    else:
+        _log(f"ZIP 항목 {sink.entries}개 -> {args.output}")
+    if stats.rows:
+        _log(f"중복 제거: {stats.text()}")
+    if job is not None and job.skipped:
+        _log(f"이전 실행 재사용: {job.skipped}명")
+    if skipped_rows or failed:
+        _log(f"입력 오류 {len(skipped_rows)}행, 차트 실패 {failed}개")
+        return 1
+    return 0
+
+
+def run_export(args):
+    from batch_export import ExportWriter, iter_export
+
+    reader = _open_input(args.input)
+    if reader is None:
+        return 2
+    skipped_rows = []
+    failed = 0
+    last_report = 0.0
+    progress = BatchProgress(reader.estimated)
+
+    try:
+        # 경로로 넘기면 형식/pyarrow 확인 후에 파일을 만듦
+        writer = ExportWriter(sys.stdout.buffer if args.output == '-' else args.output, args.format)
+    except (OSError, ValueError) as e:
+        _log(f"출력 오류: {e}")
+        return 2
+    _log(f"입력: {args.input} (약 {reader.estimated}명), 형식 {writer.export_format}, "
+         f"워커 {args.workers or os.cpu_count()}개")
+
+    with writer:
+        for result in iter_export(_valid_rows(reader, skipped_rows), args.workers, args.backend):
+            if result.error is None:
+                writer.write(result.values)
+            else:
+                failed += 1
+                _log(f"  실패: {result.person.row}행 {result.person.이름} - {result.error}")
+
+            progress.update(progress.done + 1)
+            now = time.perf_counter()
+            if now - last_report >= PROGRESS_INTERVAL:
+                last_report = now
+                _log(f"  {progress.text()}")
+
+    _log(f"완료: {writer.rows}행 / {progress.elapsed:.1f}초 / {progress.rate:.0f}명/초 -> {args.output}")
+    if skipped_rows or failed:
+        _log(f"입력 오류 {len(skipped_rows)}행, 계산 실패 {failed}명")
+        return 1
+    return 0
+
+
+def run_worker(args):
+    from job_queue import JobQueue, run_worker as worker_loop
+
+    queue = JobQueue(args.queue, max_running=args.max_running)
+    _log(f"워커 시작: pid {os.getpid()}, 큐 {args.queue}")
+    worker_loop(queue, idle_timeout=args.idle_timeout, log=_log)
+    _log(f"워커 종료: pid {os.getpid()}")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m saju', description="사주 이미지 생성 CLI")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    batch = commands.add_parser('batch', help="엑셀/CSV/JSONL/Parquet 입력 -> 차트 이미지 ZIP")
+    batch.add_argument('input', help=f"입력 파일 ({'/'.join('.' + e for e in INPUT_EXTENSIONS)})")
+    batch.add_argument('-o', '--output', required=True, help="출력 ZIP 경로 ('-'이면 stdout)")
+    batch.add_argument('--charts', type=_parse_charts, default=list(CHART_FILENAMES),
+                       help="생성할 차트 (쉼표 구분, 기본: 전체 16개)")
+    batch.add_argument('--workers', type=int, default=None, help="워커 프로세스 수 (기본: CPU 코어 수)")
+    batch.add_argument('--format', choices=list(OUTPUT_FORMATS), default='png', help="이미지 형식")
+    batch.add_argument('--backend', choices=('process', 'thread', 'serial'), default='process')
+    batch.add_argument('--job-dir', default=None, help="체크포인트 디렉터리 (중단 후 같은 명령으로 이어서 실행)")
+    batch.add_argument('--render-cache', default=None, help="렌더링 캐시 디렉터리")
+    batch.add_argument('--shard-people', type=int, default=None,
+                       help="ZIP 하나당 최대 인원 (출력 이름.part001.zip ... 으로 나눠 씀)")
+    batch.add_argument('--shard-size', type=float, default=None, help="ZIP 하나당 최대 크기 (MB)")
+
+    export = commands.add_parser('export', help="엑셀/CSV/JSONL/Parquet 입력 -> 계산 결과 Parquet/Arrow/CSV (분석용)")
+    export.add_argument('input', help="입력 파일 (batch와 같은 열)")
+    export.add_argument('-o', '--output', required=True,
+                        help="출력 경로 (.parquet/.arrow/.csv, '-'이면 stdout)")
+    export.add_argument('--format', choices=('parquet', 'arrow', 'csv'), default=None,
+                        help="출력 형식 (기본: 출력 확장자로 결정, stdout이면 필수)")
+    export.add_argument('--workers', type=int, default=None, help="워커 프로세스 수 (기본: CPU 코어 수)")
+    export.add_argument('--backend', choices=('process', 'thread', 'serial'), default='process')
+
+    worker = commands.add_parser('worker', help="작업 큐 워커 (웹앱 일괄 처리 탭이 필요할 때 띄움)")
+    worker.add_argument('--queue', required=True, help="작업 큐 SQLite 파일")
+    worker.add_argument('--max-running', type=int, default=1, help="서버 전체 동시 실행 작업 수")
+    worker.add_argument('--idle-timeout', type=float, default=60, help="이 시간(초) 동안 작업이 없으면 종료")
+    args = parser.parse_args(argv)
+
+    if getattr(args, 'render_cache', None):
+        import image_generator
+        image_generator.configure_render_cache(args.render_cache)
+
+    if args.command == 'batch':
+        return run_batch(args)
+    if args.command == 'export':
+        return run_export(args)
+    if args.command == 'worker':
+        return run_worker(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,5 +1,6 @@
 # 만세력 계산기 v1
 # 샘플 데이터로 로직 검증
+import threading
 from functools import lru_cache
 
 # ============================================
@@ -2016,54 +2017,137 @@ def calc_일진(year, month, day):
 # ============================================
 def calc_일진표(year, month):
     """특정 년월의 일진표 데이터 생성"""
-    import calendar
-    from korean_lunar_calendar import KoreanLunarCalendar
-    
-    cal = calendar.Calendar()
-    days = list(cal.itermonthdays(year, month))
+    return calc_일진표_범위(year, month, 1)[0]
+
+
+def calc_일진표_범위(year, start_month, months=12):
+    """
+    여러 달의 일진표 데이터를 한 번에 생성 (start_month부터 months개월)
     
-    # 해당 월의 월주 계산
-    # 먼저 년주를 구해서 년간 추출
-    년간, 년지 = calc_년주(year, month, 15)
-    월주_천간, 월주_지지 = calc_월주(년간, month, 15)  # 년간 전달
+    - 일진: 첫날만 기준일 차이로 계산하고 이후는 하루씩 다음 간지로
+    - 음력: 음력 날짜가 29일 이상일 때만 (월이 바뀔 수 있을 때) 다시 변환
     
-    일진_데이터 = []
+    Returns:
+        list: 월별 calc_일진표 결과
+    """
+    import calendar
+    from datetime import date, timedelta
+    from korean_lunar_calendar import KoreanLunarCalendar
     
-    for day in days:
-        if day == 0:
-            일진_데이터.append(None)
-            continue
+    # 대상 월 목록
+    월_목록 = []
+    y, m = year, start_month
+    for _ in range(months):
+        월_목록.append((y, m))
+        m += 1
+        if m > 12:
+            y, m = y + 1, 1
+    
+    # 전체 기간 일진/음력 (날짜 -> 데이터)
+    첫날 = date(*월_목록[0], 1)
+    끝_년, 끝_월 = 월_목록[-1]
+    끝날 = date(끝_년, 끝_월, calendar.monthrange(끝_년, 끝_월)[1])
+    
+    일진_index = (10 + (첫날 - date(1900, 1, 1)).days) % 60  # 1900-01-01 = 갑술 (index 10)
+    lunar_cal = KoreanLunarCalendar()
+    음력 = None  # (월, 일, 윤달)
+    
+    by_date = {}
+    current = 첫날
+    while current <= 끝날:
+        # 음력 변환 (같은 달 안에서는 하루씩 증가)
+        if 음력 is not None and 음력[1] < 29:
+            음력 = (음력[0], 음력[1] + 1, 음력[2])
+        else:
+            try:
+                # 지원 범위 밖 날짜는 False (이전 변환값이 남아 있으므로 사용 안 함)
+                if lunar_cal.setSolarDate(current.year, current.month, current.day):
+                    음력 = (lunar_cal.lunarMonth, lunar_cal.lunarDay, lunar_cal.isIntercalation)
+                else:
+                    음력 = None
+            except:
+                음력 = None
+        음력_str = f"{음력[0]}.{음력[1]}" + ("(윤)" if 음력[2] else "") if 음력 else ""
         
-        일진 = calc_일진(year, month, day)
+        천간_idx = 일진_index % 10
+        지지_idx = 일진_index % 12
+        by_date[current] = {
+            'day': current.day,
+            '양력': f"{current.year}-{current.month:02d}-{current.day:02d}",
+            '음력': 음력_str,
+            '일진': 천간[천간_idx] + 지지[지지_idx],
+            '천간': 천간[천간_idx],
+            '지지': 지지[지지_idx],
+            '천간_한자': 천간_한자[천간_idx],
+            '지지_한자': 지지_한자[지지_idx],
+        }
         
-        # 음력 변환
-        try:
-            lunar_cal = KoreanLunarCalendar()
-            lunar_cal.setSolarDate(year, month, day)
-            음력_월 = lunar_cal.lunarMonth
-            음력_일 = lunar_cal.lunarDay
-            윤달 = lunar_cal.isIntercalation
-            음력_str = f"{음력_월}.{음력_일}" + ("(윤)" if 윤달 else "")
-        except:
-            음력_str = ""
+        일진_index = (일진_index + 1) % 60
+        current += timedelta(days=1)
+    
+    # 월별로 나누기 (달력 빈칸은 None)
+    cal = calendar.Calendar()
+    결과 = []
+    for y, m in 월_목록:
+        # 해당 월의 월주 계산
+        # 먼저 년주를 구해서 년간 추출
+        년간, 년지 = calc_년주(y, m, 15)
+        월주_천간, 월주_지지 = calc_월주(년간, m, 15)  # 년간 전달
         
-        일진_데이터.append({
-            'day': day,
-            '양력': f"{year}-{month:02d}-{day:02d}",
-            '음력': 음력_str,
-            '일진': 일진['간지'],
-            '천간': 일진['천간'],
-            '지지': 일진['지지'],
-            '천간_한자': 일진['천간_한자'],
-            '지지_한자': 일진['지지_한자'],
+        결과.append({
+            'year': y,
+            'month': m,
+            '월주': f"{월주_천간}{월주_지지}",
+            'days': [by_date[date(y, m, day)] if day else None for day in cal.itermonthdays(y, m)],
         })
     
-    return {
-        'year': year,
-        'month': month,
-        '월주': f"{월주_천간}{월주_지지}",
-        'days': 일진_데이터,
-    }
+    return 결과
+
+
+# ============================================
+# 음력 ↔ 양력 변환
+# ============================================
+# KoreanLunarCalendar는 인스턴스마다 연도별 누적 일수를 캐싱하고, 생성할 때 오늘 날짜를
+# 기준 연도(1000년)부터 계산함 -> 매번 새로 만들지 않고 스레드별로 하나씩 재사용
+_lunar_local = threading.local()
+
+
+def _lunar_calendar():
+    calendar = getattr(_lunar_local, 'calendar', None)
+    if calendar is None:
+        from korean_lunar_calendar import KoreanLunarCalendar
+        calendar = _lunar_local.calendar = KoreanLunarCalendar()
+    return calendar
+
+
+def 음력_to_양력(year, month, day, 윤달=False):
+    """음력 날짜를 양력으로 변환 (윤달 지원, 없는 음력 날짜면 ValueError)"""
+    calendar = _lunar_calendar()
+    if not calendar.setLunarDate(year, month, day, 윤달):
+        raise ValueError(f"없는 음력 날짜입니다: {음력_문자열(year, month, day, 윤달)}")
+    return calendar.solarYear, calendar.solarMonth, calendar.solarDay
+
+
+@lru_cache(maxsize=65536)
+def 유효한_음력(year, month, day, 윤달=False):
+    """존재하는 음력 날짜인지 (윤달이 없는 달에 윤달 지정 등 확인)"""
+    return _lunar_calendar().setLunarDate(year, month, day, 윤달)
+
+
+def 양력_to_음력(year, month, day):
+    """양력 날짜를 음력으로 변환 (윤달 여부 포함, 지원 범위 밖이면 ValueError)"""
+    calendar = _lunar_calendar()
+    # 실패하면 False만 돌려주고 이전 변환값이 그대로 남음 (스레드별 재사용 인스턴스)
+    if not calendar.setSolarDate(year, month, day):
+        raise ValueError(f"음력 변환을 지원하지 않는 날짜입니다: {year}-{month:02d}-{day:02d}")
+    윤달여부 = calendar.isIntercalation
+    return calendar.lunarYear, calendar.lunarMonth, calendar.lunarDay, 윤달여부
+
+
+def 음력_문자열(year, month, day, 윤달=False):
+    """음력 날짜를 문자열로 변환 (윤달 표시 포함)"""
+    윤_표시 = "윤" if 윤달 else ""
+    return f"{year}-{윤_표시}{month:02d}-{day:02d}"
 
 
 # ============================================
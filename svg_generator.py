@@ -0,0 +1,266 @@
+# SVG 벡터 출력 (PIL 없이 문자열 템플릿으로 생성)
+#
+# image_generator의 create_* 함수가 그대로 그리도록 ImageDraw와 같은 메서드를 제공
+#   rectangle / rounded_rectangle / ellipse / line / polygon / text
+# 12지 이미지는 기본으로 출력 크기 PNG를 data: URI로 포함 (SVG 파일 하나로 완결, 로컬 경로 노출 없음)
+# 폰트는 기본으로 font-family 이름만 (폰트 파일이 수 MB라 포함하지 않음, 없으면 sans-serif)
+#   -> font_url / asset_url을 주면 그 URL + 파일 이름으로 링크
+#   -> LOCAL_FILES를 주면 서버의 로컬 경로 그대로 링크 (같은 서버에서 열 때만, 선택)
+import base64
+import io
+import os
+from collections import namedtuple
+from functools import lru_cache
+from xml.sax.saxutils import escape, quoteattr
+
+from PIL import Image
+
+# font_url / asset_url에 주면 로컬 파일 경로를 그대로 참조
+LOCAL_FILES = 'local'
+
+# 폰트 참조 (PIL 폰트 대신 사용)
+FontRef = namedtuple('FontRef', ['family', 'path', 'size', 'weight'])
+
+
+class SpriteRef:
+    """12지 이미지 참조 (디코딩 없음, img.paste 호환용 속성만 가짐)"""
+
+    mode = 'RGBA'
+
+    def __init__(self, href, size):
+        self.href = href
+        self.size = (size, size)
+
+
+@lru_cache(maxsize=256)
+def _sprite_data_uri(path, size):
+    """12지 이미지 -> 출력 크기로 줄인 PNG data: URI (같은 이미지/크기는 한 번만 인코딩)"""
+    with Image.open(path) as src:
+        sprite = src.resize((size, size), Image.Resampling.LANCZOS)
+    buffer = io.BytesIO()
+    sprite.save(buffer, 'PNG', optimize=True)
+    return 'data:image/png;base64,' + base64.b64encode(buffer.getvalue()).decode('ascii')
+
+
+# PIL anchor -> SVG 속성
+_H_ANCHOR = {'l': 'start', 'm': 'middle', 'r': 'end'}
+_V_ANCHOR = {'a': 'hanging', 't': 'hanging', 'm': 'central', 's': 'alphabetic',
+             'b': 'text-after-edge', 'd': 'text-after-edge'}
+
+
+def _num(v):
+    """좌표 숫자 표기 (정수면 소수점 없이)"""
+    v = round(float(v), 2)
+    return str(int(v)) if v.is_integer() else str(v)
+
+
+def _color(color):
+    """PIL 색상 표기 -> (SVG 색상, 불투명도)"""
+    if color is None:
+        return 'none', None
+    if isinstance(color, str):
+        return color, None
+    if isinstance(color, int):
+        return f'rgb({color},{color},{color})', None
+    r, g, b = color[:3]
+    alpha = color[3] / 255 if len(color) > 3 else None
+    return f'rgb({r},{g},{b})', alpha
+
+
+def _paint(attr, color):
+    value, alpha = _color(color)
+    out = f' {attr}="{value}"'
+    if alpha is not None and alpha < 1:
+        out += f' {attr}-opacity="{_num(alpha)}"'
+    return out
+
+
+def _stroke(outline, width):
+    if outline is None or not width:
+        return ''
+    out = _paint('stroke', outline)
+    return out if width == 1 else out + f' stroke-width="{_num(width)}"'
+
+
+def _box(xy):
+    if isinstance(xy[0], (tuple, list)):
+        (x0, y0), (x1, y1) = xy[0], xy[1]
+    else:
+        x0, y0, x1, y1 = xy
+    return x0, y0, x1, y1
+
+
+def _points(xy):
+    if isinstance(xy[0], (tuple, list)):
+        return ' '.join(f'{_num(x)},{_num(y)}' for x, y in xy)
+    return ' '.join(f'{_num(xy[i])},{_num(xy[i + 1])}' for i in range(0, len(xy), 2))
+
+
+class SvgDraw:
+    """ImageDraw 호환 그리기 객체 (SVG 요소 문자열을 쌓음)"""
+
+    def __init__(self, canvas):
+        self._canvas = canvas
+        self._out = canvas.elements
+
+    def rectangle(self, xy, fill=None, outline=None, width=1):
+        x0, y0, x1, y1 = _box(xy)
+        self._out.append(
+            f'<rect x="{_num(x0)}" y="{_num(y0)}" width="{_num(x1 - x0)}" height="{_num(y1 - y0)}"'
+            f'{_paint("fill", fill)}{_stroke(outline, width)}/>')
+
+    def rounded_rectangle(self, xy, radius=0, fill=None, outline=None, width=1, **kwargs):
+        x0, y0, x1, y1 = _box(xy)
+        self._out.append(
+            f'<rect x="{_num(x0)}" y="{_num(y0)}" width="{_num(x1 - x0)}" height="{_num(y1 - y0)}"'
+            f' rx="{_num(radius)}"{_paint("fill", fill)}{_stroke(outline, width)}/>')
+
+    def ellipse(self, xy, fill=None, outline=None, width=1):
+        x0, y0, x1, y1 = _box(xy)
+        self._out.append(
+            f'<ellipse cx="{_num((x0 + x1) / 2)}" cy="{_num((y0 + y1) / 2)}"'
+            f' rx="{_num((x1 - x0) / 2)}" ry="{_num((y1 - y0) / 2)}"'
+            f'{_paint("fill", fill)}{_stroke(outline, width)}/>')
+
+    def line(self, xy, fill=None, width=0, **kwargs):
+        self._out.append(
+            f'<polyline points="{_points(xy)}" fill="none"{_stroke(fill, width or 1)}/>')
+
+    def polygon(self, xy, fill=None, outline=None, width=1):
+        self._out.append(
+            f'<polygon points="{_points(xy)}"{_paint("fill", fill)}{_stroke(outline, width)}/>')
+
+    def text(self, xy, text, fill=None, font=None, anchor=None, spacing=4, **kwargs):
+        anchor = anchor or 'la'
+        x, y = xy
+        css = self._canvas.text_class(font, anchor)
+        lines = str(text).split('\n')
+
+        # 여러 줄: PIL처럼 블록 전체를 anchor 기준으로 정렬
+        line_height = (font.size if font else 10) + spacing
+        if anchor[1] == 'm':
+            y -= line_height * (len(lines) - 1) / 2
+        elif anchor[1] in ('b', 'd', 's'):
+            y -= line_height * (len(lines) - 1)
+
+        attrs = f' class="{css}"'
+
+        if len(lines) == 1:
+            self._out.append(f'<text x="{_num(x)}" y="{_num(y)}"{attrs}{_paint("fill", fill)}>'
+                             f'{escape(lines[0])}</text>')
+            return
+
+        spans = ''.join(
+            f'<tspan x="{_num(x)}" dy="{_num(0 if i == 0 else line_height)}">{escape(line)}</tspan>'
+            for i, line in enumerate(lines))
+        self._out.append(f'<text x="{_num(x)}" y="{_num(y)}"{attrs}{_paint("fill", fill)}>{spans}</text>')
+
+
+class SvgCanvas:
+    """SVG 캔버스 (create_* 함수에서 img 대신 사용)"""
+
+    def __init__(self, width, height, font_url=None, asset_url=None):
+        self.size = (width, height)
+        self.width = width
+        self.height = height
+        self.elements = []
+        self._font_url = font_url
+        self._asset_url = asset_url
+        self._font_faces = {}   # family -> 폰트 파일 경로
+        self._text_classes = {}  # (폰트, anchor) -> CSS 클래스 이름
+        self.draw = SvgDraw(self)
+
+    def text_class(self, font, anchor):
+        """폰트/정렬별 CSS 클래스 (요소마다 같은 속성을 반복하지 않음)"""
+        if font is not None and font.path and font.family not in self._font_faces:
+            self._font_faces[font.family] = font.path
+        key = (font, anchor)
+        css = self._text_classes.get(key)
+        if css is None:
+            css = f't{len(self._text_classes)}'
+            self._text_classes[key] = css
+        return css
+
+    def paste(self, im, box=None, mask=None):
+        href = getattr(im, 'href', None)
+        if href is None:
+            return
+        x, y = box or (0, 0)
+        w, h = im.size
+        self.elements.append(f'<image href={quoteattr(self._sprite_href(href, w))}'
+                             f' x="{_num(x)}" y="{_num(y)}" width="{w}" height="{h}"/>')
+
+    def _sprite_href(self, path, size):
+        if self._asset_url is None:
+            return _sprite_data_uri(path, size)
+        return self._url(path, self._asset_url)
+
+    @staticmethod
+    def _url(path, base_url):
+        if base_url == LOCAL_FILES:
+            return path
+        return base_url.rstrip('/') + '/' + os.path.basename(path)
+
+    def _style(self):
+        rules = []
+        if self._font_url is not None:
+            for family, path in self._font_faces.items():
+                rules.append(f"@font-face{{font-family:'{family}';"
+                             f"src:url('{self._url(path, self._font_url)}')}}")
+        for (font, anchor), css in self._text_classes.items():
+            rule = (f"text-anchor:{_H_ANCHOR.get(anchor[0], 'start')};"
+                    f"dominant-baseline:{_V_ANCHOR.get(anchor[1], 'hanging')}")
+            if font is not None:
+                rule = (f"font-family:'{font.family}',sans-serif;font-size:{font.size}px;"
+                        f"font-weight:{font.weight};" + rule)
+            rules.append(f".{css}{{{rule}}}")
+        return escape('\n'.join(rules))
+
+    def to_svg(self):
+        """SVG 문서 문자열"""
+        width, height = self.size
+        return (f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}"'
+                f' viewBox="0 0 {width} {height}">\n'
+                f'<style>{self._style()}</style>\n'
+                + '\n'.join(self.elements)
+                + '\n</svg>\n')
+
+    def save(self, fp):
+        data = self.to_svg().encode('utf-8')
+        if isinstance(fp, (str, os.PathLike)):
+            with open(fp, 'wb') as f:
+                f.write(data)
+        else:
+            fp.write(data)
+
+
+class SvgTarget:
+    """
+    SVG 그리기 대상 (image_generator의 캔버스 대상으로 설정)
+
+    Args:
+        font_url: 폰트 파일 기본 URL (None이면 @font-face 없이 font-family만, LOCAL_FILES면 로컬 경로)
+        asset_url: 12지 이미지 기본 URL (None이면 data: URI로 포함, LOCAL_FILES면 로컬 경로)
+    """
+
+    vector = True
+
+    def __init__(self, font_url=None, asset_url=None):
+        self.font_url = font_url
+        self.asset_url = asset_url
+        self.region = None
+
+    def open_region(self, width, height):
+        self.region = SvgCanvas(width, height, self.font_url, self.asset_url)
+        return self.region, self.region.draw
+
+    def font(self, key, path, size):
+        family, weight, _ = key
+        if family == 'system' and path:
+            family = os.path.splitext(os.path.basename(path))[0]
+        # ChosunGs는 굵기가 하나뿐 (PNG와 같게 굵게 요청해도 보통 굵기로)
+        bold = weight == 'bold' and family != 'ChosunGs'
+        return FontRef(family, path, size, 700 if bold else 400)
+
+    def sprite(self, path, size):
+        return SpriteRef(path, size)
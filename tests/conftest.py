@@ -0,0 +1,5 @@
+# 저장소 루트의 모듈(saju_calculator 등)을 바로 import
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
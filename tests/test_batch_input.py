@@ -0,0 +1,24 @@
+# 일괄 입력 검증: 잘못된 셀은 그 행만 RowError
+import pytest
+
+from batch_input import parse_row
+
+ROW = {'이름': '홍길동', '성별': '남성', '생년': 1990, '생월': 5, '생일': 15, '시': 12, '분': 0, '음양력': '양력'}
+
+
+@pytest.mark.parametrize('value', ['inf', '-inf', '1e400', 'nan', float('inf')])
+def test_유한하지_않은_숫자는_ValueError(value):
+    with pytest.raises(ValueError, match='숫자가 아닙니다'):
+        parse_row(dict(ROW, 생년=value), 2)
+
+
+def test_열_검증에서_inf_셀은_그_행만_오류():
+    import pandas as pd
+    from batch_input import PersonRow, RowError, validate_frame
+
+    df = pd.DataFrame([{key: str(value) for key, value in ROW.items()},
+                       dict({key: str(value) for key, value in ROW.items()}, 생년='inf', 이름='김철수'),
+                       dict({key: str(value) for key, value in ROW.items()}, 생월='1e400', 이름='이영희')])
+    rows = list(validate_frame(df))
+    assert [type(row) for row in rows] == [PersonRow, RowError, RowError]
+    assert '숫자가 아닙니다' in rows[1].message and rows[2].이름 == '이영희'
@@ -0,0 +1,38 @@
+# 일괄 작업 체크포인트: 일부 차트가 실패한 행은 성공한 파일을 남기고 실패한 차트만 다시 시도
+from batch_input import PersonRow
+from batch_job import BatchJob
+from batch_pipeline import BatchResult, iter_batch
+
+CHARTS = ['원국표', '12운성표']
+PERSON = PersonRow(2, '홍길동', '남성', 1990, 5, 15, 12, 0, '양력', False)
+
+
+def test_일부_실패한_행은_성공한_파일을_기록하고_실패한_차트만_다시(tmp_path):
+    job = BatchJob(str(tmp_path), CHARTS)
+    first = BatchResult(PERSON, [('홍길동_1990-05-15/01_원국표.png', b'wonguk')],
+                        [('12운성표', 'Error: boom')])
+    entry = job.record(first)
+    assert [arcname for arcname, _, _ in entry['files']] == ['홍길동_1990-05-15/01_원국표.png']
+    assert entry['failed'] == ['12운성표']
+
+    # 다시 열어도 미완료 -> 실패한 차트만 다시 만듦
+    job = BatchJob(str(tmp_path), CHARTS)
+    assert job.completed == 0 and job.entries(partial=False) == []
+    assert job.retry_charts(PERSON) == ['12운성표']
+    results = list(iter_batch(job.pending([PERSON]), CHARTS, backend='serial',
+                              charts_for=job.retry_charts))
+    assert [arcname for arcname, _ in results[0].files] == ['홍길동_1990-05-15/08_12운성표.png']
+
+    # 이전에 성공한 파일과 합쳐서 완료
+    entry = job.record(results[0])
+    assert 'failed' not in entry
+    assert [arcname for arcname, _, _ in entry['files']] == [
+        '홍길동_1990-05-15/01_원국표.png', '홍길동_1990-05-15/08_12운성표.png']
+    assert job.completed == 1 and list(job.pending([PERSON])) == []
+
+
+def test_계산_실패는_모든_차트를_다시(tmp_path):
+    job = BatchJob(str(tmp_path), CHARTS)
+    entry = job.record(BatchResult(PERSON, [], [('계산', 'Error: boom')]))
+    assert entry['files'] == [] and entry['failed'] == CHARTS
+    assert job.retry_charts(PERSON) == CHARTS
@@ -0,0 +1,44 @@
+# 작업 큐: 하트비트가 끊긴 작업은 맡은 워커가 죽었을 때만 다시 대기로
+import os
+import subprocess
+import sys
+import time
+
+from job_queue import STALE_SECONDS, JobQueue
+
+
+def _dead_pid():
+    process = subprocess.Popen([sys.executable, '-c', 'pass'])
+    process.wait()
+    return process.pid
+
+
+def _stale(queue, job_id):
+    with queue._connect() as db:
+        db.execute("UPDATE jobs SET heartbeat = ? WHERE id = ?", (time.time() - STALE_SECONDS - 1, job_id))
+
+
+def test_살아_있는_워커의_작업은_다시_대기로_돌리지_않음(tmp_path):
+    queue = JobQueue(str(tmp_path / 'queue.sqlite3'))
+    queue.submit('a', 'batch', {}, str(tmp_path))
+    job = queue.claim(os.getpid())
+    _stale(queue, 'a')
+    assert queue.claim(os.getpid()) is None
+    assert queue.get('a').status == 'running'
+    assert queue.update_progress(job, 1, 2) == 'running'
+
+
+def test_죽은_워커의_작업은_새_토큰으로_넘어감(tmp_path):
+    queue = JobQueue(str(tmp_path / 'queue.sqlite3'))
+    queue.submit('a', 'batch', {}, str(tmp_path))
+    lost = queue.claim(_dead_pid())
+    _stale(queue, 'a')
+    job = queue.claim(os.getpid())
+    assert job.id == 'a' and job.token != lost.token
+    # 작업을 잃은 쪽은 진행률/종료를 기록하지 못함
+    assert queue.update_progress(lost, 5, 10) is None
+    assert not queue.heartbeat(lost)
+    queue.finish(lost, 'done')
+    assert queue.get('a').status == 'running'
+    queue.finish(job, 'done')
+    assert queue.get('a').status == 'done'
@@ -0,0 +1,26 @@
+# 음력 ↔ 양력 변환 (스레드별 재사용 달력 인스턴스)
+import pytest
+
+from batch_input import MAX_BIRTH_YEAR, parse_row
+from saju_calculator import 양력_to_음력, 음력_to_양력
+
+
+def test_양력_to_음력_범위_밖이면_이전_값을_돌려주지_않음():
+    assert 양력_to_음력(1990, 5, 15) == (1990, 4, 21, False)
+    with pytest.raises(ValueError):
+        양력_to_음력(2060, 5, 15)
+    # 실패 뒤에도 같은 인스턴스로 정상 변환
+    assert 양력_to_음력(1990, 5, 15) == (1990, 4, 21, False)
+
+
+def test_음력_to_양력_없는_날짜():
+    assert 음력_to_양력(1985, 12, 3) == (1986, 1, 12)
+    with pytest.raises(ValueError):
+        음력_to_양력(1985, 12, 3, True)
+
+
+def test_생년_범위는_음력_변환_범위까지():
+    row = {'이름': '홍길동', '성별': '남성', '생월': 5, '생일': 15, '시': 12, '분': 0, '음양력': '양력'}
+    assert parse_row(dict(row, 생년=MAX_BIRTH_YEAR), 2).생년 == MAX_BIRTH_YEAR
+    with pytest.raises(ValueError):
+        parse_row(dict(row, 생년=MAX_BIRTH_YEAR + 1), 2)
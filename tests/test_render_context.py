@@ -0,0 +1,48 @@
+# 병렬 렌더링이 호출한 쪽의 렌더링 설정(contextvars)을 그대로 쓰는지
+import io
+
+from PIL import Image
+
+from image_generator import canvas_mode, create_일진표_year, generate_images_batch, render_scale
+from saju_calculator import calc_사주
+
+
+def _sizes(backend):
+    with render_scale(0.5):
+        return [image.size for _, _, image in create_일진표_year(2024, 1, 2, backend=backend)]
+
+
+def _plain(backend, attr='size'):
+    return [getattr(image, attr) for _, _, image in create_일진표_year(2024, 1, 2, backend=backend)]
+
+
+def test_일진표_year_스레드와_직렬_크기_같음():
+    serial = _sizes('serial')
+    assert _sizes('thread') == serial
+    assert serial != _plain('serial')
+
+
+def test_일진표_year_프로세스도_호출마다_설정을_받음():
+    # 설정을 바꾼 뒤 두 번째 호출도 확인 (공유 풀 워커에 이전 설정이 남지 않아야 함)
+    assert _sizes('process') == _sizes('serial')
+    assert _plain('process') == _plain('serial')
+    with canvas_mode('RGB'):
+        assert _plain('process', 'mode') == ['RGB', 'RGB']
+    assert _plain('process', 'mode') == _plain('serial', 'mode')
+
+
+def _chart_size(backend):
+    job = {'사주_data': calc_사주(1990, 5, 15, 12, 0), '기본정보': {'이름': '홍길동'}, 'charts': ['12운성표']}
+    result = generate_images_batch([job], backend=backend, max_workers=2)[0]['12운성표']
+    return Image.open(io.BytesIO(result)).size
+
+
+def test_공유_프로세스_풀은_호출마다_설정을_받음():
+    # 풀이 render_scale(0.5) 안에서 만들어져도 다음 호출은 그때의 설정으로 렌더링
+    with render_scale(0.5):
+        half = _chart_size('process')
+    full = _chart_size('process')
+    assert full == _chart_size('serial')
+    assert half != full
+    with render_scale(0.5):
+        assert _chart_size('process') == half
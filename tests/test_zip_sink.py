@@ -0,0 +1,25 @@
+# ZIP 쓰기: 같은 (ZIP 경로, 내용)은 한 번만 기록
+import io
+import zipfile
+
+from zip_sink import ShardedZipSink, ZipSink
+
+
+def test_같은_경로와_내용은_한_번만():
+    with ZipSink() as sink:
+        sink.write('홍_1990-05-15/01_원국표.png', b'a')
+        sink.write('홍_1990-05-15/01_원국표.png', b'a')
+        sink.write('홍_1990-05-15/02_대운표.png', b'a')
+    names = zipfile.ZipFile(io.BytesIO(sink.getvalue())).namelist()
+    assert names == ['홍_1990-05-15/01_원국표.png', '홍_1990-05-15/02_대운표.png']
+    assert sink.entries == 2
+
+
+def test_샤드도_바이트_항목_중복_없음(tmp_path):
+    shards = ShardedZipSink(str(tmp_path))
+    files = [('홍_1990-05-15/01_원국표.png', b'a')]
+    shards.add(files)
+    shards.add(files)
+    shard = shards.close()
+    assert zipfile.ZipFile(shard.path).namelist() == ['홍_1990-05-15/01_원국표.png']
+    assert shard.people == 2 and shard.entries == 1
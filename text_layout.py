@@ -0,0 +1,96 @@
+# 텍스트 측정/줄바꿈 캐시 (모든 차트 공용)
+#
+# 같은 문자열을 같은 폰트로 다시 측정하지 않도록 결과를 LRU로 캐싱
+#   text_bbox(text, font, anchor)       원점 기준 영역
+#   text_width(text, font)              진행 폭 (advance width)
+#   wrap_text(text, font, max_width)    최대 폭 안에 들어가는 줄 목록
+#   fit_text(text, font, max_width)     한 줄로 자르기 (넘치면 말줄임)
+# 폰트 객체는 FontManager가 재사용하므로 폰트 자체를 캐시 키로 사용
+from functools import lru_cache
+
+from PIL import Image, ImageDraw
+
+TEXT_CACHE_SIZE = 8192
+
+_MEASURE_DRAW = ImageDraw.Draw(Image.new('RGBA', (1, 1)))
+
+
+@lru_cache(maxsize=TEXT_CACHE_SIZE)
+def text_bbox(text, font, anchor=None, spacing=4, align='left'):
+    """원점 기준 텍스트 영역 (x0, y0, x1, y1)"""
+    return _MEASURE_DRAW.textbbox((0, 0), text, font=font, anchor=anchor,
+                                  spacing=spacing, align=align)
+
+
+@lru_cache(maxsize=TEXT_CACHE_SIZE)
+def text_width(text, font):
+    """텍스트 진행 폭 (다음 글자가 시작되는 위치)"""
+    return font.getlength(text)
+
+
+def _split_to_width(word, font, max_width):
+    """공백 없는 긴 단어를 글자 단위로 나눔"""
+    pieces = []
+    current = ''
+    for char in word:
+        if current and text_width(current + char, font) > max_width:
+            pieces.append(current)
+            current = char
+        else:
+            current += char
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def _ellipsize(line, font, max_width, ellipsis):
+    """줄 끝에 말줄임표를 붙여 최대 폭 안에 맞춤"""
+    while line and text_width(line + ellipsis, font) > max_width:
+        line = line[:-1]
+    return line.rstrip() + ellipsis
+
+
+@lru_cache(maxsize=TEXT_CACHE_SIZE)
+def wrap_text(text, font, max_width, max_lines=None, ellipsis='..'):
+    """
+    최대 폭 안에 들어가도록 줄바꿈 -> 줄 튜플
+
+    공백 단위로 나누고, 한 단어가 한 줄보다 길면 글자 단위로 나눔
+    max_lines를 넘으면 마지막 줄 끝을 말줄임표로 자름
+    """
+    lines = []
+    for paragraph in str(text).split('\n'):
+        current = ''
+        for word in paragraph.split(' '):
+            candidate = f"{current} {word}" if current else word
+            if text_width(candidate, font) <= max_width:
+                current = candidate
+                continue
+            if current:
+                lines.append(current)
+            pieces = _split_to_width(word, font, max_width) or ['']
+            lines.extend(pieces[:-1])
+            current = pieces[-1]
+        lines.append(current)
+
+    if max_lines is not None and len(lines) > max_lines:
+        lines = lines[:max_lines]
+        lines[-1] = _ellipsize(lines[-1], font, max_width, ellipsis)
+    return tuple(lines)
+
+
+def fit_text(text, font, max_width, ellipsis='..'):
+    """한 줄로 맞춤 (넘치면 말줄임표)"""
+    if text_width(text, font) <= max_width:
+        return text
+    return _ellipsize(text, font, max_width, ellipsis)
+
+
+def get_text_layout_stats():
+    """함수별 캐시 적중/미스/크기"""
+    return {func.__name__: func.cache_info()._asdict() for func in (text_bbox, text_width, wrap_text)}
+
+
+def clear_text_layout_cache():
+    for func in (text_bbox, text_width, wrap_text):
+        func.cache_clear()
@@ -0,0 +1,233 @@
+# ZIP 스트리밍 쓰기 (메모리 바이트 -> ZIP 항목, 일정 크기 넘으면 디스크로)
+#
+# PNG/WebP/JPEG는 이미 압축된 형식이라 다시 deflate해도 거의 줄지 않고 CPU만 씀
+#   -> 이미지 항목은 ZIP_STORED(무압축), 텍스트 등 나머지만 ZIP_DEFLATED
+# 아카이브는 SpooledTemporaryFile에 씀
+#   -> spool_limit까지는 메모리, 넘으면 임시 파일로 옮겨서 메모리 사용량 일정
+# 예)
+#   with ZipSink() as sink:
+#       sink.write('홍길동/01_원국표.png', png_bytes)
+#   st.download_button(..., data=sink.getvalue())   # 큰 결과는 ShardedZipSink 파일로
+# 같은 ZIP 경로에 같은 내용은 한 번만 기록 (같은 입력이 반복된 행 -> 중복 항목 이름 없음)
+# 결과가 아주 크면 ShardedZipSink로 인원/크기 제한마다 ZIP을 나눠서 다 찬 것부터 내보냄
+import hashlib
+import os
+import tempfile
+import time
+import zipfile
+from collections import namedtuple
+
+# 무압축으로 저장할 확장자 (이미 압축된 형식)
+STORED_EXTENSIONS = frozenset({'png', 'webp', 'jpg', 'jpeg', 'gif', 'zip'})
+
+DEFAULT_SPOOL_LIMIT = 64 * 1024 * 1024
+
+# ZIP 항목 하나의 헤더 크기 (로컬 헤더 30 + 중앙 디렉터리 46 + ZIP64 여유, 경로 길이 별도)
+_ENTRY_OVERHEAD = 30 + 46 + 40
+
+# 완성된 샤드 ZIP 하나
+#   index: 1부터 시작하는 순번
+#   path: ZIP 파일 경로
+#   people: 담긴 인원, entries: 항목 수, size: 파일 크기 (바이트)
+ZipShard = namedtuple('ZipShard', ['index', 'path', 'people', 'entries', 'size'])
+
+
+def compress_type_for(arcname):
+    """ZIP 안 경로 -> 압축 방식 (이미지는 ZIP_STORED)"""
+    extension = arcname.rpartition('.')[2].lower()
+    return zipfile.ZIP_STORED if extension in STORED_EXTENSIONS else zipfile.ZIP_DEFLATED
+
+
+class ZipSink:
+    """
+    바이트를 바로 ZIP 항목으로 쓰는 아카이브 (임시 파일 없이)
+    같은 (ZIP 경로, 내용)은 한 번만 기록 (바이트는 sha256, 디스크 파일은 경로로 비교)
+
+    Args:
+        spool_limit: 이 크기(바이트)를 넘으면 메모리 대신 임시 파일에 씀
+        dir: 임시 파일 디렉터리 (None이면 시스템 기본)
+        fileobj: 임시 파일 대신 바로 쓸 파일 객체 (출력 파일, stdout 등 seek 불가도 가능)
+    """
+
+    def __init__(self, spool_limit=DEFAULT_SPOOL_LIMIT, dir=None, fileobj=None):
+        self._owns_file = fileobj is None
+        if fileobj is None:
+            fileobj = tempfile.SpooledTemporaryFile(max_size=spool_limit, dir=dir)
+        self._file = fileobj
+        self._zip = zipfile.ZipFile(self._file, 'w', allowZip64=True)
+        self.entries = 0
+        self._written = set()  # (ZIP 경로, sha256 또는 디스크 파일 경로)
+
+    def _first(self, key):
+        """처음 기록하는 항목인지 (이미 기록했으면 False)"""
+        if key in self._written:
+            return False
+        self._written.add(key)
+        return True
+
+    def write(self, arcname, data):
+        """메모리 바이트(또는 문자열)를 항목 하나로 기록"""
+        digest = hashlib.sha256(data.encode('utf-8') if isinstance(data, str) else data).hexdigest()
+        if not self._first((arcname, digest)):
+            return
+        info = zipfile.ZipInfo(arcname, time.localtime()[:6])
+        info.compress_type = compress_type_for(arcname)
+        info.external_attr = 0o644 << 16
+        self._zip.writestr(info, data)
+        self.entries += 1
+
+    def write_file(self, path, arcname=None):
+        """디스크 파일을 항목 하나로 기록"""
+        arcname = arcname or os.path.basename(path)
+        if not self._first((arcname, os.path.abspath(path))):
+            return
+        self._zip.write(path, arcname, compress_type=compress_type_for(arcname))
+        self.entries += 1
+
+    def close(self):
+        """중앙 디렉터리를 기록하고 쓰기 종료 (이후 open()으로 읽기)"""
+        if self._zip is not None:
+            self._zip.close()
+            self._zip = None
+        return self
+
+    @property
+    def size(self):
+        """현재까지 기록된 아카이브 크기 (바이트)"""
+        position = self._file.tell()
+        self._file.seek(0, os.SEEK_END)
+        size = self._file.tell()
+        self._file.seek(position)
+        return size
+
+    @property
+    def on_disk(self):
+        """메모리를 넘어 임시 파일로 옮겨졌는지 (fileobj에 쓰는 경우 True)"""
+        return getattr(self._file, '_rolled', True)
+
+    def open(self):
+        """
+        완성된 아카이브를 처음부터 읽는 파일 객체 (아카이브를 bytes로 복사하지 않음)
+        st.download_button은 SpooledTemporaryFile을 받지 않으므로 작은 아카이브는 getvalue() 사용
+        """
+        self.close()
+        self._file.seek(0)
+        return self._file
+
+    def getvalue(self):
+        """아카이브 전체를 바이트로 (작은 아카이브용)"""
+        return self.open().read()
+
+    def discard(self):
+        """아카이브 삭제 (임시 파일 정리, fileobj는 닫지 않음)"""
+        self.close()
+        if self._owns_file:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+
+class ShardedZipSink:
+    """
+    인원 수/크기 제한으로 여러 ZIP에 나눠 쓰는 아카이브 (한 명의 파일은 항상 같은 ZIP에)
+    샤드가 다 차는 즉시 닫아서 ZipShard로 돌려줌 -> 전체가 끝나기 전에 앞 샤드부터 내려받기 가능
+    예) shards = ShardedZipSink(out_dir, max_people=500)
+        for files in ...:
+            for shard in shards.add(files):
+                offer(shard.path)
+        last = shards.close()   # 마지막 샤드 (남은 사람이 없으면 None)
+
+    Args:
+        directory: 샤드 파일을 만들 디렉터리 (없으면 생성)
+        max_people: 샤드당 최대 인원 (None이면 제한 없음)
+        max_bytes: 샤드당 최대 크기 (넘기 전에 새 샤드, 한 명이 이보다 크면 그 한 명만 담음)
+        name: 샤드 파일 이름 형식 (index는 1부터)
+    """
+
+    def __init__(self, directory, max_people=None, max_bytes=None, name='part{index:03d}.zip'):
+        self.directory = directory
+        self.max_people = max_people
+        self.max_bytes = max_bytes
+        self.name = name
+        self.shards = []  # 완성된 ZipShard
+        self._file = None
+        self._sink = None
+        self._path = None
+        self._people = 0
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def _entry_size(arcname, data):
+        """항목 하나가 ZIP에서 차지하는 대략의 크기 (무압축 기준, 헤더 포함)"""
+        size = len(data) if isinstance(data, bytes) else os.path.getsize(data)
+        return size + len(arcname.encode('utf-8')) * 2 + _ENTRY_OVERHEAD
+
+    def _open_shard(self):
+        self._path = os.path.join(self.directory, self.name.format(index=len(self.shards) + 1))
+        self._file = open(self._path, 'wb')
+        self._sink = ZipSink(fileobj=self._file)
+        self._people = 0
+
+    def _finish_shard(self):
+        """현재 샤드를 닫고 ZipShard로 기록"""
+        self._sink.close()
+        self._file.close()
+        shard = ZipShard(len(self.shards) + 1, self._path, self._people, self._sink.entries,
+                         os.path.getsize(self._path))
+        self.shards.append(shard)
+        self._sink = self._file = None
+        return shard
+
+    def add(self, files):
+        """
+        한 명의 파일 목록 기록 -> 이번 호출로 완성된 ZipShard 목록 (대부분 빈 목록)
+
+        Args:
+            files: [(ZIP 안 경로, 바이트 또는 디스크 파일 경로)]
+                같은 샤드 안에서 같은 (ZIP 경로, 내용)은 한 번만 기록 (ZipSink)
+        """
+        completed = []
+        if self._sink is not None and self.max_bytes:
+            # 이 사람까지 넣으면 제한을 넘는 경우 먼저 현재 샤드를 닫음
+            # (현재 크기 + 아직 쓰지 않은 중앙 디렉터리 + 이 사람의 파일)
+            size = sum(self._entry_size(arcname, data) for arcname, data in files)
+            if self._sink.size + self._sink.entries * _ENTRY_OVERHEAD + size > self.max_bytes:
+                completed.append(self._finish_shard())
+        if self._sink is None:
+            self._open_shard()
+
+        for arcname, data in files:
+            if isinstance(data, bytes):
+                self._sink.write(arcname, data)
+            else:
+                self._sink.write_file(data, arcname)
+        self._people += 1
+
+        if self.max_people and self._people >= self.max_people:
+            completed.append(self._finish_shard())
+        return completed
+
+    def close(self):
+        """마지막 샤드를 닫음 -> 완성된 ZipShard 또는 None (남은 사람이 없으면)"""
+        if self._sink is None:
+            return None
+        return self._finish_shard()
+
+    def discard(self, remove=True):
+        """
+        쓰다 만 샤드 삭제 (완성된 샤드는 그대로)
+        remove=False: 파일은 지우지 않고 닫기만 (다른 프로세스가 디렉터리를 넘겨받은 경우)
+        """
+        if self._sink is not None:
+            self._sink.discard()
+            self._file.close()
+            if remove:
+                os.remove(self._path)
+            self._sink = self._file = None